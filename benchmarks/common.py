@@ -0,0 +1,40 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Command line handling shared by the benchmarks."""
+
+import os
+
+ALL_BENCHMARKS = (
+    '64KB-min.json',
+    'bitly-usa-gov.json',
+    'twitter.json',
+)
+
+DEFAULT_ITERATIONS = 3
+
+THIS_DIR = os.path.abspath(os.path.dirname(__file__))
+
+
+def parse_args(parser):
+    """Adds the arguments that all of the benchmarks take to `parser`,
+    and returns the parsed command line."""
+    parser.add_argument(
+        '-n', '--num-iterations', default=DEFAULT_ITERATIONS, type=int
+    )
+    parser.add_argument('benchmarks', nargs='*')
+    args = parser.parse_args()
+    if not args.benchmarks:
+        args.benchmarks = [os.path.join(THIS_DIR, d) for d in ALL_BENCHMARKS]
+    return args
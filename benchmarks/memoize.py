@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares the reference parser with and without memoization.
+
+Besides the files given on the command line (or the standard data
+sets), this times two generated documents consisting of nothing but
+numbers: long integers and decimals without exponents, which
+`dec_literal` only matches after backtracking and so are where
+memoization helps the most, and numbers with exponents, which it
+matches with its first alternative and so only pay for the cache.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+from common import parse_args
+
+from json5.specialized_parser import reference_parser
+
+
+def numbers_doc(exponents, n=5000, seed=0):
+    rng = random.Random(seed)
+    nums = []
+    for i in range(n):
+        num = str(rng.randrange(10**15))
+        if exponents:
+            num += f'.{rng.randrange(10**15)}e-{rng.randrange(300)}'
+        elif i % 2:
+            num += f'.{rng.randrange(10**15)}'
+        nums.append(num)
+    return '[' + ', '.join(nums) + ']'
+
+
+def best_time(s, memoize, iterations):
+    best = None
+    for _ in range(iterations):
+        start = time.time()
+        _, err, _ = reference_parser(
+            s, '<string>', strict=True, lean=True, memoize=memoize
+        ).parse()
+        t = time.time() - start
+        assert err is None, err
+        best = t if best is None else min(best, t)
+    return best
+
+
+def main():
+    args = parse_args(argparse.ArgumentParser())
+
+    docs = [
+        ('<long numbers>', numbers_doc(exponents=False)),
+        ('<exponents>', numbers_doc(exponents=True)),
+    ]
+    for f in args.benchmarks:
+        with open(f, encoding='utf-8') as fp:
+            docs.append((os.path.basename(f), fp.read()))
+
+    for fname, s in docs:
+        plain = best_time(s, False, args.num_iterations)
+        memo = best_time(s, True, args.num_iterations)
+        print(
+            f'{fname:20s}: {plain:.6f} without memoization, '
+            f'{memo:.6f} with ({plain / memo:4.2f}x)'
+        )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
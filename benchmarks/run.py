@@ -19,29 +19,21 @@ import os
 import sys
 import time
 
-import json5
-
-ALL_BENCHMARKS = (
-    '64KB-min.json',
-    'bitly-usa-gov.json',
-    'twitter.json',
-)
+from common import parse_args
 
-DEFAULT_ITERATIONS = 3
-
-THIS_DIR = os.path.abspath(os.path.dirname(__file__))
+import json5
 
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--pure', action='store_true')
     parser.add_argument(
-        '-n', '--num-iterations', default=DEFAULT_ITERATIONS, type=int
+        '--engine',
+        default='auto',
+        choices=['auto', 'fast', 'scanner', 'transcode', 'reference'],
+        help='which JSON5 parser implementation to use',
     )
-    parser.add_argument('benchmarks', nargs='*')
-    args = parser.parse_args()
-    if not args.benchmarks:
-        args.benchmarks = [os.path.join(THIS_DIR, d) for d in ALL_BENCHMARKS]
+    args = parse_args(parser)
 
     file_contents = []
     for f in args.benchmarks:
@@ -68,7 +60,7 @@ def main():
             start = time.time()
             json_obj = json.loads(c, cls=maker)
             mid = time.time()
-            json5_obj = json5.loads(c)
+            json5_obj = json5.loads(c, engine=args.engine)
             end = time.time()
 
             json_time += mid - start
@@ -82,27 +74,27 @@ def main():
             if json5_time > json_time:
                 avg = json5_time / json_time
                 print(
-                    f'{fname:-%20s}: JSON was {avg:5.1f}x faster '
-                    f'({json_time:.6f} to {json5_time:.6fs}'
+                    f'{fname:20s}: JSON was {avg:5.1f}x faster '
+                    f'({json_time:.6f} to {json5_time:.6f})'
                 )
             else:
                 avg = json_time / json5_time
                 print(
-                    f'{fname:-%20s}: JSON5 was {avg:5.1f}x faster '
-                    f'({json5_time:.6f} to {json_time:.6fs}'
+                    f'{fname:20s}: JSON5 was {avg:5.1f}x faster '
+                    f'({json5_time:.6f} to {json_time:.6f})'
                 )
         elif json5_time:
             print(
-                f'{fname:-20s}: JSON5 took {json5_time:.6f} secs, '
+                f'{fname:20s}: JSON5 took {json5_time:.6f} secs, '
                 f'JSON was too fast to measure'
             )
         elif json_time:
             print(
-                f'{fname:-20s}: JSON took {json_time:.6f} secs, '
+                f'{fname:20s}: JSON took {json_time:.6f} secs, '
                 f'JSON5 was too fast to measure'
             )
         else:
-            print(f'{fname:-20s}: both were too fast to measure')
+            print(f'{fname:20s}: both were too fast to measure')
 
     return 0
 
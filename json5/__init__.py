@@ -14,15 +14,33 @@
 
 """A pure Python implementation of the JSON5 configuration language."""
 
-from .lib import load, loads, dump, dumps
+from .decoder import JSON5Decoder
+from .file_index import FileIndex
+from .lib import (
+    get_path,
+    load,
+    loads,
+    dump,
+    dumps,
+    to_json,
+)
+from .streaming import FeedParser, iter_load, iter_loads, iterparse
 from .version import __version__, VERSION
 
 
 __all__ = [
     '__version__',
     'VERSION',
+    'FeedParser',
+    'FileIndex',
+    'JSON5Decoder',
     'dump',
     'dumps',
+    'get_path',
+    'iter_load',
+    'iter_loads',
+    'iterparse',
     'load',
     'loads',
+    'to_json',
 ]
@@ -0,0 +1,526 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""`JSON5Decoder`, which does the work for `loads()` and the other
+functions that decode documents, and picks the engine that does the
+parsing.
+
+The `_get_path()`, `_select()` and `_lazy()` functions decode parts of a
+document with the options of a decoder, for `get_path()`, `FileIndex`
+and `loads()`.
+"""
+
+import json
+import re
+import threading
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from .fast_parser import FastParser, _too_deep, _unexpected
+from .lazy import LazyParser
+from .paths import MISSING, Selector
+from .scanner import DepthError, ScanError, make_scanner, skip_whitespace
+from .specialized_parser import reference_parser
+from .structural import StructuralIndex
+from .transcoder import transcode
+
+
+class JSON5Decoder:
+    """A reusable JSON5 decoder, like ``json.JSONDecoder``.
+
+    Takes the same keyword arguments as ``loads()`` other than `encoding`
+    and `cls`, and works out how to apply them once, when the decoder is
+    created, instead of on every call. It also keeps a parser around to
+    reuse for the next document, so decoding many small documents with
+    one decoder is cheaper than calling ``loads()`` for each of them.
+
+    A decoder may only be used by one thread at a time.
+    """
+
+    def __init__(
+        self,
+        *,
+        object_hook: Optional[Callable[[Mapping[str, Any]], Any]] = None,
+        parse_float: Optional[Callable[[str], Any]] = None,
+        parse_int: Optional[Callable[[str], Any]] = None,
+        parse_constant: Optional[Callable[[str], Any]] = None,
+        strict: bool = True,
+        object_pairs_hook: Optional[
+            Callable[[Iterable[Tuple[str, Any]]], Any]
+        ] = None,
+        allow_duplicate_keys: bool = True,
+        engine: str = 'auto',
+        max_depth: Optional[int] = None,
+    ):
+        if engine not in _ENGINES:
+            raise ValueError(f'Unknown engine "{engine}"')
+        if engine == 'reference' and max_depth is not None:
+            raise ValueError(
+                'max_depth is not supported by the reference engine'
+            )
+
+        if object_pairs_hook:
+            dictify = object_pairs_hook
+        elif object_hook:
+
+            def dictify(pairs):
+                return object_hook(dict(pairs))
+        else:
+            dictify = dict
+
+        if not allow_duplicate_keys:
+            _orig_dictify = dictify
+
+            def dictify(pairs):  # pylint: disable=function-redefined
+                return _reject_duplicate_keys(pairs, _orig_dictify)
+
+        self.strict = strict
+        self.engine = engine
+        self.max_depth = max_depth
+        self.allow_duplicate_keys = allow_duplicate_keys
+        self.dictify = dictify
+        self.parse_float = parse_float or float
+        self.parse_int = parse_int or int
+        self.parse_constant = parse_constant or _fp_constant_parser
+
+        # If any of the hooks are given, the document isn't decoded
+        # with the `json` module first whenever it may be plain JSON,
+        # since the hooks would be called again for the values that had
+        # already been decoded when that failed.
+        self._has_hooks = any(
+            hook is not None
+            for hook in (
+                object_hook,
+                parse_float,
+                parse_int,
+                parse_constant,
+                object_pairs_hook,
+            )
+        )
+        self._json_decoder = None
+        if max_depth is None and (
+            engine == 'transcode' or (engine == 'auto' and not self._has_hooks)
+        ):
+            self._json_decoder = json.JSONDecoder(
+                object_pairs_hook=None if dictify is dict else dictify,
+                parse_float=_json_parse_float(self.parse_float),
+                parse_int=self.parse_int,
+                parse_constant=self.parse_constant,
+                # The transcoder escapes control characters in the strings
+                # it rewrites, and leaves the other strings alone.
+                strict=strict if engine == 'auto' else True,
+            )
+        self._rewrite_numbers = (
+            self.parse_float is float and self.parse_int is int
+        )
+
+        # The parser and scanner are created when they are first needed,
+        # and taken out of the decoder while they are in use, in case one
+        # of the hooks uses the decoder to decode another document.
+        self._parser = None
+        self._scan_once = None
+
+    def decode(self, s: str) -> Any:
+        """Deserialize ``s`` (a string containing a JSON5 document) to a
+        Python object."""
+        if not s:
+            raise ValueError('Empty strings are not legal JSON5')
+
+        engine = self.engine
+        if engine == 'auto':
+            if self._json_decoder is not None and _may_be_json(s):
+                try:
+                    return self._json_decoder.decode(s)
+                except (ValueError, RecursionError):
+                    pass
+            engine = 'fast'
+
+        if engine == 'transcode':
+            if self._json_decoder is not None:
+                try:
+                    text = transcode(s, self.strict, self._rewrite_numbers)
+                except ValueError:
+                    text = None
+                if text is not None:
+                    try:
+                        return self._json_decoder.decode(text)
+                    except RecursionError:
+                        pass
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        if self._has_hooks:
+                            self._check_syntax(s, e)
+            engine = 'fast'
+
+        if engine == 'scanner':
+            obj, err, _ = self._scan(s)
+        elif engine == 'fast':
+            obj, err, _ = self._fast_parse(s)
+        else:
+            obj, err, _ = self._reference_parse(s)
+        if err:
+            raise ValueError(err)
+        return obj
+
+    def _check_syntax(self, s, e):
+        # The `json` module failed to decode the transcoded document
+        # after calling the hooks for some of its values. Rather than
+        # calling them again, report a syntax error without them, or
+        # re-raise the error that one of the hooks raised. Only if the
+        # document is valid but couldn't be decoded as JSON text (which
+        # shouldn't happen) is it parsed again with the hooks.
+        # The number hooks are replaced too, since `float()` rejects
+        # literals like '1e+' that the grammar allows.
+        _, err, _ = FastParser(
+            s,
+            '<string>',
+            strict=self.strict,
+            parse_float=_ignore_number,
+            parse_int=_ignore_number,
+            parse_constant=_ignore_number,
+        ).parse()
+        if err:
+            raise ValueError(err) from None
+        if not isinstance(e, json.JSONDecodeError):
+            raise e
+
+    def raw_decode(self, s: str, idx: int = 0) -> Tuple[Any, int]:
+        """Decode a JSON5 value from ``s`` starting at index ``idx``, like
+        ``json.JSONDecoder.raw_decode()``.
+
+        Returns a tuple of the value and the index in ``s`` of the first
+        character after it. The value must start exactly at ``idx``, and
+        may be followed by anything; ``s`` is never copied, so this can be
+        used to pick values out of a larger string. Errors are reported
+        relative to the start of ``s``.
+        """
+        if not 0 <= idx <= len(s):
+            raise ValueError(f'idx {idx} is out of range')
+        obj, err, end = self._parse_value(s, idx)
+        if err:
+            raise ValueError(err)
+        return obj, end
+
+    def _parse_value(self, s, idx, try_json=True):
+        # Returns the same tuple as the parsers do: the value, the error
+        # message and the position of the error or of the end of the
+        # value.
+        engine = self.engine
+        if engine == 'auto':
+            if try_json:
+                result = self._json_raw_decode(s, idx)
+                if result is not None:
+                    return result
+        elif engine == 'scanner':
+            return self._scan(s, idx)
+        elif engine == 'reference':
+            return self._reference_parse(s, idx)
+
+        # The transcoder only works on whole documents.
+        return self._fast_parse(s, idx)
+
+    def _json_raw_decode(self, s, idx):
+        # The `json` module reads numbers and literals differently from
+        # JSON5 when they are followed by other text ('1.', '1a'), but
+        # objects, arrays and strings end at the same place. Note that
+        # when it fails, it counts the lines in `s` up to the error.
+        if self._json_decoder is not None and s[idx : idx + 1] in (
+            '{',
+            '[',
+            '"',
+        ):
+            try:
+                obj, end = self._json_decoder.raw_decode(s, idx)
+                if _may_be_json(s, idx, end):
+                    return obj, None, end
+            except (ValueError, RecursionError):
+                pass
+        return None
+
+    # Each of the following parses the whole document if `idx` is None,
+    # or a single value starting at `idx` otherwise, and returns the same
+    # tuple as `_parse_value()`.
+
+    def _fast_parse(self, s, idx=None):
+        parser = self._parser
+        if parser is None:
+            parser = FastParser(
+                s,
+                '<string>',
+                strict=self.strict,
+                dictify=self.dictify,
+                parse_float=self.parse_float,
+                parse_int=self.parse_int,
+                parse_constant=self.parse_constant,
+                max_depth=self.max_depth,
+            )
+        else:
+            self._parser = None
+            parser.reset(s)
+        try:
+            if idx is None:
+                return parser.parse()
+            return parser.parse_value(idx)
+        finally:
+            # Don't hold on to the document.
+            parser.reset('')
+            self._parser = parser
+
+    def _scan(self, s, idx=None):
+        scan_once = self._scan_once
+        if scan_once is None:
+            scan_once = make_scanner(
+                dictify=self.dictify,
+                parse_float=self.parse_float,
+                parse_int=self.parse_int,
+                parse_constant=self.parse_constant,
+                strict=self.strict,
+                max_depth=self.max_depth,
+            )
+        self._scan_once = None
+        error = None
+        try:
+            if idx is not None:
+                obj, end = scan_once(s, idx)
+                return obj, None, end
+            obj, end = scan_once(s, skip_whitespace(s, 0))
+            pos = skip_whitespace(s, end)
+            if pos == len(s):
+                return obj, None, end
+        except RecursionError:
+            # The scanner recurses for nested objects and arrays, so let
+            # the non-recursive fast parser handle documents that are too
+            # deeply nested for it.
+            return self._fast_parse(s, idx)
+        except DepthError as e:
+            return None, _too_deep(s, '<string>', e.pos, self.max_depth), e.pos
+        except ScanError as e:
+            pos = e.pos
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # One of the hooks rejected a value.
+            error = e
+        finally:
+            self._scan_once = scan_once
+
+        # Let the reference parser produce the error message, as the fast
+        # parser does, rather than calling the hooks again. A syntax error
+        # anywhere in the document is reported ahead of an error from one
+        # of the hooks.
+        parser = reference_parser(s, '<string>', self.strict, lean=True)
+        try:
+            if idx is None:
+                _, err, errpos = parser.parse()
+            else:
+                _, err, errpos = parser.parse_value(idx)
+        except RecursionError:
+            err = None
+        if err:
+            return None, err, errpos
+        if error is not None:
+            raise error
+        return None, _unexpected(s, '<string>', pos), pos
+
+    def _reference_parse(self, s, idx=None):
+        parser = reference_parser(s, '<string>', self.strict, lean=True)
+        if idx is None:
+            ast, err, pos = parser.parse()
+        else:
+            ast, err, pos = parser.parse_value(idx)
+        if err:
+            return None, err, pos
+        return (
+            _walk_ast(
+                ast,
+                self.dictify,
+                self.parse_float,
+                self.parse_int,
+                self.parse_constant,
+            ),
+            None,
+            pos,
+        )
+
+
+_ENGINES = ('auto', 'fast', 'scanner', 'transcode', 'reference')
+
+# The decoders used by `loads()` when no hooks or `max_depth` are given,
+# keyed by the remaining options. Decoders can't be shared between threads, so each
+# thread has its own.
+_default_decoders = threading.local()
+
+
+def _default_decoder(strict, allow_duplicate_keys, engine):
+    decoders = getattr(_default_decoders, 'decoders', None)
+    if decoders is None:
+        decoders = _default_decoders.decoders = {}
+    key = (strict, allow_duplicate_keys, engine)
+    decoder = decoders.get(key)
+    if decoder is None:
+        decoder = JSON5Decoder(
+            strict=strict,
+            allow_duplicate_keys=allow_duplicate_keys,
+            engine=engine,
+        )
+        decoders[key] = decoder
+    return decoder
+
+
+def _ignore_number(s, base=10):
+    del s, base
+
+
+def _fp_constant_parser(s):
+    return float(s.replace('Infinity', 'inf').replace('NaN', 'nan'))
+
+
+def _get_path(decoder, s, path):
+    if not s:
+        raise ValueError('Empty strings are not legal JSON5')
+    v, err, _ = _selector(decoder, s).get(path)
+    if err:
+        raise ValueError(err)
+    if v is MISSING:
+        raise KeyError(path)
+    return v
+
+
+def _selector(decoder, s):
+    return Selector(
+        s,
+        '<string>',
+        strict=decoder.strict,
+        dictify=decoder.dictify,
+        parse_float=decoder.parse_float,
+        parse_int=decoder.parse_int,
+        parse_constant=decoder.parse_constant,
+        max_depth=decoder.max_depth,
+        reject_duplicates=not decoder.allow_duplicate_keys,
+    )
+
+
+def _lazy(decoder, s):
+    if not s:
+        raise ValueError('Empty strings are not legal JSON5')
+    return LazyParser(
+        s,
+        '<string>',
+        strict=decoder.strict,
+        parse_float=decoder.parse_float,
+        parse_int=decoder.parse_int,
+        parse_constant=decoder.parse_constant,
+        max_depth=decoder.max_depth,
+        reject_duplicates=not decoder.allow_duplicate_keys,
+        structure=StructuralIndex(s),
+    ).load_document()
+
+
+def _select(decoder, s, select):
+    if isinstance(select, str):
+        raise TypeError('select must be a list of paths, not a string')
+    if not s:
+        raise ValueError('Empty strings are not legal JSON5')
+    paths = list(select)
+    values, err, _ = _selector(decoder, s).select(paths)
+    if err:
+        raise ValueError(err)
+    found = dict(values)
+    return {path: found[path] for path in paths if path in found}
+
+
+# A \u escape for a high surrogate followed by one for a low surrogate;
+# the `json` module combines these into a single character, but JSON5
+# doesn't.
+_SURROGATE_PAIR_ESCAPE_RE = re.compile(
+    r'\\u[dD][89abAB][0-9a-fA-F]{2}\\u[dD][c-fC-F]'
+)
+
+
+def _may_be_json(s, start=0, end=None):
+    # The `json` module decodes any document that is also valid JSON to
+    # the same values as JSON5 does, except that it allows raw U+2028 and
+    # U+2029 characters in strings, and it combines surrogate pairs. (Its
+    # `strict` flag rejects raw control characters in strings, which is
+    # stricter than JSON5; when it is false, they agree.)
+    if end is None:
+        end = len(s)
+    return (
+        s.find('\u2028', start, end) == -1
+        and s.find('\u2029', start, end) == -1
+        and not _SURROGATE_PAIR_ESCAPE_RE.search(s, start, end)
+    )
+
+
+def _json_parse_float(parse_float):
+    if parse_float is float:
+        return float
+
+    def _parse_float(v):
+        # JSON5 always uses a lowercase exponent marker.
+        return parse_float(v.replace('E', 'e'))
+
+    return _parse_float
+
+
+def _reject_duplicate_keys(pairs, dictify):
+    keys = set()
+    for key, _ in pairs:
+        if key in keys:
+            raise ValueError(f'Duplicate key "{key}" found in object')
+        keys.add(key)
+    return dictify(pairs)
+
+
+def _walk_ast(
+    el,
+    dictify: Callable[[Iterable[Tuple[str, Any]]], Any],
+    parse_float,
+    parse_int,
+    parse_constant,
+):
+    if el == 'None':
+        return None
+    if el == 'True':
+        return True
+    if el == 'False':
+        return False
+    ty, v = el
+    if ty == 'number':
+        if v.lstrip('-').startswith('0x'):
+            return parse_int(v, base=16)
+        if '.' in v or 'e' in v or 'E' in v:
+            return parse_float(v)
+        if 'Infinity' in v or 'NaN' in v:
+            return parse_constant(v)
+        return parse_int(v)
+    if ty == 'string':
+        return v
+    if ty == 'object':
+        pairs = []
+        for key, val_expr in v:
+            val = _walk_ast(
+                val_expr, dictify, parse_float, parse_int, parse_constant
+            )
+            pairs.append((key, val))
+        return dictify(pairs)
+    if ty == 'array':
+        return [
+            _walk_ast(el, dictify, parse_float, parse_int, parse_constant)
+            for el in v
+        ]
+    raise ValueError('unknown el: ' + el)  # pragma: no cover
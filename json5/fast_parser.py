@@ -0,0 +1,422 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A hand-written, predictive parser for JSON5.
+
+This implements exactly the same grammar as `json5.g` as the glop-generated
+`Parser` in `parser.py`, but it looks ahead one character at a time to
+decide which rule to apply instead of trying each alternative in turn, and
+so it never needs to backtrack. Objects and arrays are kept on an explicit
+stack instead of being parsed recursively, so arbitrarily deeply nested
+documents can be parsed in a bounded amount of Python stack.
+
+Rather than producing an AST that has to be walked a second time, Python
+objects are built as soon as each value is recognized, and the hooks
+passed to `loads()` are applied at that point. Which kind of number a
+literal is (hex, float, int, or a named constant) is decided by the rule
+that matched it.
+
+It does not keep track of the furthest point reached by a failed
+alternative the way the generated parser does. Instead, if a parse fails,
+the input is handed to the generated parser, which remains the reference
+implementation and produces the error message. That way the error messages
+(and their positions) are identical between the two, and successful parses
+don't pay for bookkeeping they never use.
+"""
+
+from . import unicat
+from .scanner import ScanError, scanstring, skip_whitespace
+from .specialized_parser import reference_parser
+
+
+class _ParseError(Exception):
+    def __init__(self, pos):
+        super().__init__()
+        self.pos = pos
+
+
+class _DepthError(_ParseError):
+    pass
+
+
+_DIGITS = frozenset('0123456789')
+
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+
+class FastParser:
+    def __init__(
+        self,
+        msg,
+        fname,
+        *,
+        strict=True,
+        dictify=dict,
+        parse_float=float,
+        parse_int=int,
+        parse_constant=float,
+        max_depth=None,
+    ):
+        self.msg = msg
+        self.end = len(self.msg)
+        self.fname = fname
+        self.pos = 0
+        self._strict = strict
+        self._dictify = dictify
+        self._parse_float = parse_float
+        self._parse_int = parse_int
+        self._parse_constant = parse_constant
+        self._max_depth = max_depth
+        self._start = None
+
+    def reset(self, msg):
+        """Prepares the parser to parse `msg` with the same options."""
+        self.msg = msg
+        self.end = len(msg)
+        self.pos = 0
+        self._start = None
+
+    def parse(self):
+        return self._parse(self._document)
+
+    def parse_value(self, pos):
+        """Parses a single value starting at `pos`, rather than a whole
+        document, and returns the same tuple as `parse()`; on success,
+        the position is the one following the value."""
+        self._start = pos
+        self.pos = pos
+        return self._parse(self._value)
+
+    def _document(self):
+        self._sp()
+        v = self._value()
+        self._sp()
+        if self.pos != self.end:
+            raise _ParseError(self.pos)
+        return v
+
+    def _parse(self, rule):
+        try:
+            v = rule()
+        except _DepthError as e:
+            err = _too_deep(self.msg, self.fname, e.pos, self._max_depth)
+            return None, err, e.pos
+        except _ParseError as e:
+            return (None, *self._error(e.pos))
+        except Exception:  # pylint: disable=broad-exception-caught
+            # One of the hooks rejected a value, with whatever exception
+            # it chose. The reference parser reports a syntax error
+            # anywhere in the input before calling any of the hooks, so
+            # check for one first.
+            parser = self._reference_parser()
+            if parser is None or not parser.failed:
+                raise
+            return None, parser.error_message(), parser.errpos
+        return v, None, self.pos
+
+    def _error(self, pos):
+        # Let the reference parser produce the error message and its
+        # position. If the input is nested too deeply for it to handle,
+        # or, due to a bug, it does manage to parse the input, describe
+        # the position where this parser failed instead.
+        parser = self._reference_parser()
+        if parser is not None and parser.failed:
+            return parser.error_message(), parser.errpos
+        return _unexpected(self.msg, self.fname, pos), pos
+
+    def _reference_parser(self):
+        parser = reference_parser(self.msg, self.fname, self._strict)
+        try:
+            if self._start is None:
+                parser.parse()
+            else:
+                parser.parse_value(self._start)
+        except RecursionError:
+            return None
+        return parser
+
+    def _peek(self, offset=0):
+        p = self.pos + offset
+        if p < self.end:
+            return self.msg[p]
+        return ''
+
+    def _expect(self, ch):
+        if self._peek() != ch:
+            raise _ParseError(self.pos)
+        self.pos += 1
+
+    def _sp(self):
+        # Most tokens aren't followed by whitespace; a printable ASCII
+        # character other than '/' can't start any.
+        ch = self.msg[self.pos : self.pos + 1]
+        if '!' <= ch <= '~' and ch != '/':
+            return
+        self.pos = skip_whitespace(self.msg, self.pos)
+
+    def _value(self):
+        # Containers are tracked on an explicit stack rather than by
+        # recursing, so the nesting depth is limited only by `max_depth`
+        # (and memory), not by the Python stack. Each entry holds the
+        # members (or elements) collected so far and, for objects, the key
+        # of the member whose value is being parsed; arrays use `None`.
+        stack = []
+        while True:
+            ch = self._peek()
+            if ch in ('{', '['):
+                self._check_depth(len(stack))
+                self.pos += 1
+                self._sp()
+                if ch == '{':
+                    if self._peek() != '}':
+                        stack.append(([], self._key()))
+                        continue
+                    self.pos += 1
+                    v = self._dictify([])
+                else:
+                    if self._peek() != ']':
+                        stack.append(([], None))
+                        continue
+                    self.pos += 1
+                    v = []
+            else:
+                v = self._scalar(ch)
+
+            # Add the value to the innermost open container. If that closes
+            # the container, it becomes the value to add to the next one.
+            while stack:
+                items, key = stack[-1]
+                if key is None:
+                    items.append(v)
+                    close = ']'
+                else:
+                    items.append((key, v))
+                    close = '}'
+                self._sp()
+                if self._peek() == ',':
+                    self.pos += 1
+                    self._sp()
+                    if self._peek() != close:
+                        if key is not None:
+                            stack[-1] = (items, self._key())
+                        break
+                self._expect(close)
+                stack.pop()
+                v = items if key is None else self._dictify(items)
+            else:
+                return v
+
+    def _check_depth(self, depth):
+        # Called before opening another object or array, with the number
+        # of them that are already open.
+        if self._max_depth is not None and depth >= self._max_depth:
+            raise _DepthError(self.pos)
+
+    def _scalar(self, ch):
+        msg = self.msg
+        if ch == 'n' and msg.startswith('null', self.pos):
+            self.pos += 4
+            return None
+        if ch == 't' and msg.startswith('true', self.pos):
+            self.pos += 4
+            return True
+        if ch == 'f' and msg.startswith('false', self.pos):
+            self.pos += 5
+            return False
+        if ch in ('"', "'"):
+            return self._string()
+        return self._num_literal()
+
+    def _key(self):
+        if self._peek() in ('"', "'"):
+            k = self._string()
+        else:
+            k = self._ident()
+        self._sp()
+        self._expect(':')
+        self._sp()
+        return k
+
+    def _string(self):
+        quote = self.msg[self.pos]
+        try:
+            v, self.pos = scanstring(
+                self.msg, self.pos + 1, quote, self._strict
+            )
+        except ScanError as e:
+            raise _ParseError(e.pos) from e
+        return v
+
+    def _hex_chars(self, n):
+        start = self.pos
+        for _ in range(n):
+            if self._peek() in _HEX_DIGITS:
+                self.pos += 1
+            else:
+                raise _ParseError(self.pos)
+        return chr(int(self.msg[start : self.pos], base=16))
+
+    def _ident(self):
+        chars = [self._id_start()]
+        bmp = None
+        while True:
+            ch = self._peek()
+            if ch in _DIGITS or ch in ('\u200c', '\u200d'):
+                chars.append(ch)
+                self.pos += 1
+            elif ch == '\\' and self._peek(1) == 'u':
+                self.pos += 2
+                chars.append(self._hex_chars(4))
+            elif _is_ascii_id_start(ch):
+                chars.append(ch)
+                self.pos += 1
+            elif ch > '\x7f':
+                if bmp is None:
+                    bmp = unicat.bmp_table()
+                if ch < '\U00010000':
+                    flags = bmp[ord(ch)]
+                else:
+                    flags = unicat.lookup(ch)
+                if not flags & unicat.ID_CONTINUE:
+                    break
+                chars.append(ch)
+                self.pos += 1
+            else:
+                break
+        return ''.join(chars)
+
+    def _id_start(self):
+        ch = self._peek()
+        if ch == '\\' and self._peek(1) == 'u':
+            self.pos += 2
+            return self._hex_chars(4)
+        if _is_ascii_id_start(ch) or (
+            ch > '\x7f' and unicat.lookup(ch) & unicat.ID_START
+        ):
+            self.pos += 1
+            return ch
+        raise _ParseError(self.pos)
+
+    def _is_id_start_at(self, pos):
+        p = self.pos
+        self.pos = pos
+        try:
+            self._id_start()
+            return True
+        except _ParseError:
+            return False
+        finally:
+            self.pos = p
+
+    def _num_literal(self):
+        sign = ''
+        ch = self._peek()
+        while ch in ('-', '+'):
+            if ch == '-':
+                sign += '-'
+            self.pos += 1
+            ch = self._peek()
+        if ch == '0' and self._peek(1) in ('x', 'X'):
+            return self._parse_int(sign + self._hex_literal(), base=16)
+        if ch in _DIGITS or ch == '.':
+            d, is_float = self._dec_literal()
+            if self._is_id_start_at(self.pos):
+                raise _ParseError(self.pos)
+            if is_float:
+                return self._parse_float(sign + d)
+            return self._parse_int(sign + d)
+        if self.msg.startswith('Infinity', self.pos):
+            self.pos += 8
+            return self._parse_constant(sign + 'Infinity')
+        if self.msg.startswith('NaN', self.pos):
+            self.pos += 3
+            return self._parse_constant(sign + 'NaN')
+        raise _ParseError(self.pos)
+
+    def _hex_literal(self):
+        self.pos += 2
+        start = self.pos
+        while self._peek() in _HEX_DIGITS:
+            self.pos += 1
+        if self.pos == start:
+            raise _ParseError(self.pos)
+        return '0x' + self.msg[start : self.pos]
+
+    def _dec_literal(self):
+        msg = self.msg
+        d = ''
+        ch = self._peek()
+        if ch == '0':
+            if self._peek(1) in _DIGITS:
+                raise _ParseError(self.pos)
+            self.pos += 1
+            d = '0'
+        elif ch in _DIGITS:
+            start = self.pos
+            self._digits()
+            d = msg[start : self.pos]
+        f = ''
+        if self._peek() == '.':
+            self.pos += 1
+            start = self.pos
+            self._digits()
+            f = '.' + msg[start : self.pos]
+        if not d and not f:
+            raise _ParseError(self.pos)
+        e = ''
+        if self._peek() in ('e', 'E'):
+            self.pos += 1
+            s = ''
+            if self._peek() in ('+', '-'):
+                s = self._peek()
+                self.pos += 1
+            start = self.pos
+            self._digits()
+            e = 'e' + s + msg[start : self.pos]
+        return d + f + e, bool(f or e)
+
+    def _digits(self):
+        while self._peek() in _DIGITS:
+            self.pos += 1
+
+
+def _unexpected(msg, fname, pos):
+    # Returns the message that the generated parser gives for an error
+    # at `pos`.
+    lineno, colno = _err_offsets(msg, pos)
+    if pos == len(msg):
+        thing = 'end of input'
+    else:
+        thing = f'"{msg[pos]}"'
+    return f'{fname}:{lineno} Unexpected {thing} at column {colno}'
+
+
+def _too_deep(msg, fname, pos, max_depth):
+    # Returns the message for a container at `pos` that is nested more
+    # than `max_depth` levels deep.
+    lineno, colno = _err_offsets(msg, pos)
+    return (
+        f'{fname}:{lineno} Maximum nesting depth of {max_depth} '
+        f'exceeded at column {colno}'
+    )
+
+
+def _err_offsets(msg, pos):
+    lineno = msg.count('\n', 0, pos) + 1
+    colno = pos - msg.rfind('\n', 0, pos)
+    return lineno, colno
+
+
+def _is_ascii_id_start(ch):
+    return 'a' <= ch <= 'z' or 'A' <= ch <= 'Z' or ch in ('$', '_')
@@ -0,0 +1,205 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""`FileIndex`, a saved index of the values in a large JSON5 file."""
+
+import codecs
+import json
+import os
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from .decoder import JSON5Decoder, _get_path, _selector
+from .paths import make_pointer, parse_path
+
+# `FileIndex` takes the same options as `loads()`, and passes them on to
+# the decoder in the same way.
+# pylint: disable=duplicate-code
+
+
+class FileIndex:
+    """An index of where the values in a large JSON5 file are, which is
+    saved next to the file so that it only has to be built once.
+
+    The index maps the JSON Pointer of every value down to `depth`
+    levels below the top of the document to where the value starts and
+    ends in the file. ``get()`` reads just the text of a value from the
+    file and parses it, so any value in the index (or below it) can be
+    looked up in time proportional to its size rather than the size of
+    the file.
+
+    The index is saved as JSON in `index_path` (by default, the path of
+    the file with ``.json5idx`` appended), along with the size and
+    modification time of the file. When a `FileIndex` is created, the
+    saved index is used if the file hasn't changed since it was built;
+    otherwise (and whenever the file changes afterwards) the whole file
+    is read to build a new one. Building the index only parses the
+    objects and arrays above `depth`, and skips over the values below
+    them, so syntax errors further down are only found when the values
+    they are in are looked up.
+
+    The other arguments are the same as for ``load()``, and apply to the
+    values that are looked up. Errors in those values are reported
+    relative to the start of the value.
+    """
+
+    _VERSION = 1
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        depth: int = 2,
+        index_path: Optional[str] = None,
+        encoding: str = 'utf-8',
+        object_hook: Optional[Callable[[Mapping[str, Any]], Any]] = None,
+        parse_float: Optional[Callable[[str], Any]] = None,
+        parse_int: Optional[Callable[[str], Any]] = None,
+        parse_constant: Optional[Callable[[str], Any]] = None,
+        strict: bool = True,
+        object_pairs_hook: Optional[
+            Callable[[Iterable[Tuple[str, Any]]], Any]
+        ] = None,
+        allow_duplicate_keys: bool = True,
+        max_depth: Optional[int] = None,
+    ):
+        self.path = path
+        self.depth = depth
+        self.index_path = index_path or path + '.json5idx'
+        self.encoding = encoding
+        self._decoder = JSON5Decoder(
+            object_hook=object_hook,
+            parse_float=parse_float,
+            parse_int=parse_int,
+            parse_constant=parse_constant,
+            strict=strict,
+            object_pairs_hook=object_pairs_hook,
+            allow_duplicate_keys=allow_duplicate_keys,
+            engine='fast',
+            max_depth=max_depth,
+        )
+        self._stat = None
+        self._entries = {}
+        self._refresh()
+
+    def paths(self) -> Iterator[str]:
+        """Return the JSON Pointers of the values in the index."""
+        self._refresh()
+        return iter(self._entries)
+
+    def get(self, path: str) -> Any:
+        """Return the value at `path`, a JSON Pointer or a dotted path,
+        and raise a KeyError if there is none.
+
+        Only the text of the value is read from the file if it is in the
+        index; otherwise, it is looked up with ``get_path()`` in the
+        text of the deepest value above it that is."""
+        self._refresh()
+        tokens = parse_path(path)
+        n = min(len(tokens), self.depth)
+        span = self._entries.get(make_pointer(tokens[:n]))
+        if span is None:
+            raise KeyError(path)
+        text = self._read(*span)
+        if n == len(tokens):
+            return self._decoder.decode(text)
+        try:
+            return _get_path(self._decoder, text, make_pointer(tokens[n:]))
+        except KeyError:
+            raise KeyError(path) from None
+
+    def rebuild(self) -> None:
+        """Build the index again, and save it."""
+        st = os.stat(self.path)
+        with open(self.path, encoding=self.encoding, newline='') as fp:
+            s = fp.read()
+        entries, err, _ = _selector(self._decoder, s).index(self.depth)
+        if err:
+            raise ValueError(err)
+
+        # Convert the offsets into the text into offsets into the file.
+        offsets = {}
+        encoder = codecs.getincrementalencoder(self.encoding)()
+        prev = 0
+        n = 0
+        for pos in sorted({p for span in entries.values() for p in span}):
+            n += len(encoder.encode(s[prev:pos]))
+            offsets[pos] = n
+            prev = pos
+        self._entries = {
+            pointer: (offsets[start], offsets[end])
+            for pointer, (start, end) in entries.items()
+        }
+        self._stat = (st.st_size, st.st_mtime_ns)
+
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as fp:
+            json.dump(
+                {
+                    'version': self._VERSION,
+                    'size': st.st_size,
+                    'mtime_ns': st.st_mtime_ns,
+                    'depth': self.depth,
+                    'encoding': self.encoding,
+                    'strict': self._decoder.strict,
+                    'entries': self._entries,
+                },
+                fp,
+            )
+        os.replace(tmp_path, self.index_path)
+
+    def _refresh(self):
+        st = os.stat(self.path)
+        stat = (st.st_size, st.st_mtime_ns)
+        if stat == self._stat:
+            return
+        if not self._load(stat):
+            self.rebuild()
+
+    def _load(self, stat):
+        try:
+            with open(self.index_path, encoding='utf-8') as fp:
+                index = json.load(fp)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(index, dict) or index.get('version') != (
+            self._VERSION
+        ):
+            return False
+        if (index.get('size'), index.get('mtime_ns')) != stat or (
+            index.get('depth'),
+            index.get('encoding'),
+            index.get('strict'),
+        ) != (self.depth, self.encoding, self._decoder.strict):
+            return False
+        self._entries = {
+            pointer: tuple(span) for pointer, span in index['entries'].items()
+        }
+        self._stat = stat
+        return True
+
+    def _read(self, start, end):
+        with open(self.path, 'rb') as fp:
+            fp.seek(start)
+            data = fp.read(end - start)
+        return codecs.getincrementaldecoder(self.encoding)().decode(
+            data, final=True
+        )
@@ -0,0 +1,423 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An incremental (push) parser for JSON5.
+
+`IncrementalParser` is given a document a piece at a time. It parses as
+much of the input as it can as soon as it gets it, and only holds on to
+the text it hasn't parsed yet, plus the objects and arrays that are
+still open.
+
+It uses the same rules as `FastParser` (and the same code for scalars),
+but the containers that are still open are kept in the parser between
+calls, and the input is only consumed a whole token at a time. A token
+that ends at the end of the input received so far might continue in the
+next piece, so numbers, identifiers and literals are only parsed once a
+character that can't be part of them (whitespace, punctuation or a
+quote) has been seen, strings once their closing quote has been seen,
+and comments once they are complete.
+
+Errors are reported the same way as by the other parsers: a failure is
+described by the generated parser, at the furthest position that any of
+its alternatives reached. Since most of the text in front of the failing
+token is gone by then, the generated parser is given the last token that
+was parsed and the input after it, behind a short made-up prefix that
+puts it in the same state as this parser (e.g. `[0` in front of a comma
+in an array). If it gets to the end of the input received so far, the
+error is reported once there is more. Lines and columns are counted
+from the start of the whole document.
+"""
+
+import re
+
+from .fast_parser import FastParser, _DepthError, _ParseError
+from .specialized_parser import reference_parser
+from .scanner import WHITESPACE_CHARS, skip_whitespace
+
+
+# A character that can't be part of a number, identifier or literal.
+_DELIMITER_RE = re.compile('[' + WHITESPACE_CHARS + r',:\[\]{}/"\']')
+
+_STRING_END_RE = {
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL),
+    "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*'", re.DOTALL),
+}
+
+# What the parser expects next.
+_VALUE = 'value'
+_KEY = 'key'
+_COLON = 'colon'
+_AFTER_VALUE = 'after value'
+_END = 'end'
+
+
+class IncrementalParser(FastParser):
+    def __init__(self, fname, **kwargs):
+        super().__init__('', fname, **kwargs)
+        self._pending = []
+        self._wait_re = None
+        self._state = _VALUE
+
+        # Each entry holds the members (or elements) collected so far, and
+        # for objects, the key of the member being parsed; arrays use
+        # `None`, and objects whose key hasn't been parsed yet use ''.
+        self._stack = []
+        self._result = None
+
+        # The last token that was parsed, and where it starts in `msg`.
+        # It is kept along with the input that hasn't been parsed yet,
+        # since the error for a token can depend on the one before it.
+        self._last = None
+        self._last_pos = 0
+
+        # The line and column (both counted from 0) at which `msg` starts.
+        self._line = 0
+        self._col = 0
+
+        self._pending_error = None
+        self._hook_error = None
+
+        # Where this parser failed, while more input is needed to tell
+        # how far the generated parser gets.
+        self._fail_pos = None
+
+    def feed(self, text):
+        """Parses as much of the document as possible, given `text` as the
+        next piece of it. Returns an error message if the document is
+        invalid, and None otherwise."""
+        if self._pending_error is None and text:
+            self._pending.append(text)
+            if self._wait_re is None or self._wait_re.search(text):
+                self._run(final=False)
+        return self._pending_error
+
+    def close(self):
+        """Parses the rest of the document, and returns a tuple of the
+        value and an error message (or None)."""
+        if self._pending_error is None:
+            self._run(final=True)
+        if self._pending_error is not None:
+            return None, self._pending_error
+        if self._hook_error is not None:
+            # Like the other parsers, report syntax errors in preference
+            # to the errors raised by the hooks.
+            raise self._hook_error
+        return self._result, None
+
+    def _run(self, final):
+        if self._pending:
+            keep = self._last_pos if self._last is not None else self.pos
+            self._advance_offsets(keep)
+            self.msg = self.msg[keep:] + ''.join(self._pending)
+            self._pending = []
+            self.pos -= keep
+            self._last_pos -= keep
+            if self._fail_pos is not None:
+                self._fail_pos -= keep
+            self.end = len(self.msg)
+        self._wait_re = None
+        if self._fail_pos is not None:
+            self._pending_error = self._err_str(self._fail_pos, final)
+            return
+        try:
+            while self._step(final):
+                pass
+        except _DepthError as e:
+            line, col = self._offsets(e.pos)
+            self._pending_error = (
+                f'{self.fname}:{line} Maximum nesting depth of '
+                f'{self._max_depth} exceeded at column {col}'
+            )
+        except _ParseError as e:
+            self._fail_pos = e.pos
+            self._pending_error = self._err_str(e.pos, final)
+
+    def _step(self, final):
+        # Parses the next token and returns True, or returns False if
+        # the document is complete or more input is needed.
+        msg = self.msg
+        p = skip_whitespace(msg, self.pos)
+        ch = msg[p : p + 1]
+        if ch == '':
+            if final and self._state != _END:
+                raise _ParseError(p)
+            # The input may end in the middle of a line comment.
+            return False
+        if ch == '/':
+            # `skip_whitespace()` stops at a '/' that doesn't start a
+            # complete comment.
+            if not final and msg[p + 1 : p + 2] in ('', '*'):
+                self._wait_re = re.compile('/') if msg[p + 1 :] else None
+                return False
+            if msg[p + 1 : p + 2] == '*':
+                raise _ParseError(self.end)
+            raise _ParseError(p + 1)
+
+        self.pos = p
+        kind = self._token(ch, final)
+        if kind is None:
+            return False
+        self._last = kind
+        self._last_pos = p
+        return True
+
+    def _token(self, ch, final):
+        # Parses the token starting with `ch`, and returns what kind of
+        # token it was, or None if more input is needed.
+        state = self._state
+        stack = self._stack
+        if state == _VALUE:
+            if ch in ('{', '['):
+                self._check_depth(len(stack))
+                self.pos += 1
+                self._open(ch)
+                return ch
+            if ch == ']' and stack and stack[-1][1] is None:
+                self.pos += 1
+                self._close()
+                return ch
+            if not self._complete(ch, final):
+                return None
+            try:
+                v = self._scalar(ch)
+            except _ParseError:
+                raise
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self._defer(e)
+                v = None
+            self._add(v)
+            return _VALUE
+
+        if state == _KEY:
+            if ch == '}':
+                self.pos += 1
+                self._close()
+                return ch
+            if not self._complete(ch, final):
+                return None
+            if ch in ('"', "'"):
+                k = self._string()
+            else:
+                k = self._ident()
+            self._set_key(k)
+            self._state = _COLON
+            return _KEY
+
+        if state == _COLON:
+            self._expect(':')
+            self._state = _VALUE
+            return ch
+
+        if state == _AFTER_VALUE:
+            is_object = stack[-1][1] is not None
+            if ch == ',':
+                self.pos += 1
+                self._state = _KEY if is_object else _VALUE
+                return ch
+            self._expect('}' if is_object else ']')
+            self._close()
+            return ch
+
+        raise _ParseError(self.pos)
+
+    def _complete(self, ch, final):
+        # Returns whether the token starting at `pos` is known to be
+        # complete. Strings are checked by parsing them.
+        if final:
+            return True
+        if ch in ('"', "'"):
+            m = _STRING_END_RE[ch].match(self.msg, self.pos + 1)
+            if m is None:
+                self._wait_re = re.compile(ch)
+                return False
+            return True
+        if _DELIMITER_RE.search(self.msg, self.pos) is None:
+            self._wait_re = _DELIMITER_RE
+            return False
+        return True
+
+    def _open(self, ch):
+        if ch == '{':
+            self._stack.append(([], ''))
+            self._state = _KEY
+        else:
+            self._stack.append(([], None))
+
+    def _set_key(self, k):
+        self._stack[-1] = (self._stack[-1][0], k)
+
+    def _add(self, v):
+        stack = self._stack
+        if not stack:
+            self._result = v
+            self._state = _END
+            return
+        items, key = stack[-1]
+        if key is None:
+            items.append(v)
+        else:
+            items.append((key, v))
+        self._state = _AFTER_VALUE
+
+    def _close(self):
+        items, key = self._stack.pop()
+        if key is None:
+            v = items
+        else:
+            try:
+                v = self._dictify(items)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self._defer(e)
+                v = None
+        self._add(v)
+
+    def _defer(self, e):
+        # One of the hooks rejected a value; keep parsing, in case there
+        # is a syntax error to report instead.
+        if self._hook_error is None:
+            self._hook_error = e
+
+    def _advance_offsets(self, n):
+        nl = self.msg.rfind('\n', 0, n)
+        if nl == -1:
+            self._col += n
+        else:
+            self._line += self.msg.count('\n', 0, n)
+            self._col = n - nl - 1
+
+    def _offsets(self, pos):
+        nl = self.msg.rfind('\n', 0, pos)
+        line = self._line + self.msg.count('\n', 0, pos) + 1
+        if nl == -1:
+            return line, self._col + pos + 1
+        return line, pos - nl
+
+    def _err_str(self, pos, final):
+        # `pos` is where this parser failed. Let the generated parser
+        # find the error, starting from the last token that was parsed,
+        # with a prefix that puts it in the same state. Returns None if
+        # it runs into the end of the input received so far.
+        start = self._last_pos if self._last is not None else 0
+        text = self._prefix() + self.msg[start:]
+        parser = reference_parser(text, self.fname, self._strict)
+        try:
+            _, err, errpos = parser.parse()
+        except RecursionError:
+            err = None
+        n = len(text) - len(self.msg) + start
+        if err is not None and errpos >= n:
+            pos = errpos - n + start
+        if pos == len(self.msg):
+            if not final:
+                return None
+            thing = 'end of input'
+        else:
+            thing = f'"{self.msg[pos]}"'
+        line, col = self._offsets(pos)
+        return f'{self.fname}:{line} Unexpected {thing} at column {col}'
+
+    def _prefix(self):
+        last = self._last
+        stack = self._stack
+        if last is None:
+            return ''
+        if last == ',':
+            return '[0' if stack[-1][1] is None else '{a:0'
+        if last == ':':
+            return '{a'
+        if last == _KEY:
+            return '{'
+        if last in ('[', '{'):
+            # Where a value was expected before the container was opened.
+            stack = stack[:-1]
+        if not stack:
+            prefix = ''
+        elif stack[-1][1] is None:
+            prefix = '['
+        else:
+            prefix = '{a:'
+        if last == ']':
+            return prefix + '['
+        if last == '}':
+            return prefix + '{'
+        return prefix
+
+
+class EventParser(IncrementalParser):
+    """An `IncrementalParser` that reports what it finds as a list of
+    events, in `events`, rather than building the document's value.
+
+    Each event is a tuple of the path to the value it is about (a tuple
+    of keys and array indices), the name of the event and a value:
+    'start_object', 'end_object', 'start_array' and 'end_array' (with no
+    value), 'key' (with the key; the path is that of the object), and
+    'null', 'boolean', 'number' and 'string' (with the value). Only the
+    path to the current value is kept, so memory use depends on how
+    deeply the document is nested rather than on its size.
+    """
+
+    def __init__(self, fname, **kwargs):
+        super().__init__(fname, **kwargs)
+        self.events = []
+
+    def _path(self):
+        return tuple(i if k is None else k for i, k in self._stack)
+
+    def _open(self, ch):
+        if ch == '{':
+            self.events.append((self._path(), 'start_object', None))
+            self._stack.append([0, ''])
+            self._state = _KEY
+        else:
+            self.events.append((self._path(), 'start_array', None))
+            self._stack.append([0, None])
+
+    def _set_key(self, k):
+        self._stack[-1][1] = k
+        self.events.append((self._path()[:-1], 'key', k))
+
+    def _scalar(self, ch):
+        if ch in ('"', "'"):
+            event = 'string'
+        elif ch == 'n' and self.msg.startswith('null', self.pos):
+            event = 'null'
+        elif (ch == 't' and self.msg.startswith('true', self.pos)) or (
+            ch == 'f' and self.msg.startswith('false', self.pos)
+        ):
+            event = 'boolean'
+        else:
+            event = 'number'
+        v = super()._scalar(ch)
+        self.events.append((self._path(), event, v))
+        return v
+
+    def _add(self, v):
+        stack = self._stack
+        if not stack:
+            self._state = _END
+            return
+        if stack[-1][1] is None:
+            stack[-1][0] += 1
+        self._state = _AFTER_VALUE
+
+    def _close(self):
+        _, key = self._stack.pop()
+        event = 'end_array' if key is None else 'end_object'
+        self.events.append((self._path(), event, None))
+        self._add(None)
+
+    def _defer(self, e):
+        # The events before the value have already been reported, so
+        # there is no point in waiting for a syntax error.
+        raise e
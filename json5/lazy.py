@@ -0,0 +1,213 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Objects and arrays that are only parsed when they are used.
+
+`LazyObject` and `LazyArray` are read-only proxies for the objects and
+arrays in a document. Creating one only scans the top level of the
+container: the keys of an object are parsed, but each value (and each
+element of an array) is just skipped over, recording where it starts
+and ends. A value is parsed the first time it is looked up, and then
+cached; if it is an object or an array, it is another proxy, so a
+document is only parsed as far as it is used.
+
+Since each proxy skips over all of the values in its container, the
+same text would be passed over once for every level it is nested in;
+instead, the proxies for a document share its
+`structural.StructuralIndex`, which is built once, and tells them where
+each object and array ends.
+"""
+
+from collections.abc import Mapping, Sequence
+
+from .fast_parser import _DepthError, _ParseError
+from .paths import Selector
+
+
+class LazyParser(Selector):
+    def load_document(self):
+        """Returns the value of the document, with objects and arrays as
+        proxies. Raises a ValueError if the top level of the document is
+        invalid."""
+        v, err, _ = self._parse(self._load_document)
+        if err:
+            raise ValueError(err)
+        return v
+
+    def _load_document(self):
+        self._sp()
+        v = self._load(0)
+        self._sp()
+        if self.pos != self.end:
+            raise _ParseError(self.pos)
+        return v
+
+    def load(self, start, end=None, depth=0):
+        """Returns the value at `start`, which must end at `end` (if
+        given), with objects and arrays as proxies. `depth` is the number
+        of containers the value is in. Raises a ValueError if the value
+        is invalid."""
+        self.pos = start
+        self._start = start
+        v, err, pos = self._parse(lambda: self._load(depth))
+        if err:
+            raise ValueError(err)
+        if end is not None and pos != end:
+            # The value is followed by something that the scan of the
+            # container it is in took to be part of it.
+            raise ValueError(self._error(pos)[0])
+        return v
+
+    def _load(self, depth):
+        ch = self._peek()
+        if ch not in ('{', '['):
+            return self._value()
+        if self._max_depth is not None and depth >= self._max_depth:
+            raise _DepthError(self.pos)
+        source = _Source(self)
+        self.pos += 1
+        self._sp()
+        if ch == '{':
+            spans = {}
+            while self._peek() != '}':
+                k = self._key()
+                if self._reject_duplicates and k in spans:
+                    raise ValueError(f'Duplicate key "{k}" found in object')
+                start = self.pos
+                self._skip()
+                spans[k] = (start, self.pos)
+                if not self._next_member():
+                    break
+            self._expect('}')
+            return LazyObject(source, spans, depth + 1)
+        spans = []
+        while self._peek() != ']':
+            start = self.pos
+            self._skip()
+            spans.append((start, self.pos))
+            if not self._next_member():
+                break
+        self._expect(']')
+        return LazyArray(source, spans, depth + 1)
+
+    def _next_member(self):
+        self._sp()
+        if self._peek() != ',':
+            return False
+        self.pos += 1
+        self._sp()
+        return True
+
+
+class _Source:
+    # The document that a proxy's values are parsed from, and the options
+    # to parse them with. A new parser is used for each value, so that
+    # proxies can be used from several threads.
+
+    __slots__ = ('msg', 'fname', 'kwargs')
+
+    def __init__(self, parser):
+        self.msg = parser.msg
+        self.fname = parser.fname
+        self.kwargs = {
+            'strict': parser._strict,
+            'parse_float': parser._parse_float,
+            'parse_int': parser._parse_int,
+            'parse_constant': parser._parse_constant,
+            'max_depth': parser._max_depth,
+            'reject_duplicates': parser._reject_duplicates,
+            'structure': parser._structure,
+        }
+
+    def load(self, span, depth):
+        parser = LazyParser(self.msg, self.fname, **self.kwargs)
+        return parser.load(span[0], span[1], depth)
+
+
+class LazyObject(Mapping):
+    """A read-only mapping whose values are parsed when they are first
+    looked up. Iterating over it (or over its keys) doesn't parse any
+    values."""
+
+    __slots__ = ('_source', '_spans', '_depth', '_cache')
+
+    def __init__(self, source, spans, depth):
+        self._source = source
+        self._spans = spans
+        self._depth = depth
+        self._cache = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        v = self._source.load(self._spans[key], self._depth)
+        self._cache[key] = v
+        return v
+
+    def __iter__(self):
+        return iter(self._spans)
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __contains__(self, key):
+        return key in self._spans
+
+    def __repr__(self):
+        return f'<LazyObject with {len(self._spans)} members>'
+
+
+class LazyArray(Sequence):
+    """A read-only sequence whose elements are parsed when they are first
+    looked up."""
+
+    __slots__ = ('_source', '_spans', '_depth', '_cache')
+
+    def __init__(self, source, spans, depth):
+        self._source = source
+        self._spans = spans
+        self._depth = depth
+        self._cache = {}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self._spans)
+        try:
+            return self._cache[index]
+        except KeyError:
+            pass
+        if not 0 <= index < len(self._spans):
+            raise IndexError('LazyArray index out of range')
+        v = self._source.load(self._spans[index], self._depth)
+        self._cache[index] = v
+        return v
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'<LazyArray with {len(self._spans)} elements>'
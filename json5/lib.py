@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import math
 import re
 from typing import (
@@ -25,9 +26,16 @@ from typing import (
     Tuple,
     Union,
 )
-import unicodedata
 
-from .parser import Parser
+from . import unicat
+from .decoder import (
+    JSON5Decoder,
+    _default_decoder,
+    _get_path,
+    _lazy,
+    _select,
+)
+from .transcoder import transcode
 
 
 def load(
@@ -44,6 +52,10 @@ def load(
         Callable[[Iterable[Tuple[str, Any]]], Any]
     ] = None,
     allow_duplicate_keys: bool = True,
+    engine: str = 'auto',
+    max_depth: Optional[int] = None,
+    select: Optional[Iterable[str]] = None,
+    lazy: bool = False,
 ) -> Any:
     """Deserialize ``fp`` (a ``.read()``-supporting file-like object
     containing a JSON document) to a Python object.
@@ -54,6 +66,14 @@ def load(
           duplicate keys in a object; by default, this is True for
           compatibility with ``json.load()``, but if set to False and
           the object contains duplicate keys, a ValueError will be raised.
+        - an extra `engine` parameter selects the parser implementation;
+          see ``loads()`` for the possible values.
+        - an extra `max_depth` parameter limits how deeply objects and
+          arrays may be nested; see ``loads()``.
+        - an extra `select` parameter selects the values to return; see
+          ``loads()``.
+        - an extra `lazy` parameter delays parsing values until they are
+          used; see ``loads()``.
     """
 
     s = fp.read()
@@ -68,6 +88,10 @@ def load(
         strict=strict,
         object_pairs_hook=object_pairs_hook,
         allow_duplicate_keys=allow_duplicate_keys,
+        engine=engine,
+        max_depth=max_depth,
+        select=select,
+        lazy=lazy,
     )
 
 
@@ -85,6 +109,10 @@ def loads(
         Callable[[Iterable[Tuple[str, Any]]], Any]
     ] = None,
     allow_duplicate_keys: bool = True,
+    engine: str = 'auto',
+    max_depth: Optional[int] = None,
+    select: Optional[Iterable[str]] = None,
+    lazy: bool = False,
 ):
     """Deserialize ``s`` (a string containing a JSON5 document) to a Python
     object.
@@ -95,6 +123,55 @@ def loads(
           duplicate keys in a object; by default, this is True for
           compatibility with ``json.load()``, but if set to False and
           the object contains duplicate keys, a ValueError will be raised.
+        - an extra `engine` parameter selects the parser implementation:
+          `'fast'` is a hand-written recursive-descent parser, `'scanner'`
+          is a regex-driven scanner modeled on the pure-Python scanner in
+          the `json` module, and `'reference'` is the parser generated
+          from the grammar in `json5.g`. All of them accept the same
+          documents and produce the same results and errors. `'auto'`
+          (the default) first tries to decode the document as plain JSON
+          with the `json` module's (C) decoder, which produces identical
+          results for documents that are also valid JSON, and falls back
+          to `'fast'` if that fails; if any of the hooks are given, it
+          uses `'fast'` straight away, so that each hook is called once
+          per value. `'transcode'` rewrites the document
+          as JSON text (see `to_json()`) and decodes that with the `json`
+          module's decoder, again falling back to `'fast'` if that fails;
+          with custom `parse_float` or `parse_int` hooks it only does so
+          for documents whose numbers are all spelled the same way in
+          JSON, so that the hooks see the same text as with the other
+          engines.
+        - an extra `max_depth` parameter limits how deeply objects and
+          arrays may be nested; if it is exceeded, a ValueError will be
+          raised. By default there is no limit: the `'fast'` engine keeps
+          track of nested containers on an explicit stack, so it can parse
+          arbitrarily deep documents. `max_depth` is not supported by the
+          `'reference'` engine, which is limited by the Python stack.
+        - an extra `select` parameter takes a list of paths, and returns
+          a dict mapping each path to the value at that path, leaving
+          out the paths that aren't in the document. A path is either a
+          JSON Pointer (``'/servers/3/host'``) or a dotted path
+          (``'servers.3.host'``). Only the values at those paths (and
+          the objects and arrays leading to them) are parsed; everything
+          else is skipped by looking for where each value ends, without
+          building any Python objects or checking that the value is
+          valid, so a syntax error in a skipped value may not be
+          reported, and with `allow_duplicate_keys=False` only the
+          objects leading to the selected values are checked. The hooks
+          are applied to the selected values, but `object_hook` and
+          `object_pairs_hook` are not called for the objects leading to
+          them, which are treated as dicts. The `engine` is ignored.
+        - an extra `lazy` parameter, if true, returns objects and arrays
+          as read-only ``Mapping`` and ``Sequence`` proxies (`LazyObject`
+          and `LazyArray` from ``json5.lazy``). Creating a proxy only
+          parses the keys of an object, and records where each value
+          starts and ends; a value is only parsed when it is first
+          looked up, and is then cached, so iterating over the keys of
+          an object doesn't parse any values. As a result, a syntax
+          error is only reported (as a ValueError) when the object or
+          array it is in is first looked up. `object_hook` and
+          `object_pairs_hook` can't be used with `lazy`, and the
+          `engine` is ignored.
     """
 
     assert cls is None, 'Custom decoders are not supported'
@@ -103,85 +180,125 @@ def loads(
         encoding = encoding or 'utf-8'
         s = s.decode(encoding)
 
-    if not s:
-        raise ValueError('Empty strings are not legal JSON5')
-    parser = Parser(s, '<string>')
-    ast, err, _ = parser.parse(global_vars={'_strict': strict})
-    if err:
-        raise ValueError(err)
-
-    def _fp_constant_parser(s):
-        return float(s.replace('Infinity', 'inf').replace('NaN', 'nan'))
-
-    if object_pairs_hook:
-        dictify = object_pairs_hook
-    elif object_hook:
-
-        def dictify(pairs):
-            return object_hook(dict(pairs))
+    # Decoders are only reused for the options that take a handful of
+    # values, so that there are only ever a few of them.
+    hooks = (
+        object_hook,
+        object_pairs_hook,
+        parse_constant,
+        parse_float,
+        parse_int,
+    )
+    if max_depth is None and all(hook is None for hook in hooks):
+        decoder = _default_decoder(strict, allow_duplicate_keys, engine)
     else:
-        dictify = dict
+        decoder = JSON5Decoder(
+            object_hook=object_hook,
+            parse_float=parse_float,
+            parse_int=parse_int,
+            parse_constant=parse_constant,
+            strict=strict,
+            object_pairs_hook=object_pairs_hook,
+            allow_duplicate_keys=allow_duplicate_keys,
+            engine=engine,
+            max_depth=max_depth,
+        )
+    if lazy:
+        if object_hook is not None or object_pairs_hook is not None:
+            raise ValueError(
+                'object_hook and object_pairs_hook are not supported with '
+                'lazy=True'
+            )
+        if select is not None:
+            raise ValueError('select and lazy=True can not be used together')
+        return _lazy(decoder, s)
+    if select is not None:
+        return _select(decoder, s, select)
+    return decoder.decode(s)
+
 
-    if not allow_duplicate_keys:
-        _orig_dictify = dictify
+def get_path(
+    s: str,
+    path: str,
+    *,
+    encoding: Optional[str] = None,
+    object_hook: Optional[Callable[[Mapping[str, Any]], Any]] = None,
+    parse_float: Optional[Callable[[str], Any]] = None,
+    parse_int: Optional[Callable[[str], Any]] = None,
+    parse_constant: Optional[Callable[[str], Any]] = None,
+    strict: bool = True,
+    object_pairs_hook: Optional[
+        Callable[[Iterable[Tuple[str, Any]]], Any]
+    ] = None,
+    allow_duplicate_keys: bool = True,
+    max_depth: Optional[int] = None,
+) -> Any:
+    """Return the value at `path` in ``s`` (a string containing a JSON5
+    document), parsing as little of the document as possible.
+
+    `path` is a JSON Pointer (``'/servers/3/host'``) or a dotted path
+    (``'servers.3.host'``). The objects and arrays leading to the value
+    are only scanned as far as the members (or elements) on the path,
+    skipping the ones in front of them without parsing them, and
+    scanning stops as soon as the value has been parsed, so the rest of
+    the document is never looked at. As a result, a syntax error that
+    isn't on the way to the value is not reported, and if an object has
+    several members with the same key, the first one is used (rather
+    than the last, as with ``loads()``). A KeyError is raised if there is
+    no value at `path`.
+
+    The other arguments are the same as for ``loads()``, and apply to
+    the value that is returned.
+    """
+    if isinstance(s, bytes):
+        s = s.decode(encoding or 'utf-8')
+    decoder = JSON5Decoder(
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        object_pairs_hook=object_pairs_hook,
+        allow_duplicate_keys=allow_duplicate_keys,
+        engine='fast',
+        max_depth=max_depth,
+    )
+    return _get_path(decoder, s, path)
 
-        def dictify(pairs):  # pylint: disable=function-redefined
-            return _reject_duplicate_keys(pairs, _orig_dictify)
 
-    parse_float = parse_float or float
-    parse_int = parse_int or int
-    parse_constant = parse_constant or _fp_constant_parser
+# Decodes JSON text without building dicts for its objects, since
+# `to_json()` only needs to know whether the text is valid.
+_JSON_CHECKER = json.JSONDecoder(object_pairs_hook=len)
 
-    return _walk_ast(ast, dictify, parse_float, parse_int, parse_constant)
 
+def to_json(s: str, *, strict: bool = True) -> str:
+    """Rewrite ``s`` (a string containing a JSON5 document) as JSON text.
 
-def _reject_duplicate_keys(pairs, dictify):
-    keys = set()
-    for key, _ in pairs:
-        if key in keys:
-            raise ValueError(f'Duplicate key "{key}" found in object')
-        keys.add(key)
-    return dictify(pairs)
+    Comments are removed, identifier keys and single-quoted strings are
+    turned into double-quoted strings, hex numbers are converted to
+    decimal, trailing commas are dropped and so on; other text is copied
+    as is. `strict` has the same meaning as for `loads()`.
 
+    The transcoder only checks the tokens it rewrites, so the result is
+    also scanned by the `json` module's decoder to check the structure
+    of the document. That builds the strings, numbers and lists in it,
+    but not its dicts, and they are all thrown away.
 
-def _walk_ast(
-    el,
-    dictify: Callable[[Iterable[Tuple[str, Any]]], Any],
-    parse_float,
-    parse_int,
-    parse_constant,
-):
-    if el == 'None':
-        return None
-    if el == 'True':
-        return True
-    if el == 'False':
-        return False
-    ty, v = el
-    if ty == 'number':
-        if v.startswith('0x') or v.startswith('0X'):
-            return parse_int(v, base=16)
-        if '.' in v or 'e' in v or 'E' in v:
-            return parse_float(v)
-        if 'Infinity' in v or 'NaN' in v:
-            return parse_constant(v)
-        return parse_int(v)
-    if ty == 'string':
-        return v
-    if ty == 'object':
-        pairs = []
-        for key, val_expr in v:
-            val = _walk_ast(
-                val_expr, dictify, parse_float, parse_int, parse_constant
-            )
-            pairs.append((key, val))
-        return dictify(pairs)
-    if ty == 'array':
-        return [
-            _walk_ast(el, dictify, parse_float, parse_int, parse_constant)
-            for el in v
-        ]
-    raise ValueError('unknown el: ' + el)  # pragma: no cover
+    Raises a ValueError with the same message as `loads()` if ``s`` is
+    not a valid JSON5 document.
+    """
+    try:
+        text = transcode(s, strict)
+        _JSON_CHECKER.decode(text)
+        return text
+    except (ValueError, RecursionError):
+        pass
+
+    # Either `s` isn't valid JSON5, or it is one of the few documents
+    # that can't be transcoded token by token.
+    return json.dumps(
+        loads(s, strict=strict, engine='fast'), ensure_ascii=False
+    )
 
 
 def dump(
@@ -697,42 +814,20 @@ def _dump_str(obj, ensure_ascii):
 
 
 def _is_ident(k):
-    if not k or not _is_id_start(k[0]) and k[0] not in ('$', '_'):
+    if not k or not unicat.is_id_start(k[0]) and k[0] not in ('$', '_'):
         return False
+    bmp = unicat.bmp_table()
     for ch in k[1:]:
-        if not _is_id_continue(ch) and ch not in ('$', '_'):
+        if ch < '\U00010000':
+            if bmp[ord(ch)] & unicat.ID_CONTINUE:
+                continue
+        elif unicat.is_id_continue(ch):
+            continue
+        if ch not in ('$', '_'):
             return False
     return True
 
 
-def _is_id_start(ch):
-    return unicodedata.category(ch) in (
-        'Lu',
-        'Ll',
-        'Li',
-        'Lt',
-        'Lm',
-        'Lo',
-        'Nl',
-    )
-
-
-def _is_id_continue(ch):
-    return unicodedata.category(ch) in (
-        'Lu',
-        'Ll',
-        'Li',
-        'Lt',
-        'Lm',
-        'Lo',
-        'Nl',
-        'Nd',
-        'Mn',
-        'Mc',
-        'Pc',
-    )
-
-
 _reserved_word_re = None
 
 
@@ -0,0 +1,1379 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The generated parser, with its rules rewritten to run faster.
+
+`json5/parser.py` is generated by glop from `json5/json5.g`, and `run
+regen` overwrites it, so the changes to the generated code are made
+here, in a subclass, in the same way as in `specialized_parser.py`.
+They all produce the same values, and fail at the same positions, as
+the rules they replace:
+
+- `sp` skips whitespace and comments with `scanner.skip_whitespace()`,
+  and `string` scans well-formed strings with `scanner.scanstring()`,
+  rather than matching them a character at a time. Each of them records
+  where the generated rules would have failed.
+- `value` goes straight to the only alternative that can start with the
+  next character.
+- Unicode categories are looked up in the tables in `unicat`.
+- Rules that bind grammar variables keep them in Python locals, rather
+  than in a dict pushed onto a stack of scopes for every call, and
+  sequences and choices are written out as straight-line code, rather
+  than as lists of lambdas that are built on every call.
+
+The last of these is what glop would generate with those features;
+when it does, the rules can be dropped from here.
+
+Until then, be careful when regenerating `parser.py`. The overrides
+replace the generated methods by name, and glop names the methods for
+the alternatives and sequences of a rule after their positions in it:
+`_ws__c8__s0_n_n_g__c0_`, for example, belongs to the ninth alternative
+of `ws`. After an edit to `json5.g`, `run regen` can leave an override
+replacing a different part of a rule than the one it was written for,
+or replacing nothing at all, and the straight-line sequences and
+choices can stop matching the structure of the rules they replace.
+`tests/optimized_parser_test.py` checks that every override still names
+a method of `Parser`, apart from the helper rules listed there that
+glop doesn't generate yet, and fails whenever `json5.g` changes, so that
+the rules here are compared with the regenerated ones.
+"""
+
+# pylint: disable=too-many-lines
+
+from . import unicat
+from .parser import Parser
+from .scanner import ScanError, scanstring, skip_whitespace
+
+
+# The index of the only `value` alternative that can start with each
+# character.
+_VALUE_FIRST_CHARS = {
+    'n': 0,
+    't': 1,
+    'f': 2,
+    '{': 3,
+    '[': 4,
+    '"': 5,
+    "'": 5,
+    **{ch: 6 for ch in '0123456789+-.IN'},
+}
+
+
+class OptimizedParser(Parser):
+    def _get(self, var):
+        return self._global_vars[var]
+
+    def _is_unicat(self, var, cat):
+        return unicat.category(var) == cat
+
+    def _grammar_(self):
+        self._sp_()
+        if self.failed:
+            return
+        self._value_()
+        if self.failed:
+            return
+        v = self.val
+        self._sp_()
+        if self.failed:
+            return
+        self._end_()
+        if self.failed:
+            return
+        self._succeed(v)
+
+    def _sp_(self):
+        # Skip whitespace and comments in bulk. The `ws` alternatives that
+        # fail where the skipping stops are what determine the furthest
+        # position a failure was reached at, so account for them here.
+        p = skip_whitespace(self.msg, self.pos)
+        errpos = p
+        if self.msg[p : p + 1] == '/':
+            if self.msg[p + 1 : p + 2] == '*':
+                errpos = self.end
+            else:
+                errpos = p + 1
+        self.errpos = max(self.errpos, errpos)
+        self._succeed([], p)
+
+    def _ws_(self):
+        p = self.pos
+        self._ws__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._eol_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._comment_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._ws__c3_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._ws__c4_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._ws__c5_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._ws__c6_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._ws__c7_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._ws__c8_()
+
+    def _ws__c8_(self):
+        self._ws__c8__s0_()
+        if self.failed:
+            return
+        self._anything_()
+        if self.failed:
+            return
+        x = self.val
+        self._succeed(x)
+
+    def _ws__c8__s0_(self):
+        self._not(self._ws__c8__s0_n_)
+
+    def _ws__c8__s0_n_(self):
+        self._not(self._ws__c8__s0_n_n_)
+
+    def _ws__c8__s0_n_n_(self):
+        self._ws__c8__s0_n_n_g__c0_()
+
+    def _ws__c8__s0_n_n_g__c0_(self):
+        self._anything_()
+        if self.failed:
+            return
+        x = self.val
+        v = self._is_unicat(x, 'Zs')
+        if v:
+            self._succeed(v)
+        else:
+            self._fail()
+
+    def _eol_(self):
+        p = self.pos
+        self._eol__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._eol__c1_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._eol__c2_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._eol__c3_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._eol__c4_()
+
+    def _eol__c0_(self):
+        self._ch('\r')
+        if self.failed:
+            return
+        self._ch('\n')
+
+    def _comment_(self):
+        p = self.pos
+        self._comment__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._comment__c1_()
+
+    def _comment__c0_(self):
+        self._str('//')
+        if self.failed:
+            return
+        self._star(self._comment__c0__s1_p_)
+
+    def _comment__c0__s1_p_(self):
+        self._not(self._eol_)
+        if self.failed:
+            return
+        self._anything_()
+
+    def _comment__c1_(self):
+        self._str('/*')
+        if self.failed:
+            return
+        self._comment__c1__s1_()
+        if self.failed:
+            return
+        self._str('*/')
+
+    def _comment__c1__s1_(self):
+        self._star(self._comment__c1__s1_p_)
+
+    def _comment__c1__s1_p_(self):
+        self._comment__c1__s1_p__s0_()
+        if self.failed:
+            return
+        self._anything_()
+
+    def _comment__c1__s1_p__s0_(self):
+        self._not(self._comment__c1__s1_p__s0_n_)
+
+    def _comment__c1__s1_p__s0_n_(self):
+        self._str('*/')
+
+    def _value_(self):
+        # Go straight to the only alternative that can match the next
+        # character. The alternatives before it would all have failed at
+        # the current position, so record that to keep errpos the same.
+        i = _VALUE_FIRST_CHARS.get(self.msg[self.pos : self.pos + 1])
+        if i is None:
+            p = self.pos
+            self._value__c0_()
+            if not self.failed:
+                return
+            self._rewind(p)
+            self._value__c1_()
+            if not self.failed:
+                return
+            self._rewind(p)
+            self._value__c2_()
+            if not self.failed:
+                return
+            self._rewind(p)
+            self._value__c3_()
+            if not self.failed:
+                return
+            self._rewind(p)
+            self._value__c4_()
+            if not self.failed:
+                return
+            self._rewind(p)
+            self._value__c5_()
+            if not self.failed:
+                return
+            self._rewind(p)
+            self._value__c6_()
+            return
+        if i:
+            self.errpos = max(self.errpos, self.pos)
+        if i == 0:
+            self._value__c0_()
+        elif i == 1:
+            self._value__c1_()
+        elif i == 2:
+            self._value__c2_()
+        elif i == 3:
+            self._value__c3_()
+        elif i == 4:
+            self._value__c4_()
+        elif i == 5:
+            self._value__c5_()
+        else:
+            self._value__c6_()
+
+    def _value__c0_(self):
+        self._str('null')
+        if self.failed:
+            return
+        self._succeed('None')
+
+    def _value__c1_(self):
+        self._str('true')
+        if self.failed:
+            return
+        self._succeed('True')
+
+    def _value__c2_(self):
+        self._str('false')
+        if self.failed:
+            return
+        self._succeed('False')
+
+    def _value__c3_(self):
+        self._object_()
+        if self.failed:
+            return
+        v = self.val
+        self._succeed(['object', v])
+
+    def _value__c4_(self):
+        self._array_()
+        if self.failed:
+            return
+        v = self.val
+        self._succeed(['array', v])
+
+    def _value__c5_(self):
+        self._string_()
+        if self.failed:
+            return
+        v = self.val
+        self._succeed(['string', v])
+
+    def _value__c6_(self):
+        self._num_literal_()
+        if self.failed:
+            return
+        v = self.val
+        self._succeed(['number', v])
+
+    def _object_(self):
+        p = self.pos
+        self._object__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._object__c1_()
+
+    def _object__c0_(self):
+        self._ch('{')
+        if self.failed:
+            return
+        self._sp_()
+        if self.failed:
+            return
+        self._member_list_()
+        if self.failed:
+            return
+        v = self.val
+        self._sp_()
+        if self.failed:
+            return
+        self._ch('}')
+        if self.failed:
+            return
+        self._succeed(v)
+
+    def _object__c1_(self):
+        self._ch('{')
+        if self.failed:
+            return
+        self._sp_()
+        if self.failed:
+            return
+        self._ch('}')
+        if self.failed:
+            return
+        self._succeed([])
+
+    def _array_(self):
+        p = self.pos
+        self._array__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._array__c1_()
+
+    def _array__c0_(self):
+        self._ch('[')
+        if self.failed:
+            return
+        self._sp_()
+        if self.failed:
+            return
+        self._element_list_()
+        if self.failed:
+            return
+        v = self.val
+        self._sp_()
+        if self.failed:
+            return
+        self._ch(']')
+        if self.failed:
+            return
+        self._succeed(v)
+
+    def _array__c1_(self):
+        self._ch('[')
+        if self.failed:
+            return
+        self._sp_()
+        if self.failed:
+            return
+        self._ch(']')
+        if self.failed:
+            return
+        self._succeed([])
+
+    def _string_(self):
+        # Scan a well-formed string in bulk. The furthest failure inside
+        # it is at the closing quote, where the `sqchar`/`dqchar`
+        # alternatives stop matching. If it isn't well-formed, fall back
+        # to the rules below to find out exactly where it fails.
+        p = self.pos
+        quote = self.msg[p : p + 1]
+        if quote in ('"', "'"):
+            try:
+                v, end = scanstring(
+                    self.msg, p + 1, quote, self._get('_strict')
+                )
+                self.errpos = max(self.errpos, end - 1)
+                self._succeed(v, end)
+                return
+            except ScanError:
+                pass
+        p = self.pos
+        self._string__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._string__c1_()
+
+    def _string__c0_(self):
+        self._squote_()
+        if self.failed:
+            return
+        self._star(self._sqchar_)
+        if self.failed:
+            return
+        cs = self.val
+        self._squote_()
+        if self.failed:
+            return
+        self._succeed(self._join('', cs))
+
+    def _string__c1_(self):
+        self._dquote_()
+        if self.failed:
+            return
+        self._star(self._dqchar_)
+        if self.failed:
+            return
+        cs = self.val
+        self._dquote_()
+        if self.failed:
+            return
+        self._succeed(self._join('', cs))
+
+    def _sqchar_(self):
+        p = self.pos
+        self._sqchar__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._sqchar__c1_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._sqchar__c2_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._sqchar__c3_()
+
+    def _sqchar__c0_(self):
+        self._bslash_()
+        if self.failed:
+            return
+        self._esc_char_()
+        if self.failed:
+            return
+        c = self.val
+        self._succeed(c)
+
+    def _sqchar__c1_(self):
+        self._bslash_()
+        if self.failed:
+            return
+        self._eol_()
+        if self.failed:
+            return
+        self._succeed('')
+
+    def _sqchar__c2_(self):
+        self._not(self._bslash_)
+        if self.failed:
+            return
+        self._not(self._squote_)
+        if self.failed:
+            return
+        self._not(self._eol_)
+        if self.failed:
+            return
+        self._anything_()
+        if self.failed:
+            return
+        c = self.val
+        self._succeed(c)
+
+    def _sqchar__c3_(self):
+        self._not(self._sqchar__c3__s0_n_)
+        if self.failed:
+            return
+        self._range('\x00', '\x1f')
+
+    def _dqchar_(self):
+        p = self.pos
+        self._dqchar__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._dqchar__c1_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._dqchar__c2_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._dqchar__c3_()
+
+    def _dqchar__c0_(self):
+        self._bslash_()
+        if self.failed:
+            return
+        self._esc_char_()
+        if self.failed:
+            return
+        c = self.val
+        self._succeed(c)
+
+    def _dqchar__c1_(self):
+        self._bslash_()
+        if self.failed:
+            return
+        self._eol_()
+        if self.failed:
+            return
+        self._succeed('')
+
+    def _dqchar__c2_(self):
+        self._not(self._bslash_)
+        if self.failed:
+            return
+        self._not(self._dquote_)
+        if self.failed:
+            return
+        self._not(self._eol_)
+        if self.failed:
+            return
+        self._anything_()
+        if self.failed:
+            return
+        c = self.val
+        self._succeed(c)
+
+    def _dqchar__c3_(self):
+        self._not(self._dqchar__c3__s0_n_)
+        if self.failed:
+            return
+        self._range('\x00', '\x1f')
+
+    def _esc_char_(self):
+        p = self.pos
+        self._esc_char__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c1_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c2_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c3_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c4_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c5_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c6_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c7_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c8_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c9_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c10_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c11_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c12_()
+
+    def _esc_char__c0_(self):
+        self._ch('b')
+        if self.failed:
+            return
+        self._succeed('\b')
+
+    def _esc_char__c1_(self):
+        self._ch('f')
+        if self.failed:
+            return
+        self._succeed('\f')
+
+    def _esc_char__c10_(self):
+        self._ch('0')
+        if self.failed:
+            return
+        self._not(self._digit_)
+        if self.failed:
+            return
+        self._succeed('\x00')
+
+    def _esc_char__c11_(self):
+        self._hex_esc_()
+        if self.failed:
+            return
+        c = self.val
+        self._succeed(c)
+
+    def _esc_char__c12_(self):
+        self._unicode_esc_()
+        if self.failed:
+            return
+        c = self.val
+        self._succeed(c)
+
+    def _esc_char__c2_(self):
+        self._ch('n')
+        if self.failed:
+            return
+        self._succeed('\n')
+
+    def _esc_char__c3_(self):
+        self._ch('r')
+        if self.failed:
+            return
+        self._succeed('\r')
+
+    def _esc_char__c4_(self):
+        self._ch('t')
+        if self.failed:
+            return
+        self._succeed('\t')
+
+    def _esc_char__c5_(self):
+        self._ch('v')
+        if self.failed:
+            return
+        self._succeed('\v')
+
+    def _esc_char__c6_(self):
+        self._squote_()
+        if self.failed:
+            return
+        self._succeed("'")
+
+    def _esc_char__c7_(self):
+        self._dquote_()
+        if self.failed:
+            return
+        self._succeed('"')
+
+    def _esc_char__c8_(self):
+        self._bslash_()
+        if self.failed:
+            return
+        self._succeed('\\')
+
+    def _esc_char__c9_(self):
+        self._esc_char__c9__s0_()
+        if self.failed:
+            return
+        self._anything_()
+        if self.failed:
+            return
+        c = self.val
+        self._succeed(c)
+
+    def _esc_char__c9__s0_(self):
+        self._not(self._esc_char__c9__s0_n_g_)
+
+    def _esc_char__c9__s0_n_g_(self):
+        p = self.pos
+        self._esc_char__c9__s0_n_g__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._esc_char__c9__s0_n_g__c1_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._digit_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._eol_()
+
+    def _esc_char__c9__s0_n_g__c0_(self):
+        self._ch('x')
+
+    def _esc_char__c9__s0_n_g__c1_(self):
+        self._ch('u')
+
+    def _hex_esc_(self):
+        self._ch('x')
+        if self.failed:
+            return
+        self._hex_()
+        if self.failed:
+            return
+        h1 = self.val
+        self._hex_()
+        if self.failed:
+            return
+        h2 = self.val
+        self._succeed(self._xtou(h1 + h2))
+
+    def _unicode_esc_(self):
+        self._ch('u')
+        if self.failed:
+            return
+        self._hex_()
+        if self.failed:
+            return
+        a = self.val
+        self._hex_()
+        if self.failed:
+            return
+        b = self.val
+        self._hex_()
+        if self.failed:
+            return
+        c = self.val
+        self._hex_()
+        if self.failed:
+            return
+        d = self.val
+        self._succeed(self._xtou(a + b + c + d))
+
+    def _element_list_(self):
+        self._value_()
+        if self.failed:
+            return
+        v = self.val
+        self._star(self._element_list__s1_l_p_)
+        if self.failed:
+            return
+        vs = self.val
+        self._sp_()
+        if self.failed:
+            return
+        self._element_list__s3_()
+        if self.failed:
+            return
+        self._succeed([v] + vs)
+
+    def _element_list__s1_l_p_(self):
+        self._sp_()
+        if self.failed:
+            return
+        self._ch(',')
+        if self.failed:
+            return
+        self._sp_()
+        if self.failed:
+            return
+        self._value_()
+
+    def _element_list__s3_(self):
+        self._opt(self._element_list__s3_o_)
+
+    def _element_list__s3_o_(self):
+        self._ch(',')
+
+    def _member_list_(self):
+        self._member_()
+        if self.failed:
+            return
+        m = self.val
+        self._star(self._member_list__s1_l_p_)
+        if self.failed:
+            return
+        ms = self.val
+        self._sp_()
+        if self.failed:
+            return
+        self._member_list__s3_()
+        if self.failed:
+            return
+        self._succeed([m] + ms)
+
+    def _member_list__s1_l_p_(self):
+        self._sp_()
+        if self.failed:
+            return
+        self._ch(',')
+        if self.failed:
+            return
+        self._sp_()
+        if self.failed:
+            return
+        self._member_()
+
+    def _member_list__s3_(self):
+        self._opt(self._member_list__s3_o_)
+
+    def _member_list__s3_o_(self):
+        self._ch(',')
+
+    def _member_(self):
+        p = self.pos
+        self._member__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._member__c1_()
+
+    def _member__c0_(self):
+        self._string_()
+        if self.failed:
+            return
+        k = self.val
+        self._sp_()
+        if self.failed:
+            return
+        self._ch(':')
+        if self.failed:
+            return
+        self._sp_()
+        if self.failed:
+            return
+        self._value_()
+        if self.failed:
+            return
+        v = self.val
+        self._succeed([k, v])
+
+    def _member__c1_(self):
+        self._ident_()
+        if self.failed:
+            return
+        k = self.val
+        self._sp_()
+        if self.failed:
+            return
+        self._ch(':')
+        if self.failed:
+            return
+        self._sp_()
+        if self.failed:
+            return
+        self._value_()
+        if self.failed:
+            return
+        v = self.val
+        self._succeed([k, v])
+
+    def _ident_(self):
+        self._id_start_()
+        if self.failed:
+            return
+        hd = self.val
+        self._star(self._id_continue_)
+        if self.failed:
+            return
+        tl = self.val
+        self._succeed(self._join('', [hd] + tl))
+
+    def _id_start_(self):
+        p = self.pos
+        self._ascii_id_start_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._other_id_start_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._id_start__c2_()
+
+    def _id_start__c2_(self):
+        self._bslash_()
+        if self.failed:
+            return
+        self._unicode_esc_()
+
+    def _ascii_id_start_(self):
+        p = self.pos
+        self._ascii_id_start__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._ascii_id_start__c1_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._ascii_id_start__c2_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._ascii_id_start__c3_()
+
+    def _other_id_start_(self):
+        p = self.pos
+        self._other_id_start__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._other_id_start__c1_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._other_id_start__c2_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._other_id_start__c3_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._other_id_start__c4_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._other_id_start__c5_()
+
+    def _other_id_start__c0_(self):
+        self._anything_()
+        if self.failed:
+            return
+        x = self.val
+        if not self._is_unicat(x, 'Ll'):
+            self._fail()
+            return
+        self._succeed(x)
+
+    def _other_id_start__c1_(self):
+        self._anything_()
+        if self.failed:
+            return
+        x = self.val
+        if not self._is_unicat(x, 'Lm'):
+            self._fail()
+            return
+        self._succeed(x)
+
+    def _other_id_start__c2_(self):
+        self._anything_()
+        if self.failed:
+            return
+        x = self.val
+        if not self._is_unicat(x, 'Lo'):
+            self._fail()
+            return
+        self._succeed(x)
+
+    def _other_id_start__c3_(self):
+        self._anything_()
+        if self.failed:
+            return
+        x = self.val
+        if not self._is_unicat(x, 'Lt'):
+            self._fail()
+            return
+        self._succeed(x)
+
+    def _other_id_start__c4_(self):
+        self._anything_()
+        if self.failed:
+            return
+        x = self.val
+        if not self._is_unicat(x, 'Lu'):
+            self._fail()
+            return
+        self._succeed(x)
+
+    def _other_id_start__c5_(self):
+        self._anything_()
+        if self.failed:
+            return
+        x = self.val
+        if not self._is_unicat(x, 'Nl'):
+            self._fail()
+            return
+        self._succeed(x)
+
+    def _id_continue_(self):
+        p = self.pos
+        self._ascii_id_start_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._digit_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._other_id_start_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._id_continue__c3_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._id_continue__c4_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._id_continue__c5_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._id_continue__c6_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._id_continue__c7_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._id_continue__c8_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._id_continue__c9_()
+
+    def _id_continue__c3_(self):
+        self._anything_()
+        if self.failed:
+            return
+        x = self.val
+        if not self._is_unicat(x, 'Mn'):
+            self._fail()
+            return
+        self._succeed(x)
+
+    def _id_continue__c4_(self):
+        self._anything_()
+        if self.failed:
+            return
+        x = self.val
+        if not self._is_unicat(x, 'Mc'):
+            self._fail()
+            return
+        self._succeed(x)
+
+    def _id_continue__c5_(self):
+        self._anything_()
+        if self.failed:
+            return
+        x = self.val
+        if not self._is_unicat(x, 'Nd'):
+            self._fail()
+            return
+        self._succeed(x)
+
+    def _id_continue__c6_(self):
+        self._anything_()
+        if self.failed:
+            return
+        x = self.val
+        if not self._is_unicat(x, 'Pc'):
+            self._fail()
+            return
+        self._succeed(x)
+
+    def _id_continue__c7_(self):
+        self._bslash_()
+        if self.failed:
+            return
+        self._unicode_esc_()
+
+    def _num_literal_(self):
+        p = self.pos
+        self._num_literal__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._num_literal__c1_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._num_literal__c2_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._hex_literal_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._num_literal__c4_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._num_literal__c5_()
+
+    def _num_literal__c0_(self):
+        self._ch('-')
+        if self.failed:
+            return
+        self._num_literal_()
+        if self.failed:
+            return
+        n = self.val
+        self._succeed('-' + n)
+
+    def _num_literal__c1_(self):
+        self._ch('+')
+        if self.failed:
+            return
+        self._num_literal_()
+        if self.failed:
+            return
+        n = self.val
+        self._succeed(n)
+
+    def _num_literal__c2_(self):
+        self._dec_literal_()
+        if self.failed:
+            return
+        d = self.val
+        self._not(self._id_start_)
+        if self.failed:
+            return
+        self._succeed(d)
+
+    def _dec_literal_(self):
+        p = self.pos
+        self._dec_literal__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._dec_literal__c1_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._dec_literal__c2_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._dec_literal__c3_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._dec_literal__c4_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._dec_literal__c5_()
+
+    def _dec_literal__c0_(self):
+        self._dec_int_lit_()
+        if self.failed:
+            return
+        d = self.val
+        self._frac_()
+        if self.failed:
+            return
+        f = self.val
+        self._exp_()
+        if self.failed:
+            return
+        e = self.val
+        self._succeed(d + f + e)
+
+    def _dec_literal__c1_(self):
+        self._dec_int_lit_()
+        if self.failed:
+            return
+        d = self.val
+        self._frac_()
+        if self.failed:
+            return
+        f = self.val
+        self._succeed(d + f)
+
+    def _dec_literal__c2_(self):
+        self._dec_int_lit_()
+        if self.failed:
+            return
+        d = self.val
+        self._exp_()
+        if self.failed:
+            return
+        e = self.val
+        self._succeed(d + e)
+
+    def _dec_literal__c3_(self):
+        self._dec_int_lit_()
+        if self.failed:
+            return
+        d = self.val
+        self._succeed(d)
+
+    def _dec_literal__c4_(self):
+        self._frac_()
+        if self.failed:
+            return
+        f = self.val
+        self._exp_()
+        if self.failed:
+            return
+        e = self.val
+        self._succeed(f + e)
+
+    def _dec_literal__c5_(self):
+        self._frac_()
+        if self.failed:
+            return
+        f = self.val
+        self._succeed(f)
+
+    def _dec_int_lit_(self):
+        p = self.pos
+        self._dec_int_lit__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._dec_int_lit__c1_()
+
+    def _dec_int_lit__c0_(self):
+        self._ch('0')
+        if self.failed:
+            return
+        self._not(self._digit_)
+        if self.failed:
+            return
+        self._succeed('0')
+
+    def _dec_int_lit__c1_(self):
+        self._nonzerodigit_()
+        if self.failed:
+            return
+        d = self.val
+        self._star(self._digit_)
+        if self.failed:
+            return
+        ds = self.val
+        self._succeed(d + self._join('', ds))
+
+    def _hex_literal_(self):
+        self._hex_literal__s0_()
+        if self.failed:
+            return
+        self._plus(self._hex_)
+        if self.failed:
+            return
+        hs = self.val
+        self._succeed('0x' + self._join('', hs))
+
+    def _hex_literal__s0_(self):
+        p = self.pos
+        self._str('0x')
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._str('0X')
+
+    def _hex_(self):
+        p = self.pos
+        self._hex__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._hex__c1_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._digit_()
+
+    def _frac_(self):
+        self._ch('.')
+        if self.failed:
+            return
+        self._star(self._digit_)
+        if self.failed:
+            return
+        ds = self.val
+        self._succeed('.' + self._join('', ds))
+
+    def _exp_(self):
+        p = self.pos
+        self._exp__c0_()
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._exp__c1_()
+
+    def _exp__c0_(self):
+        self._exp__c0__s0_()
+        if self.failed:
+            return
+        self._exp__c0__s1_l_()
+        if self.failed:
+            return
+        s = self.val
+        self._star(self._digit_)
+        if self.failed:
+            return
+        ds = self.val
+        self._succeed('e' + s + self._join('', ds))
+
+    def _exp__c0__s0_(self):
+        p = self.pos
+        self._ch('e')
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._ch('E')
+
+    def _exp__c0__s1_l_(self):
+        p = self.pos
+        self._ch('+')
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._ch('-')
+
+    def _exp__c1_(self):
+        self._exp__c1__s0_()
+        if self.failed:
+            return
+        self._star(self._digit_)
+        if self.failed:
+            return
+        ds = self.val
+        self._succeed('e' + self._join('', ds))
+
+    def _exp__c1__s0_(self):
+        p = self.pos
+        self._ch('e')
+        if not self.failed:
+            return
+        self._rewind(p)
+        self._ch('E')
@@ -0,0 +1,352 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parsing only the values at given paths in a document.
+
+A path is either a JSON Pointer (RFC 6901), e.g. `/servers/3/host`, or
+a dotted path, e.g. `servers.3.host`; the empty string is the whole
+document. Either way, a path is a sequence of tokens, each of which is
+an object key, or the index of an element of an array (in decimal,
+without leading zeros).
+
+`Selector` is a `FastParser` that parses only the objects and arrays
+on the way to the requested values, and the values themselves. Every
+other value is passed over with `scanner.skip_value()`, which finds
+where a value ends without building anything, and without checking
+that the value is valid; if the selector is given the document's
+`structural.StructuralIndex`, the end of an object or array is looked
+up in that instead. `Selector.get()` looks up a single value, and stops
+as soon as it has been parsed, and `Selector.index()` finds where each
+of the values down to a given depth starts and ends.
+"""
+
+import re
+
+from .fast_parser import FastParser, _DepthError, _ParseError
+from .scanner import ScanError, skip_value
+
+
+_INDEX_RE = re.compile(r'0|[1-9][0-9]*')
+
+_POINTER_ESCAPE_RE = re.compile(r'~(?![01])')
+
+# Returned by `Selector.get()` if the path isn't in the document.
+MISSING = object()
+
+
+def parse_path(path):
+    """Returns the tuple of tokens in `path`."""
+    if not isinstance(path, str):
+        raise TypeError(f'Paths must be strings, not {type(path).__name__}')
+    if path == '':
+        return ()
+    if path.startswith('/'):
+        tokens = path[1:].split('/')
+        if any(_POINTER_ESCAPE_RE.search(t) for t in tokens):
+            raise ValueError(f'Invalid JSON Pointer "{path}"')
+        return tuple(t.replace('~1', '/').replace('~0', '~') for t in tokens)
+    return tuple(path.split('.'))
+
+
+def make_pointer(tokens):
+    """Returns the JSON Pointer for the tokens in `tokens`."""
+    return ''.join(
+        '/' + t.replace('~', '~0').replace('/', '~1') for t in tokens
+    )
+
+
+def child(obj, token):
+    """Returns the member or element of `obj` that `token` refers to, and
+    raises a LookupError if there isn't one."""
+    if isinstance(obj, dict):
+        return obj[token]
+    if isinstance(obj, list) and _INDEX_RE.fullmatch(token):
+        return obj[int(token)]
+    raise LookupError(token)
+
+
+def _trie(paths):
+    # Each node is a tuple of the paths that end at it and a dict of its
+    # children.
+    root = ([], {})
+    for path in paths:
+        node = root
+        for token in parse_path(path):
+            node = node[1].setdefault(token, ([], {}))
+        node[0].append(path)
+    return root
+
+
+def _project(v, node, found):
+    paths, children = node
+    for path in paths:
+        found[path] = v
+    for token, child_node in children.items():
+        try:
+            c = child(v, token)
+        except LookupError:
+            continue
+        _project(c, child_node, found)
+
+
+class Selector(FastParser):
+    def __init__(
+        self,
+        msg,
+        fname,
+        *,
+        reject_duplicates=False,
+        structure=None,
+        **kwargs,
+    ):
+        super().__init__(msg, fname, **kwargs)
+        self._reject_duplicates = reject_duplicates
+
+        # A `structural.StructuralIndex` of `msg` to skip values with,
+        # if it is worth building one.
+        self._structure = structure
+
+    def select(self, paths):
+        """Parses the values at `paths`, and returns the same tuple as
+        `parse()`, with a dict mapping each path that was found to its
+        value. Objects are assumed to be plain dicts, so `dictify` is
+        only called for the objects in the values that are parsed."""
+        root = _trie(paths)
+        return self._parse(lambda: self._select_document(root))
+
+    def get(self, path):
+        """Parses the value at `path`, and returns the same tuple as
+        `parse()`, with `MISSING` as the value if there is no value at
+        that path. Nothing after the value is looked at, and of the
+        objects and arrays leading to it, only their members up to the
+        ones on the path; if an object has several members with the
+        same key, the first one is used."""
+        tokens = parse_path(path)
+        return self._parse(lambda: self._get(tokens))
+
+    def index(self, depth):
+        """Finds the values in the document down to `depth` levels below
+        the top, without parsing them, and returns the same tuple as
+        `parse()`, with a dict mapping the JSON Pointer of each value to
+        a tuple of where it starts and ends. Only the objects and arrays
+        above `depth` are checked."""
+        return self._parse(lambda: self._index_document(depth))
+
+    def _index_document(self, depth):
+        self._sp()
+        entries = {}
+        self._index('', depth, entries)
+        self._sp()
+        if self.pos != self.end:
+            raise _ParseError(self.pos)
+        return entries
+
+    def _index(self, pointer, depth, entries):
+        start = self.pos
+        ch = self._peek()
+        if depth and ch == '{':
+            self.pos += 1
+            self._sp()
+            while self._peek() != '}':
+                k = self._key()
+                p = pointer + '/' + k.replace('~', '~0').replace('/', '~1')
+                if p in entries:
+                    # As in a dict, the last of several members with the
+                    # same key wins.
+                    for q in [q for q in entries if q.startswith(p + '/')]:
+                        del entries[q]
+                self._index(p, depth - 1, entries)
+                self._sp()
+                if self._peek() != ',':
+                    break
+                self.pos += 1
+                self._sp()
+            self._expect('}')
+        elif depth and ch == '[':
+            self.pos += 1
+            self._sp()
+            i = 0
+            while self._peek() != ']':
+                self._index(f'{pointer}/{i}', depth - 1, entries)
+                i += 1
+                self._sp()
+                if self._peek() != ',':
+                    break
+                self.pos += 1
+                self._sp()
+            self._expect(']')
+        else:
+            self._skip()
+        entries[pointer] = (start, self.pos)
+
+    def _get(self, tokens):
+        self._sp()
+        max_depth = self._max_depth
+        for depth, token in enumerate(tokens):
+            ch = self._peek()
+            if ch not in ('{', '['):
+                return MISSING
+            if max_depth is not None and depth >= max_depth:
+                raise _DepthError(self.pos)
+            if ch == '{':
+                found = self._find_member(token)
+            else:
+                found = self._find_element(token)
+            if not found:
+                return MISSING
+        if max_depth is not None:
+            self._max_depth = max(max_depth - len(tokens), 0)
+        try:
+            return self._value()
+        finally:
+            self._max_depth = max_depth
+
+    def _find_member(self, token):
+        # Moves to the value of the member with the key `token`, and
+        # returns whether there is one.
+        self.pos += 1
+        self._sp()
+        if self._peek() == '}':
+            return False
+        while True:
+            if self._key() == token:
+                return True
+            self._skip()
+            self._sp()
+            if self._peek() != ',':
+                break
+            self.pos += 1
+            self._sp()
+            if self._peek() == '}':
+                return False
+        self._expect('}')
+        return False
+
+    def _find_element(self, token):
+        # Moves to the element at index `token`, and returns whether
+        # there is one.
+        if not _INDEX_RE.fullmatch(token):
+            return False
+        self.pos += 1
+        self._sp()
+        for _ in range(int(token)):
+            if self._peek() == ']':
+                return False
+            self._skip()
+            self._sp()
+            if self._peek() != ',':
+                self._expect(']')
+                return False
+            self.pos += 1
+            self._sp()
+        return self._peek() != ']'
+
+    def _select_document(self, root):
+        self._sp()
+        found = self._select(root, 0)
+        self._sp()
+        if self.pos != self.end:
+            raise _ParseError(self.pos)
+        return found
+
+    def _select(self, node, depth):
+        # Returns a dict of the paths found in the value at `pos`.
+        paths, children = node
+        if paths:
+            max_depth = self._max_depth
+            if max_depth is not None:
+                self._max_depth = max(max_depth - depth, 0)
+            try:
+                v = self._value()
+            finally:
+                self._max_depth = max_depth
+            found = {}
+            _project(v, node, found)
+            return found
+
+        ch = self._peek()
+        if children and ch in ('{', '['):
+            if self._max_depth is not None and depth >= self._max_depth:
+                raise _DepthError(self.pos)
+            if ch == '{':
+                return self._select_members(children, depth + 1)
+            return self._select_elements(children, depth + 1)
+        self._skip()
+        return {}
+
+    def _select_members(self, children, depth):
+        self.pos += 1
+        self._sp()
+        found_by_key = {}
+        keys = set()
+        if self._peek() != '}':
+            while True:
+                k = self._key()
+                if self._reject_duplicates:
+                    if k in keys:
+                        raise ValueError(
+                            f'Duplicate key "{k}" found in object'
+                        )
+                    keys.add(k)
+                node = children.get(k)
+                if node is None:
+                    self._skip()
+                else:
+                    # As in a dict, the last of several members with the
+                    # same key wins.
+                    found_by_key[k] = self._select(node, depth)
+                self._sp()
+                if self._peek() != ',':
+                    break
+                self.pos += 1
+                self._sp()
+                if self._peek() == '}':
+                    break
+        self._expect('}')
+        found = {}
+        for f in found_by_key.values():
+            found.update(f)
+        return found
+
+    def _select_elements(self, children, depth):
+        self.pos += 1
+        self._sp()
+        found = {}
+        i = 0
+        if self._peek() != ']':
+            while True:
+                node = children.get(str(i))
+                if node is None:
+                    self._skip()
+                else:
+                    found.update(self._select(node, depth))
+                i += 1
+                self._sp()
+                if self._peek() != ',':
+                    break
+                self.pos += 1
+                self._sp()
+                if self._peek() == ']':
+                    break
+        self._expect(']')
+        return found
+
+    def _skip(self):
+        try:
+            if self._structure is None:
+                self.pos = skip_value(self.msg, self.pos)
+            else:
+                self.pos = self._structure.skip_value(self.pos)
+        except ScanError as e:
+            raise _ParseError(e.pos) from e
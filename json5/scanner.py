@@ -0,0 +1,440 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A regex-driven JSON5 token scanner.
+
+This is modeled on `json.scanner.py_make_scanner()` and the pure-Python
+helpers in `json.decoder`: whole tokens (numbers, runs of string
+characters, identifiers, runs of whitespace and comments) are consumed
+with precompiled regular expressions, and a small dispatch function
+decides what to scan next based on the first character of each value.
+Python objects are built directly as values are recognized.
+
+The scanner accepts exactly the same language as `json5.g`. It does not
+produce error messages itself; when it raises a `ScanError`, the caller
+is expected to hand the input to the reference parser for a diagnostic.
+"""
+
+import re
+
+from . import unicat
+
+
+class ScanError(ValueError):
+    def __init__(self, pos):
+        super().__init__(f'Unexpected input at position {pos}')
+        self.pos = pos
+
+
+class DepthError(ScanError):
+    """Raised by the scanner when values are nested more deeply than its
+    `max_depth`."""
+
+
+FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
+
+NUMBER_RE = re.compile(
+    r"""
+    ([-+]*)                                # any number of signs
+    (?:
+        (0[xX][0-9a-fA-F]+)                # a hex literal
+      | (Infinity|NaN)                     # a named constant
+      | (0(?![0-9])|[1-9][0-9]*)?          # the integer part
+        (\.[0-9]*)?                        # the fraction
+        (?:[eE]([-+]?[0-9]*))?             # the exponent
+    )
+    """,
+    FLAGS,
+)
+
+STRINGCHUNK = {
+    q: re.compile(rf'([^{q}\\\n\r\u2028\u2029]*)([{q}\\\n\r\u2028\u2029])')
+    for q in ('"', "'")
+}
+
+BACKSLASH = {
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+    'v': '\v',
+    "'": "'",
+    '"': '"',
+    '\\': '\\',
+}
+
+EOLS = ('\r', '\n', '\u2028', '\u2029')
+
+HEX2_RE = re.compile(r'[0-9a-fA-F]{2}')
+
+HEX4_RE = re.compile(r'[0-9a-fA-F]{4}')
+
+IDENT_RE = re.compile(r'[a-zA-Z$_][a-zA-Z0-9$_]*')
+
+ID_CONTINUE_RE = re.compile(r'[a-zA-Z0-9$_\u200c\u200d]+')
+
+WHITESPACE_RE = re.compile(
+    r"""
+    (?:
+        [ \t\n\r\v\f\xa0\ufeff\u2028\u2029]+
+      | //[^\n\r\u2028\u2029]*
+    )*
+    """,
+    FLAGS,
+)
+
+
+def skip_whitespace(s, end, _w=WHITESPACE_RE.match):
+    """Returns the index of the first character at or after `end` that
+    isn't whitespace or part of a comment.
+
+    This is the `sp` rule in `json5.g`, and all of the parsers use it.
+    Runs of ASCII whitespace, line terminators and `//` comments are
+    consumed with a single regex match, block comments are skipped by
+    searching for the closing `*/`, and only non-ASCII characters are
+    looked up to see if they are in the `Zs` category."""
+    # Most tokens aren't followed by whitespace; a printable ASCII
+    # character other than '/' can't start any.
+    ch = s[end : end + 1]
+    if '!' <= ch <= '~' and ch != '/':
+        return end
+    while True:
+        end = _w(s, end).end()
+        ch = s[end : end + 1]
+        if ch == '/':
+            if s[end + 1 : end + 2] != '*':
+                return end
+            close = s.find('*/', end + 2)
+            if close == -1:
+                return end
+            end = close + 2
+        elif ch > '\x7f' and unicat.lookup(ch) & unicat.SPACE:
+            end += 1
+        else:
+            return end
+
+
+# `_b` binds the escape table to a local, as `json.decoder` does; it is
+# never mutated.
+def scanstring(s, end, quote, strict=True, _b=BACKSLASH):  # pylint: disable=dangerous-default-value
+    """Scan the string `s` for a JSON5 string. `end` is the index of the
+    character after the `quote` that started the string.
+
+    Returns a tuple of the decoded string and the index of the character
+    after the end quote."""
+    _m = STRINGCHUNK[quote].match
+    chunk = _m(s, end)
+    if chunk is not None and chunk.group(2) == quote:
+        # The common case of a string with no escapes in it is a single
+        # slice of the input.
+        return chunk.group(1), chunk.end()
+    chunks = []
+    _append = chunks.append
+    while True:
+        if chunk is None:
+            raise ScanError(len(s))
+        end = chunk.end()
+        content, terminator = chunk.groups()
+        if content:
+            _append(content)
+        if terminator == quote:
+            break
+        if terminator != '\\':
+            # Raw line terminators are only allowed when not strict, and
+            # U+2028 and U+2029 are never allowed.
+            if strict or terminator > '\x1f':
+                raise ScanError(end - 1)
+            _append(terminator)
+            chunk = _m(s, end)
+            continue
+        esc = s[end : end + 1]
+        if esc in _b:
+            char = _b[esc]
+            end += 1
+        elif esc in EOLS:
+            # A line continuation.
+            char = ''
+            end += 2 if s.startswith('\r\n', end) else 1
+        elif esc == '0':
+            if '0' <= s[end + 1 : end + 2] <= '9':
+                raise ScanError(end + 1)
+            char = '\x00'
+            end += 1
+        elif esc in ('x', 'u'):
+            m = (HEX2_RE if esc == 'x' else HEX4_RE).match(s, end + 1)
+            if m is None:
+                raise ScanError(end + 1)
+            char = chr(int(m.group(), base=16))
+            end = m.end()
+        elif esc == '' or '1' <= esc <= '9':
+            raise ScanError(end)
+        else:
+            char = esc
+            end += 1
+        _append(char)
+        chunk = _m(s, end)
+    return ''.join(chunks), end
+
+
+def scan_ident(s, end):
+    """Scan the string `s` for an unquoted object key starting at `end`.
+
+    Returns a tuple of the key and the index of the following character."""
+    m = IDENT_RE.match(s, end)
+    if m is not None:
+        end = m.end()
+        if end == len(s) or (s[end] < '\x80' and s[end] != '\\'):
+            return m.group(), end
+        chars = [m.group()]
+    else:
+        ch, end = _scan_id_char(s, end, unicat.ID_START)
+        if ch is None:
+            raise ScanError(end)
+        chars = [ch]
+    bmp = unicat.bmp_table()
+    _m = ID_CONTINUE_RE.match
+    while True:
+        m = _m(s, end)
+        if m is not None:
+            chars.append(m.group())
+            end = m.end()
+        ch = s[end : end + 1]
+        if (
+            ch > '\x7f'
+            and (bmp[ord(ch)] if ch < '\U00010000' else unicat.lookup(ch))
+            & unicat.ID_CONTINUE
+        ):
+            chars.append(ch)
+            end += 1
+        elif ch == '\\':
+            ch, end = _scan_id_char(s, end, unicat.ID_CONTINUE)
+            if ch is None:
+                return ''.join(chars), end
+            chars.append(ch)
+        else:
+            return ''.join(chars), end
+
+
+def _scan_id_char(s, end, flag):
+    ch = s[end : end + 1]
+    if ch == '\\' and s[end + 1 : end + 2] == 'u':
+        m = HEX4_RE.match(s, end + 2)
+        if m is None:
+            return None, end
+        return chr(int(m.group(), base=16)), m.end()
+    if ('a' <= ch <= 'z' or 'A' <= ch <= 'Z') or ch in ('$', '_'):
+        return ch, end + 1
+    if ch > '\x7f' and unicat.lookup(ch) & flag:
+        return ch, end + 1
+    return None, end
+
+
+def is_id_start(s, end):
+    return _scan_id_char(s, end, unicat.ID_START)[0] is not None
+
+
+STRING_RE = {
+    '"': re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', FLAGS),
+    "'": re.compile(r"'[^'\\]*(?:\\.[^'\\]*)*'", FLAGS),
+}
+
+# The characters that JSON5 treats as whitespace (the `ws` and `eol`
+# rules), for use in a regex character class. They are spelled out since
+# `\s` leaves out U+FEFF and includes characters that JSON5 doesn't
+# treat as whitespace.
+WHITESPACE_CHARS = (
+    r' \t\n\r\v\f\xa0\ufeff\u2028\u2029\u1680\u2000-\u200a\u202f'
+    r'\u205f\u3000'
+)
+
+# A number, identifier or literal: a run of characters other than
+# whitespace, punctuation, slashes and quotes.
+SCALAR_RE = re.compile('[^' + WHITESPACE_CHARS + r',:\[\]{}/"\']+')
+
+# A run of text inside an object or array that contains no brackets or
+# comments, including any complete strings.
+SKIP_RE = re.compile(
+    r"""
+    (?:
+        [^"'\[\]{}/]+
+      | "[^"\\]*(?:\\.[^"\\]*)*"
+      | '[^'\\]*(?:\\.[^'\\]*)*'
+    )*
+    """,
+    FLAGS,
+)
+
+
+def skip_value(s, end):
+    """Returns the index of the first character after the value that
+    starts at `end`, without parsing it.
+
+    Only enough of the value is looked at to find where it ends: runs of
+    text containing no brackets or comments (including any strings) are
+    skipped with a single regex match, brackets are counted, and
+    comments are skipped as whitespace. No Python objects are created
+    for the contents of the value, and its contents are not checked, so
+    the value may turn out to be invalid when it is parsed. A
+    `ScanError` is raised if the end of the value can't be found."""
+    ch = s[end : end + 1]
+    if ch in ('"', "'"):
+        m = STRING_RE[ch].match(s, end)
+        if m is None:
+            raise ScanError(end)
+        return m.end()
+    if ch not in ('[', '{'):
+        m = SCALAR_RE.match(s, end)
+        if m is None:
+            raise ScanError(end)
+        return m.end()
+    depth = 0
+    while True:
+        end = SKIP_RE.match(s, end).end()
+        ch = s[end : end + 1]
+        if ch in ('[', '{'):
+            depth += 1
+            end += 1
+        elif ch in (']', '}'):
+            depth -= 1
+            end += 1
+            if depth == 0:
+                return end
+        elif ch == '/':
+            i = skip_whitespace(s, end)
+            if i == end:
+                raise ScanError(end)
+            end = i
+        else:
+            # The end of the input, or a string that isn't terminated.
+            raise ScanError(end)
+
+
+def parse_object(s, end, strict, scan_once, dictify, _w=skip_whitespace):
+    pairs = []
+    _append = pairs.append
+    end = _w(s, end)
+    nextchar = s[end : end + 1]
+    if nextchar == '}':
+        return dictify(pairs), end + 1
+    while True:
+        if nextchar in ('"', "'"):
+            key, end = scanstring(s, end + 1, nextchar, strict)
+        else:
+            key, end = scan_ident(s, end)
+        end = _w(s, end)
+        if s[end : end + 1] != ':':
+            raise ScanError(end)
+        value, end = scan_once(s, _w(s, end + 1))
+        _append((key, value))
+        end = _w(s, end)
+        nextchar = s[end : end + 1]
+        end += 1
+        if nextchar == '}':
+            break
+        if nextchar != ',':
+            raise ScanError(end - 1)
+        end = _w(s, end)
+        nextchar = s[end : end + 1]
+        if nextchar == '}':
+            end += 1
+            break
+    return dictify(pairs), end
+
+
+def parse_array(s, end, scan_once, _w=skip_whitespace):
+    values = []
+    _append = values.append
+    end = _w(s, end)
+    if s[end : end + 1] == ']':
+        return values, end + 1
+    while True:
+        value, end = scan_once(s, end)
+        _append(value)
+        end = _w(s, end)
+        nextchar = s[end : end + 1]
+        end += 1
+        if nextchar == ']':
+            break
+        if nextchar != ',':
+            raise ScanError(end - 1)
+        end = _w(s, end)
+        if s[end : end + 1] == ']':
+            end += 1
+            break
+    return values, end
+
+
+def make_scanner(
+    *,
+    dictify,
+    parse_float,
+    parse_int,
+    parse_constant,
+    strict,
+    max_depth=None,
+):
+    """Returns a `scan_once(string, idx)` function that scans a single
+    JSON5 value starting at `idx` and returns a tuple of the value and the
+    index of the character following it.
+
+    Objects and arrays are scanned recursively; if they are nested more
+    than `max_depth` levels deep, a `DepthError` is raised."""
+    match_number = NUMBER_RE.match
+    depth = 0
+
+    def scan_once(string, idx):
+        nonlocal depth
+        nextchar = string[idx : idx + 1]
+        if nextchar in ('"', "'"):
+            return scanstring(string, idx + 1, nextchar, strict)
+        if nextchar in ('{', '['):
+            if max_depth is not None and depth >= max_depth:
+                raise DepthError(idx)
+            depth += 1
+            try:
+                if nextchar == '{':
+                    return parse_object(
+                        string, idx + 1, strict, scan_once, dictify
+                    )
+                return parse_array(string, idx + 1, scan_once)
+            finally:
+                depth -= 1
+        if nextchar == 'n' and string[idx : idx + 4] == 'null':
+            return None, idx + 4
+        if nextchar == 't' and string[idx : idx + 4] == 'true':
+            return True, idx + 4
+        if nextchar == 'f' and string[idx : idx + 5] == 'false':
+            return False, idx + 5
+
+        m = match_number(string, idx)
+        signs, hex_lit, constant, integer, frac, exp = m.groups()
+        end = m.end()
+        sign = signs.replace('+', '')
+        if hex_lit:
+            return parse_int(sign + '0x' + hex_lit[2:], base=16), end
+        if constant:
+            return parse_constant(sign + constant), end
+        if not integer and not frac:
+            raise ScanError(end)
+        if is_id_start(string, end):
+            raise ScanError(end)
+        if frac is None and exp is None:
+            return parse_int(sign + integer), end
+        v = sign + (integer or '') + (frac or '')
+        if exp is not None:
+            v += 'e' + exp
+        return parse_float(v), end
+
+    return scan_once
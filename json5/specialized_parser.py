@@ -0,0 +1,241 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Specialized variants of the generated parser.
+
+These are subclasses of `optimized_parser.OptimizedParser`, so they
+use its faster versions of the generated rules.
+
+The generated `Parser` looks `_strict` up in its global variables
+whenever a string character can't be matched by any of the other
+`sqchar`/`dqchar` alternatives, i.e. at the closing quote of every
+string it scans character by character. Since `_strict` can't change
+during a parse, `StrictParser` and `NonStrictParser` fold the
+`~?(_strict) '\\x00'..'\\x1f'` alternatives into the code for one value
+of the flag or the other.
+
+The generated `Parser` also keeps track of the furthest position at
+which any alternative failed, so that it can report where a document
+stops being valid. Most documents are valid, so the lean variants of
+the two parsers skip that bookkeeping, and only if the parse fails do
+they parse the document again with the corresponding diagnostic parser
+to produce the error message.
+
+The generated `Parser` doesn't memoize any rules, so an alternative that
+fails after matching a prefix of the input causes the next alternative
+to match that prefix again. `dec_literal`, for example, tries six
+alternatives in turn, and each of the first four starts by matching
+`dec_int_lit`, so the digits of an integer are scanned four times. The
+memoizing variants cache the results of the rules that are re-parsed
+this way (see `_MemoMixin`), which makes parsing numbers linear in their
+length again, at the cost of some bookkeeping for every call to those
+rules.
+
+`reference_parser()` picks the variant to use once per parse.
+"""
+
+import functools
+
+from .optimized_parser import OptimizedParser
+from .scanner import skip_whitespace
+
+
+class _SpecializedParser(OptimizedParser):
+    _strict = None
+
+    def __init__(self, msg, fname):
+        super().__init__(msg, fname)
+        self._start = None
+
+    def parse(self, global_vars=None):
+        return super().parse({**(global_vars or {}), '_strict': self._strict})
+
+    def parse_value(self, pos):
+        """Parses a single value starting at `pos`, rather than a whole
+        document, and returns the same tuple as `parse()`; on success,
+        the position is the one following the value."""
+        self._start = pos
+        self._global_vars = {'_strict': self._strict}
+        self.pos = pos
+        self._value_()
+        if self.failed:
+            return None, self._err_str(), self.errpos
+        return self.val, None, self.pos
+
+    def error_message(self):
+        """Returns the message for the error at `errpos`, once a parse
+        has failed."""
+        return self._err_str()
+
+
+class StrictParser(_SpecializedParser):
+    """A `Parser` that always parses with `_strict` set."""
+
+    _strict = True
+
+    def _sqchar__c3_(self):
+        # `?(_strict)` always succeeds, so the negative lookahead fails.
+        self._fail()
+
+    def _dqchar__c3_(self):
+        self._fail()
+
+
+class NonStrictParser(_SpecializedParser):
+    """A `Parser` that always parses with `_strict` cleared."""
+
+    _strict = False
+
+    def _sqchar__c3_(self):
+        # `?(_strict)` always fails, so the negative lookahead succeeds.
+        # The alternatives before this one have already failed at this
+        # position, so there is no errpos to update.
+        self._range('\x00', '\x1f')
+
+    def _dqchar__c3_(self):
+        self._range('\x00', '\x1f')
+
+
+class _LeanMixin:
+    # The parser that keeps track of failures, to parse the document
+    # again with; set by each of the lean parsers.
+    _diagnostic_cls: type
+
+    def _err_str(self):
+        # `parse()` calls this before it reads `errpos`, so this is where
+        # the document is parsed again to find out where it fails.
+        parser = self._diagnostic_cls(self.msg, self.fname)
+        if self._start is None:
+            parser.parse()
+        else:
+            parser.parse_value(self._start)
+        self.errpos = parser.errpos
+        return parser.error_message()
+
+    def _fail(self):
+        # Nothing looks at `val` after a failure, and `errpos` is only
+        # needed for error messages.
+        self.failed = True
+
+    def _not(self, rule):
+        p = self.pos
+        rule()
+        if self.failed:
+            self._succeed(None, p)
+        else:
+            self.pos = p
+            self.failed = True
+
+    def _sp_(self):
+        self._succeed([], skip_whitespace(self.msg, self.pos))
+
+
+class LeanStrictParser(_LeanMixin, StrictParser):
+    """A `StrictParser` that only tracks failures to report an error."""
+
+    _diagnostic_cls = StrictParser
+
+
+class LeanNonStrictParser(_LeanMixin, NonStrictParser):
+    """A `NonStrictParser` that only tracks failures to report an error."""
+
+    _diagnostic_cls = NonStrictParser
+
+
+# The rules whose results are cached by the memoizing parsers. Each of
+# them is called more than once at the same position when `dec_literal`
+# backtracks, and each of them returns a string, so a cached value can't
+# be mutated by the caller.
+_MEMOIZED_RULES = ('_dec_int_lit_', '_frac_', '_exp_')
+
+# The most positions cached for any one rule.
+_MAX_MEMO_ENTRIES = 16
+
+
+class _MemoMixin:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Wrap the rules of the parser class this is mixed into.
+        for name in _MEMOIZED_RULES:
+            setattr(
+                cls,
+                name,
+                functools.partialmethod(
+                    cls._memoized, name, getattr(cls, name)
+                ),
+            )
+
+    def _memoized(self, name, rule):
+        # The cache for each rule is keyed by position. A rule is only
+        # called again at the same position after a nearby alternative
+        # has failed, so once the rule is called at a position past all
+        # of the cached ones, the parse has moved on and the cache is
+        # emptied; that keeps it bounded regardless of the document's
+        # size.
+        cache = self._cache.get(name)
+        if cache is None:
+            cache = self._cache[name] = {}
+        p = self.pos
+        entry = cache.get(p)
+        if entry is not None:
+            self.val, self.failed, self.pos, errpos = entry
+            self.errpos = max(self.errpos, errpos)
+            return
+        if cache and (
+            p > next(reversed(cache)) or len(cache) >= _MAX_MEMO_ENTRIES
+        ):
+            cache.clear()
+
+        # `errpos` only ever grows while a rule runs (`_not` restores it
+        # to its value at the start of the lookahead), so the rule's
+        # effect on it can be recorded separately from where the parse
+        # had failed before.
+        errpos = self.errpos
+        self.errpos = 0
+        rule(self)
+        cache[p] = (self.val, self.failed, self.pos, self.errpos)
+        self.errpos = max(self.errpos, errpos)
+
+
+_memoizing_classes = {}
+
+
+def _memoizing_class(cls):
+    if cls not in _memoizing_classes:
+        _memoizing_classes[cls] = type(
+            'Memoizing' + cls.__name__, (_MemoMixin, cls), {}
+        )
+    return _memoizing_classes[cls]
+
+
+def reference_parser(msg, fname, strict, lean=False, memoize=False):
+    """Returns a parser for `msg` specialized for `strict`. Call its
+    `parse()` method without any global variables.
+
+    If `lean` is true, the parser doesn't keep track of where failures
+    happen unless the parse fails; it produces the same results and
+    errors, but is faster for valid documents and slower for invalid
+    ones.
+
+    If `memoize` is true, the parser caches the results of the rules
+    that it would otherwise re-parse when backtracking. That is faster
+    for documents with lots of long numbers, and slower for most
+    others."""
+    if strict:
+        cls = LeanStrictParser if lean else StrictParser
+    else:
+        cls = LeanNonStrictParser if lean else NonStrictParser
+    if memoize:
+        cls = _memoizing_class(cls)
+    return cls(msg, fname)
@@ -0,0 +1,410 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Decoding streams of JSON5 values, and documents, that arrive a
+chunk at a time.
+"""
+
+import codecs
+import re
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .decoder import JSON5Decoder
+from .fast_parser import _unexpected
+from .incremental import EventParser, IncrementalParser
+from .scanner import ScanError, skip_value, skip_whitespace
+
+# These functions take the same options as `loads()`, and pass them on
+# to the decoder in the same way.
+# pylint: disable=duplicate-code
+
+
+def iter_load(
+    fp: IO,
+    *,
+    encoding: Optional[str] = None,
+    object_hook: Optional[Callable[[Mapping[str, Any]], Any]] = None,
+    parse_float: Optional[Callable[[str], Any]] = None,
+    parse_int: Optional[Callable[[str], Any]] = None,
+    parse_constant: Optional[Callable[[str], Any]] = None,
+    strict: bool = True,
+    object_pairs_hook: Optional[
+        Callable[[Iterable[Tuple[str, Any]]], Any]
+    ] = None,
+    allow_duplicate_keys: bool = True,
+    engine: str = 'auto',
+    max_depth: Optional[int] = None,
+    chunk_size: int = 65536,
+) -> Iterator[Any]:
+    """Deserialize each of the JSON5 values in ``fp`` (a
+    ``.read()``-supporting file-like object) to a Python object, and
+    yield them one at a time.
+
+    The values may be separated by whitespace and comments, e.g. one
+    value per line, or follow each other directly where that isn't
+    ambiguous (``{}[]``). ``fp`` is read ``chunk_size`` characters (or
+    bytes) at a time, and only as much of it as is needed to parse the
+    next value is kept in memory. Errors report line numbers relative
+    to the start of the stream.
+
+    The other arguments are the same as for ``load()``.
+    """
+    decoder = _StreamDecoder(
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        object_pairs_hook=object_pairs_hook,
+        allow_duplicate_keys=allow_duplicate_keys,
+        engine=engine,
+        max_depth=max_depth,
+    )
+    return decoder.decode_stream(_reader(fp, encoding), chunk_size)
+
+
+def _reader(fp, encoding):
+    # Returns a function that reads (at most) `size` characters from
+    # `fp`, decoding them if `fp` returns bytes, and returns '' at the
+    # end of the file.
+    incremental_decoder = None
+
+    def read(size):
+        nonlocal incremental_decoder
+        while True:
+            chunk = fp.read(size)
+            if not isinstance(chunk, bytes):
+                return chunk
+            if incremental_decoder is None:
+                incremental_decoder = codecs.getincrementaldecoder(
+                    encoding or 'utf-8'
+                )()
+            text = incremental_decoder.decode(chunk, final=not chunk)
+            # A chunk can end in the middle of a character.
+            if text or not chunk:
+                return text
+
+    return read
+
+
+def iterparse(
+    fp: IO,
+    *,
+    encoding: Optional[str] = None,
+    parse_float: Optional[Callable[[str], Any]] = None,
+    parse_int: Optional[Callable[[str], Any]] = None,
+    parse_constant: Optional[Callable[[str], Any]] = None,
+    strict: bool = True,
+    max_depth: Optional[int] = None,
+    chunk_size: int = 65536,
+) -> Iterator[Tuple[Tuple[Union[str, int], ...], str, Any]]:
+    """Parse the JSON5 document in ``fp`` (a ``.read()``-supporting
+    file-like object), and yield the events that describe it, in the
+    style of the `ijson` package, without building the document's value.
+
+    Each event is a ``(path, event, value)`` tuple, where `path` is the
+    tuple of keys and array indices that lead to the value the event is
+    about. The events are ``'start_object'``, ``'end_object'``,
+    ``'start_array'`` and ``'end_array'`` (whose value is None), ``'key'``
+    (whose value is the key, and whose path is that of the object), and
+    ``'null'``, ``'boolean'``, ``'number'`` and ``'string'`` for scalars.
+    For example, ``{a: [1]}`` produces::
+
+        ((), 'start_object', None)
+        ((), 'key', 'a')
+        (('a',), 'start_array', None)
+        (('a', 0), 'number', 1)
+        (('a',), 'end_array', None)
+        ((), 'end_object', None)
+
+    ``fp`` is read ``chunk_size`` characters (or bytes) at a time, and
+    apart from the chunk being parsed, only the path to the current
+    value is kept in memory, so arbitrarily large documents can be
+    walked. Events are produced as soon as their chunk has been read, so
+    a syntax error is only raised once the events before it have been
+    yielded. Errors are reported as by ``load()``.
+
+    The other arguments are the same as for ``load()``; the number hooks
+    are used to produce the values of ``'number'`` events.
+    """
+    decoder = JSON5Decoder(
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        engine='fast',
+        max_depth=max_depth,
+    )
+    parser = EventParser(
+        '<string>',
+        strict=strict,
+        parse_float=decoder.parse_float,
+        parse_int=decoder.parse_int,
+        parse_constant=decoder.parse_constant,
+        max_depth=max_depth,
+    )
+    read = _reader(fp, encoding)
+    empty = True
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        empty = False
+        err = parser.feed(chunk)
+        yield from parser.events
+        parser.events.clear()
+        if err:
+            raise ValueError(err)
+    if empty:
+        raise ValueError('Empty strings are not legal JSON5')
+    _, err = parser.close()
+    yield from parser.events
+    if err:
+        raise ValueError(err)
+
+
+def iter_loads(
+    s: str,
+    *,
+    encoding: Optional[str] = None,
+    object_hook: Optional[Callable[[Mapping[str, Any]], Any]] = None,
+    parse_float: Optional[Callable[[str], Any]] = None,
+    parse_int: Optional[Callable[[str], Any]] = None,
+    parse_constant: Optional[Callable[[str], Any]] = None,
+    strict: bool = True,
+    object_pairs_hook: Optional[
+        Callable[[Iterable[Tuple[str, Any]]], Any]
+    ] = None,
+    allow_duplicate_keys: bool = True,
+    engine: str = 'auto',
+    max_depth: Optional[int] = None,
+) -> Iterator[Any]:
+    """Deserialize each of the JSON5 values in ``s`` to a Python object,
+    and yield them one at a time; see ``iter_load()``."""
+    if isinstance(s, bytes):
+        s = s.decode(encoding or 'utf-8')
+    decoder = _StreamDecoder(
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        object_pairs_hook=object_pairs_hook,
+        allow_duplicate_keys=allow_duplicate_keys,
+        engine=engine,
+        max_depth=max_depth,
+    )
+    chunks = [s]
+
+    def read(size):
+        del size
+        return chunks.pop() if chunks else ''
+
+    return decoder.decode_stream(read, len(s))
+
+
+class _StreamDecoder(JSON5Decoder):
+    # A decoder that also decodes streams of values.
+
+    def decode_stream(self, read, chunk_size):
+        """Yields the values in the stream that `read(size)` returns the
+        text of, a chunk at a time, and '' at the end."""
+        # `buf` holds the input that hasn't been parsed yet; `line` and
+        # `col` are the line and column (both counted from 0) at which it
+        # starts, so that errors can be reported relative to the start of
+        # the stream.
+        buf = ''
+        pos = 0
+        line = 0
+        col = 0
+        eof = False
+        try_json = self.engine == 'auto'
+        while True:
+            i = skip_whitespace(buf, pos)
+            if i == len(buf):
+                if eof:
+                    return
+            elif buf[i] == '/':
+                # `skip_whitespace()` stops at a '/' that doesn't start a
+                # complete comment.
+                if eof or buf[i + 1 : i + 2] not in ('', '*'):
+                    errpos = len(buf) if buf[i + 1 : i + 2] == '*' else i + 1
+                    raise ValueError(
+                        _shift_offsets(
+                            _unexpected(buf, '<string>', errpos), line, col
+                        )
+                    )
+            elif eof or _value_end(buf, i) < len(buf):
+                # The value is complete (or invalid before the end of the
+                # buffer), so more input wouldn't change how it is parsed.
+                result = None
+                if try_json:
+                    result = self._json_raw_decode(buf, i)
+                if result is None:
+                    result = self._parse_value(buf, i, try_json=False)
+                    if try_json and result[1] is None:
+                        # The stream contains JSON5 values that aren't JSON,
+                        # so trying to parse the rest of them as JSON first
+                        # is probably a waste of time.
+                        try_json = False
+                obj, err, end = result
+                if err is not None:
+                    raise ValueError(_shift_offsets(err, line, col))
+                yield obj
+                pos = end
+                continue
+
+            # Drop the text that has been parsed, and read more of the
+            # input; if a value doesn't fit in what has been read so far,
+            # read (at least) as much again, so that the value is only
+            # scanned a logarithmic number of times.
+            nl = buf.rfind('\n', 0, pos)
+            if nl == -1:
+                col += pos
+            else:
+                line += buf.count('\n', 0, pos)
+                col = pos - nl - 1
+            buf = buf[pos:]
+            pos = 0
+            chunk = read(max(chunk_size, len(buf)))
+            if not chunk:
+                eof = True
+            buf += chunk
+
+
+def _value_end(buf, i):
+    # Returns where the value at `i` ends, without parsing it, or
+    # `len(buf)` if it may continue after the end of `buf`. If the value
+    # is invalid before then, the position returned is before the error,
+    # or at it.
+    try:
+        return skip_value(buf, i)
+    except ScanError as e:
+        rest = buf[e.pos : e.pos + 2]
+        if rest[:1] in ('', '"', "'") or rest in ('/', '/*'):
+            # A string or comment that isn't terminated yet.
+            return len(buf)
+        return e.pos
+
+
+_ERR_OFFSETS_RE = re.compile(r'(<string>):(\d+) (.*) at column (\d+)$', re.S)
+
+
+def _shift_offsets(err, line, col):
+    # Adjusts the line and column in `err`, for a buffer that starts at
+    # line `line` and column `col` (counted from 0) of the stream.
+    m = _ERR_OFFSETS_RE.match(err)
+    if m is None:
+        return err
+    lineno = int(m.group(2))
+    colno = int(m.group(4))
+    if lineno == 1:
+        colno += col
+    return f'{m.group(1)}:{lineno + line} {m.group(3)} at column {colno}'
+
+
+class FeedParser:
+    """An incremental JSON5 parser, for documents that arrive a piece at
+    a time, e.g. from a socket or a large file.
+
+    Takes the same keyword arguments as ``loads()`` other than `cls` and
+    `engine`. Call ``feed()`` with each piece of the document as it
+    arrives, and ``close()`` once there is no more to get the value.
+    Each piece is parsed as soon as it is fed in, and only the text that
+    hasn't been parsed yet (usually no more than the last token) is
+    kept, so the document's text never has to be in memory all at once.
+
+    Pieces may be strings or bytes; bytes are decoded using `encoding`
+    (UTF-8 by default), and may end in the middle of a character.
+
+    Errors are reported with a ValueError, with the same message as
+    ``loads()`` would produce for the whole document. A syntax error is
+    raised by ``feed()`` as soon as it is found; an error raised by one
+    of the hooks is raised by ``close()``, since (as with ``loads()``)
+    any syntax error in the rest of the document is reported instead.
+    """
+
+    def __init__(
+        self,
+        *,
+        encoding: Optional[str] = None,
+        object_hook: Optional[Callable[[Mapping[str, Any]], Any]] = None,
+        parse_float: Optional[Callable[[str], Any]] = None,
+        parse_int: Optional[Callable[[str], Any]] = None,
+        parse_constant: Optional[Callable[[str], Any]] = None,
+        strict: bool = True,
+        object_pairs_hook: Optional[
+            Callable[[Iterable[Tuple[str, Any]]], Any]
+        ] = None,
+        allow_duplicate_keys: bool = True,
+        max_depth: Optional[int] = None,
+    ):
+        decoder = JSON5Decoder(
+            object_hook=object_hook,
+            parse_float=parse_float,
+            parse_int=parse_int,
+            parse_constant=parse_constant,
+            strict=strict,
+            object_pairs_hook=object_pairs_hook,
+            allow_duplicate_keys=allow_duplicate_keys,
+            engine='fast',
+            max_depth=max_depth,
+        )
+        self._parser = IncrementalParser(
+            '<string>',
+            strict=strict,
+            dictify=decoder.dictify,
+            parse_float=decoder.parse_float,
+            parse_int=decoder.parse_int,
+            parse_constant=decoder.parse_constant,
+            max_depth=max_depth,
+        )
+        self._encoding = encoding
+        self._incremental_decoder = None
+        self._empty = True
+
+    def feed(self, data: Union[str, bytes]) -> None:
+        """Parse the next piece of the document."""
+        if isinstance(data, bytes):
+            if self._incremental_decoder is None:
+                self._incremental_decoder = codecs.getincrementaldecoder(
+                    self._encoding or 'utf-8'
+                )()
+            data = self._incremental_decoder.decode(data)
+        if data:
+            self._empty = False
+        err = self._parser.feed(data)
+        if err:
+            raise ValueError(err)
+
+    def close(self) -> Any:
+        """Finish parsing the document, and return its value."""
+        if self._incremental_decoder is not None:
+            self.feed(self._incremental_decoder.decode(b'', final=True))
+        if self._empty:
+            raise ValueError('Empty strings are not legal JSON5')
+        obj, err = self._parser.close()
+        if err:
+            raise ValueError(err)
+        return obj
@@ -0,0 +1,225 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A structural index of a document.
+
+`find_structural()` makes one pass over a document and returns the
+positions of its structural characters (brackets, braces, commas and
+colons), leaving out the ones inside strings and comments. This is the
+first stage of simdjson: once the index is built, the structure of the
+document can be followed without looking at the characters in between.
+
+If NumPy is installed, the quotes are found with vectorized comparisons,
+and whether each character is inside a string is worked out from the
+number of (unescaped) quotes before it. That only works for documents
+that have double-quoted strings and no comments, which covers JSON and
+most generated JSON5, so when there is a single quote, a slash or a
+backslash outside a string, the index is built by `re.finditer()`
+instead, which matches strings and comments whole and so passes over
+the characters inside them. Without NumPy, `re.finditer()` is always
+used.
+
+`StructuralIndex` also pairs each opening bracket with its closing one,
+so `StructuralIndex.skip_value()` can find where an object or array
+ends with a binary search, however big it is. Like
+`scanner.skip_value()`, it doesn't check the value, and any closing
+bracket closes any opening one.
+"""
+
+import array
+import bisect
+import re
+
+from .scanner import SCALAR_RE, STRING_RE, ScanError
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+# The text up to the next structural character, passing over complete
+# strings and comments, and that character, or a quote or slash that
+# doesn't start a complete string or comment, or the end of the input.
+_TOKEN_RE = re.compile(
+    r"""
+    (?:
+        [^"'/\[\]{},:]+
+      | "[^"\\]*(?:\\.[^"\\]*)*"
+      | '[^'\\]*(?:\\.[^'\\]*)*'
+      | //[^\n\r\u2028\u2029]*
+      | /\*.*?\*/
+    )*
+    ([\[\]{},:"'/]|\Z)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_STRUCTURAL = '[]{},:'
+_OPENERS = '[{'
+_STRUCTURAL_SET = frozenset(_STRUCTURAL)
+
+
+def find_structural(s, use_numpy=None):
+    """Returns a tuple of an array of the positions of the structural
+    characters in `s` that aren't in strings or comments, in order, and
+    where the index stops: the start of the first string or comment that
+    isn't terminated, or of the first slash that doesn't start a comment,
+    or `len(s)`. The array is a NumPy array if NumPy is used (which it is
+    by default if it is installed), and an `array.array` otherwise."""
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    if use_numpy:
+        found = _numpy_structural(s)
+        if found is not None:
+            return found
+    return _re_structural(s)
+
+
+def _re_structural(s):
+    positions = array.array('q')
+    append = positions.append
+    for m in _TOKEN_RE.finditer(s):
+        if m.group(1) in _STRUCTURAL_SET:
+            append(m.start(1))
+        else:
+            return positions, m.start(1)
+    return positions, len(s)  # pragma: no cover
+
+
+def _codes(s):
+    # Returns an array of the code points in `s`.
+    if s.isascii():
+        return numpy.frombuffer(s.encode('ascii'), dtype=numpy.uint8)
+    return numpy.frombuffer(
+        s.encode('utf-32-le', 'surrogatepass'), dtype=numpy.uint32
+    )
+
+
+def _numpy_structural(s):
+    # Returns None if the document has anything other than double-quoted
+    # strings outside of its strings.
+    codes = _codes(s)
+
+    # A quote is escaped if it follows an odd number of backslashes.
+    quotes = numpy.flatnonzero(codes == ord('"'))
+    not_backslashes = numpy.flatnonzero(codes != ord('\\'))
+    i = numpy.searchsorted(not_backslashes, quotes) - 1
+    prev = numpy.where(i >= 0, not_backslashes[numpy.maximum(i, 0)], -1)
+    quotes = quotes[(quotes - prev) % 2 == 1]
+
+    # A character is in a string if an odd number of quotes come before
+    # it; the quotes themselves are counted as being outside.
+    def outside(positions):
+        return positions[numpy.searchsorted(quotes, positions) % 2 == 0]
+
+    others = (codes == ord("'")) | (codes == ord('/')) | (codes == ord('\\'))
+    if len(outside(numpy.flatnonzero(others))):
+        return None
+
+    structural = numpy.zeros(len(codes), dtype=bool)
+    for ch in _STRUCTURAL:
+        structural |= codes == ord(ch)
+    positions = outside(numpy.flatnonzero(structural))
+    if len(quotes) % 2:
+        # The last string isn't terminated.
+        limit = int(quotes[-1])
+        return positions[positions < limit], limit
+    return positions, len(s)
+
+
+def _int_array(a):
+    return array.array('q', a.astype(numpy.int64).tobytes())
+
+
+class StructuralIndex:
+    """The structural index of a document, for finding where its values
+    end; see `find_structural()` for `use_numpy`."""
+
+    __slots__ = ('msg', 'positions', 'limit', '_openers', '_ends')
+
+    def __init__(self, msg, use_numpy=None):
+        self.msg = msg
+        self.positions, self.limit = find_structural(msg, use_numpy)
+        if isinstance(self.positions, array.array):
+            self._openers, self._ends = self._pair(msg, self.positions)
+        else:
+            self._openers, self._ends = self._numpy_pair(msg, self.positions)
+
+    @staticmethod
+    def _pair(msg, positions):
+        # Returns an array of the positions of the opening brackets, and
+        # an array of where each of their values ends (or -1 if they
+        # aren't closed).
+        openers = array.array('q')
+        ends = array.array('q')
+        stack = []
+        for p in positions:
+            ch = msg[p]
+            if ch in _OPENERS:
+                stack.append(len(ends))
+                openers.append(p)
+                ends.append(-1)
+            elif ch in ']}' and stack:
+                ends[stack.pop()] = p + 1
+        return openers, ends
+
+    @staticmethod
+    def _numpy_pair(msg, positions):
+        # Each bracket is at the level of the number of brackets that are
+        # open outside of it, and a closing bracket matches the nearest
+        # opening one before it at the same level, so sorting the
+        # brackets by level pairs them up.
+        codes = _codes(msg)[positions]
+        is_opener = (codes == ord('[')) | (codes == ord('{'))
+        is_bracket = is_opener | (codes == ord(']')) | (codes == ord('}'))
+        brackets = positions[is_bracket]
+        is_opener = is_opener[is_bracket]
+        levels = numpy.cumsum(numpy.where(is_opener, 1, -1)) - is_opener
+        order = numpy.lexsort((brackets, levels))
+        brackets = brackets[order]
+        is_opener = is_opener[order]
+        levels = levels[order]
+        closed = numpy.zeros(len(brackets), dtype=bool)
+        closed[:-1] = levels[1:] == levels[:-1]
+        ends = numpy.full(len(brackets), -1, dtype=numpy.int64)
+        ends[:-1] = numpy.where(closed[:-1], brackets[1:] + 1, -1)
+        openers = brackets[is_opener]
+        ends = ends[is_opener]
+        order = numpy.argsort(openers, kind='stable')
+        # `bisect` is much faster on arrays of Python integers.
+        return _int_array(openers[order]), _int_array(ends[order])
+
+    def skip_value(self, end):
+        """Returns the index of the first character after the value that
+        starts at `end`, as `scanner.skip_value()` does."""
+        msg = self.msg
+        ch = msg[end : end + 1]
+        if ch in ('"', "'"):
+            m = STRING_RE[ch].match(msg, end)
+            if m is None:
+                raise ScanError(end)
+            return m.end()
+        if ch not in _OPENERS:
+            m = SCALAR_RE.match(msg, end)
+            if m is None:
+                raise ScanError(end)
+            return m.end()
+        i = bisect.bisect_left(self._openers, end)
+        if i == len(self._openers) or self._openers[i] != end:
+            raise ScanError(self.limit)
+        value_end = int(self._ends[i])
+        if value_end == -1:
+            raise ScanError(self.limit)
+        return value_end
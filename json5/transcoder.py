@@ -0,0 +1,186 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A JSON5-to-JSON text transcoder.
+
+`transcode()` rewrites a JSON5 document as JSON text without building
+any Python objects, so that the result can be handed to the `json`
+module's (C) decoder. Runs of text that are already valid JSON tokens
+(JSON strings, numbers and literals, punctuation and whitespace) are
+copied with a single regex match; only the JSON5-specific tokens are
+rewritten one at a time:
+
+    - comments and non-JSON whitespace become a single space;
+    - identifier keys are quoted;
+    - single-quoted strings, and strings using escapes that JSON doesn't
+      have (`\\x`, `\\v`, `\\0`, line continuations and so on), are
+      decoded and re-encoded as JSON strings;
+    - hex numbers are converted to decimal, leading and trailing
+      decimal points get a zero, and '+' signs are dropped;
+    - trailing commas in objects and arrays are dropped.
+
+Each rewritten token is preceded by a space, so that it can't merge
+with the token in front of it.
+
+The transcoder only checks the tokens it rewrites; the structure of the
+document is checked by the JSON decoder. Since every rewrite maps a
+single JSON5 token onto a JSON token with the same value, a document
+that is transcoded and then decoded successfully is valid JSON5 and
+decodes to the same values. A `ScanError` is raised for anything that
+is not valid JSON5, and also for the few valid documents that can't be
+transcoded (numbers with several signs or without any digits, `-NaN`);
+callers are expected to hand those to one of the parsers instead.
+"""
+
+import re
+
+from json.encoder import encode_basestring
+
+from .scanner import (
+    NUMBER_RE,
+    ScanError,
+    is_id_start,
+    scan_ident,
+    scanstring,
+    skip_whitespace,
+)
+
+
+# Runs of tokens that mean the same thing in JSON and JSON5. Strings
+# can't contain control characters (JSON requires them to be escaped)
+# or \u escapes for high surrogates (the `json` module combines
+# surrogate pairs, JSON5 doesn't), numbers and literals can't be
+# followed by anything that would make them part of a longer JSON5
+# token, literals can't be object keys, and commas must be followed by
+# the start of another value so that trailing commas are left for
+# `transcode()` to check.
+JSON_TOKENS_RE = re.compile(
+    r"""
+    (?:
+        [ \t\n\r]+
+      | "[^"\\\x00-\x1f\u2028\u2029]*
+        (?:
+            \\(?:["\\/bfnrt]|u(?![dD][89abAB])[0-9a-fA-F]{4})
+            [^"\\\x00-\x1f\u2028\u2029]*
+        )*"
+      | -?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?(?![\w$\\.])
+      | (?:true|false|null|-?Infinity|NaN)(?![\w$\\]|[ \t\n\r]*:)
+      | [\[\]{}:]
+      | ,(?=[ \t\n\r]*["\[{0-9tfnIN-])
+    )+
+    """,
+    re.VERBOSE,
+)
+
+
+def transcode(s, strict=True, rewrite_numbers=True):
+    """Returns the JSON5 document `s` rewritten as JSON text.
+
+    If `rewrite_numbers` is false, a `ScanError` is raised for numbers
+    that would have to be spelled differently in JSON (hex numbers and
+    numbers with leading or trailing decimal points), so that the caller
+    can pass the original text of every number to its hooks."""
+    chunks = []
+    _append = chunks.append
+    _match = JSON_TOKENS_RE.match
+    end = 0
+    n = len(s)
+    while True:
+        m = _match(s, end)
+        if m is not None:
+            _append(m.group())
+            end = m.end()
+        if end == n:
+            return ''.join(chunks)
+        ch = s[end]
+        if ch in ('"', "'"):
+            v, end = scanstring(s, end + 1, ch, strict)
+            _append(' ' + encode_basestring(v))
+        elif ch == ',':
+            i = skip_whitespace(s, end + 1)
+            nextchar = s[i : i + 1]
+            if nextchar in (']', '}') and _last_char(chunks) not in (
+                '[',
+                '{',
+                ',',
+                ':',
+                '',
+            ):
+                _append(' ')
+            else:
+                _append(',')
+            end += 1
+        elif ch in '+-.0123456789':
+            end = _number(s, end, rewrite_numbers, _append)
+        else:
+            ws_end = skip_whitespace(s, end)
+            if ws_end > end:
+                _append(' ')
+                end = ws_end
+            else:
+                end = _ident(s, end, rewrite_numbers, _append)
+
+
+def _last_char(chunks):
+    for chunk in reversed(chunks):
+        chunk = chunk.rstrip(' \t\n\r')
+        if chunk:
+            return chunk[-1]
+    return ''
+
+
+def _ident(s, end, rewrite_numbers, _append):
+    key, key_end = scan_ident(s, end)
+    i = skip_whitespace(s, key_end)
+    if s[i : i + 1] == ':':
+        _append(' ' + encode_basestring(key))
+        return key_end
+    if key in ('Infinity', 'NaN') and key_end - end == len(key):
+        return _number(s, end, rewrite_numbers, _append)
+    raise ScanError(end)
+
+
+def _number(s, end, rewrite_numbers, _append):
+    m = NUMBER_RE.match(s, end)
+    signs, hex_lit, constant, integer, frac, exp = m.groups()
+    sign = signs.replace('+', '')
+    if len(sign) > 1:
+        raise ScanError(end)
+    end = m.end()
+    if hex_lit:
+        if not rewrite_numbers:
+            raise ScanError(m.start())
+        _append(' ' + str(int(sign + hex_lit, base=16)))
+        return end
+    if constant:
+        if constant == 'NaN' and sign:
+            raise ScanError(m.start())
+        _append(' ' + sign + constant)
+        return end
+    if not integer and not frac:
+        raise ScanError(end)
+    if is_id_start(s, end):
+        raise ScanError(end)
+    if exp == '' or (not integer and frac == '.'):
+        # `float()` rejects these.
+        raise ScanError(m.start())
+    if not rewrite_numbers and (not integer or frac == '.'):
+        raise ScanError(m.start())
+    v = sign + (integer or '0')
+    if frac:
+        v += frac if len(frac) > 1 else '.0'
+    if exp is not None:
+        v += 'e' + exp
+    _append(' ' + v)
+    return end
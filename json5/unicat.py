@@ -0,0 +1,156 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Precomputed Unicode general category tables.
+
+The JSON5 grammar decides whether a character can start or continue an
+identifier, or counts as whitespace, by its Unicode general category.
+Rather than calling `unicodedata.category()` and comparing the result
+against several categories for every character, the parsers and the
+serializer look the character up in these tables.
+
+Each entry holds the index of the character's category in `CATEGORIES`
+in its low bits, and the ID_START, ID_CONTINUE and SPACE flags that
+apply to it in its high bits. There is a `bytearray` with one entry per
+code point in the Basic Multilingual Plane, which hot loops can index
+directly (see `bmp_table()`), and a sorted list of runs for the rest.
+
+The tables are generated from `unicodedata` the first time they are
+needed, so they always agree with the version of the Unicode database
+that Python itself uses; the runs outside the BMP are only generated if
+such a character is looked up.
+"""
+
+import bisect
+import unicodedata
+
+
+CATEGORIES = (
+    'Lu',
+    'Ll',
+    'Lt',
+    'Lm',
+    'Lo',
+    'Mn',
+    'Mc',
+    'Me',
+    'Nd',
+    'Nl',
+    'No',
+    'Pc',
+    'Pd',
+    'Ps',
+    'Pe',
+    'Pi',
+    'Pf',
+    'Po',
+    'Sm',
+    'Sc',
+    'Sk',
+    'So',
+    'Zs',
+    'Zl',
+    'Zp',
+    'Cc',
+    'Cf',
+    'Cs',
+    'Co',
+    'Cn',
+)
+
+ID_START_CATS = ('Lu', 'Ll', 'Lt', 'Lm', 'Lo', 'Nl')
+
+ID_CONTINUE_CATS = ID_START_CATS + ('Mn', 'Mc', 'Nd', 'Pc')
+
+SPACE_CATS = ('Zs',)
+
+ID_START = 0x20
+ID_CONTINUE = 0x40
+SPACE = 0x80
+
+_CATEGORY_MASK = 0x1F
+
+# The entry for each category in CATEGORIES.
+_ENTRIES = bytes(
+    i
+    | (ID_START if cat in ID_START_CATS else 0)
+    | (ID_CONTINUE if cat in ID_CONTINUE_CATS else 0)
+    | (SPACE if cat in SPACE_CATS else 0)
+    for i, cat in enumerate(CATEGORIES)
+)
+
+BMP_END = 0x10000
+
+_bmp = None
+_astral_starts = None
+_astral_entries = None
+
+
+def bmp_table():
+    """Returns a bytearray holding the entry for every code point below
+    BMP_END."""
+    if _bmp is None:
+        _build_bmp()
+    return _bmp
+
+
+def lookup(ch):
+    """Returns the entry for `ch`."""
+    o = ord(ch)
+    if o < BMP_END:
+        return (_bmp or bmp_table())[o]
+    if _astral_starts is None:
+        _build_astral()
+    return _astral_entries[bisect.bisect_right(_astral_starts, o) - 1]
+
+
+def category(ch):
+    """Returns the general category of `ch`, like `unicodedata.category()`."""
+    return CATEGORIES[lookup(ch) & _CATEGORY_MASK]
+
+
+def is_id_start(ch):
+    return lookup(ch) & ID_START != 0
+
+
+def is_id_continue(ch):
+    return lookup(ch) & ID_CONTINUE != 0
+
+
+def is_space(ch):
+    return lookup(ch) & SPACE != 0
+
+
+def _build_bmp():
+    global _bmp
+    entries = {cat: _ENTRIES[i] for i, cat in enumerate(CATEGORIES)}
+    cat = unicodedata.category
+    _bmp = bytearray(entries[cat(chr(o))] for o in range(BMP_END))
+
+
+def _build_astral():
+    global _astral_starts, _astral_entries
+    entries = {cat: _ENTRIES[i] for i, cat in enumerate(CATEGORIES)}
+    cat = unicodedata.category
+    starts = []
+    values = bytearray()
+    prev = None
+    for o in range(BMP_END, 0x110000):
+        entry = entries[cat(chr(o))]
+        if entry != prev:
+            starts.append(o)
+            values.append(entry)
+            prev = entry
+    _astral_entries = values
+    _astral_starts = starts
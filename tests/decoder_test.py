@@ -0,0 +1,153 @@
+# Copyright 2015 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+import unittest
+from unittest import mock
+
+import json5
+
+
+class TestJSON5Decoder(unittest.TestCase):
+    def test_decode(self):
+        decoder = json5.JSON5Decoder(engine='fast')
+        self.assertEqual(decoder.decode('{a: [1, 0x10]}'), {'a': [1, 16]})
+        self.assertEqual(decoder.decode("'b'"), 'b')
+        with self.assertRaisesRegex(ValueError, 'Unexpected "]" at column 3'):
+            decoder.decode('[]]')
+        with self.assertRaisesRegex(ValueError, 'Empty strings'):
+            decoder.decode('')
+
+    def test_options_are_checked_up_front(self):
+        with self.assertRaisesRegex(ValueError, 'Unknown engine "foo"'):
+            json5.JSON5Decoder(engine='foo')
+        with self.assertRaisesRegex(ValueError, 'max_depth is not supported'):
+            json5.JSON5Decoder(engine='reference', max_depth=1)
+
+    def test_parser_is_reused(self):
+        with mock.patch(
+            'json5.decoder.FastParser', wraps=json5.decoder.FastParser
+        ) as m:
+            decoder = json5.JSON5Decoder(engine='fast')
+            for s in ('[1]', '{a: 2}', '[', "'c'"):
+                try:
+                    decoder.decode(s)
+                except ValueError:
+                    pass
+            m.assert_called_once()
+        self.assertEqual(decoder.decode('[1, {a: 2}]'), [1, {'a': 2}])
+
+    def test_hooks_can_reuse_the_decoder(self):
+        def make_decoder(engine):
+            def object_hook(d):
+                return {k: decoder.decode(v) for k, v in d.items()}
+
+            decoder = json5.JSON5Decoder(
+                object_hook=object_hook, engine=engine, max_depth=2
+            )
+            return decoder
+
+        for engine in ('fast', 'scanner'):
+            with self.subTest(engine=engine):
+                decoder = make_decoder(engine)
+                self.assertEqual(
+                    decoder.decode("{a: '[{b: \\'[1]\\'}]'}"),
+                    {'a': [{'b': [1]}]},
+                )
+
+    def test_raw_decode(self):
+        s = 'log: {a: [1, 2,]} 1.5e3, "s"'
+        for engine in ('auto', 'fast', 'scanner', 'transcode', 'reference'):
+            with self.subTest(engine=engine):
+                decoder = json5.JSON5Decoder(engine=engine)
+                self.assertEqual(decoder.raw_decode(s, 5), ({'a': [1, 2]}, 17))
+                self.assertEqual(decoder.raw_decode(s, 18), (1500.0, 23))
+                self.assertEqual(decoder.raw_decode('"s" 1'), ('s', 3))
+                self.assertEqual(decoder.raw_decode('[1]]'), ([1], 3))
+
+                # The value has to start at `idx`, and errors are reported
+                # relative to the start of the string.
+                with self.assertRaisesRegex(
+                    ValueError, '<string>:1 Unexpected " " at column 5'
+                ):
+                    decoder.raw_decode(s, 4)
+                with self.assertRaisesRegex(
+                    ValueError, '<string>:2 Unexpected "x" at column 4'
+                ):
+                    decoder.raw_decode('\n1e3x', 1)
+                with self.assertRaisesRegex(
+                    ValueError,
+                    '<string>:1 Unexpected end of input at column 10',
+                ):
+                    decoder.raw_decode('log: [1, ', 5)
+
+    def test_raw_decode_checks_idx(self):
+        decoder = json5.JSON5Decoder()
+        for idx in (-1, 4, 5):
+            with self.subTest(idx=idx):
+                with self.assertRaisesRegex(ValueError, 'out of range'):
+                    decoder.raw_decode('abc', idx)
+        with self.assertRaisesRegex(
+            ValueError, '<string>:1 Unexpected end of input at column 4'
+        ):
+            decoder.raw_decode('abc', 3)
+
+    def test_raw_decode_json_fast_path(self):
+        decoder = json5.JSON5Decoder()
+        with mock.patch('json5.decoder.FastParser') as m:
+            self.assertEqual(
+                decoder.raw_decode('x {"a": [1]}, {b: 1}', 2), ({'a': [1]}, 12)
+            )
+            m.assert_not_called()
+
+        # The `json` module would stop before the '.', and would combine the
+        # surrogate pair.
+        self.assertEqual(decoder.raw_decode('1., 2', 0), (1.0, 2))
+        self.assertEqual(
+            decoder.raw_decode('["\\ud83d\\ude00"] "\u2028"', 0),
+            (['\ud83d\ude00'], 16),
+        )
+
+    def test_loads_reuses_a_decoder_per_thread(self):
+        def loads_in_new_thread(*docs):
+            # A new thread starts without any decoders.
+            thread = threading.Thread(
+                target=lambda: [json5.loads(s, engine='fast') for s in docs]
+            )
+            thread.start()
+            thread.join()
+
+        with mock.patch(
+            'json5.decoder.JSON5Decoder', wraps=json5.JSON5Decoder
+        ) as m:
+            loads_in_new_thread('{a: 1}', '[2]')
+            m.assert_called_once()
+            loads_in_new_thread('[3]')
+            self.assertEqual(m.call_count, 2)
+
+        # Decoders with hooks or a max_depth aren't cached.
+        with mock.patch(
+            'json5.lib.JSON5Decoder', wraps=json5.JSON5Decoder
+        ) as m:
+            json5.loads('[4]', engine='fast', max_depth=7)
+            json5.loads('[4]', engine='fast', max_depth=7)
+            self.assertEqual(m.call_count, 2)
+            json5.loads('[4]', engine='fast', parse_int=float)
+            json5.loads('[4]', engine='fast', parse_int=float)
+            self.assertEqual(m.call_count, 4)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,274 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+from unittest import mock
+
+from json5.fast_parser import FastParser
+from json5.decoder import _walk_ast
+from json5.parser import Parser
+
+
+VALID = [
+    'null',
+    'true',
+    'false',
+    '0',
+    '-0',
+    '+1',
+    '-+-1',
+    '123',
+    '1.5',
+    '.5',
+    '5.',
+    '.',
+    '1e5',
+    '1E+5',
+    '1.5e-3',
+    '.5e3',
+    '1e',
+    '0x1F',
+    '0XaB',
+    '-0x10',
+    'Infinity',
+    '-Infinity',
+    'NaN',
+    '+NaN',
+    '"foo"',
+    "'foo'",
+    '"a\'b"',
+    "'a\"b'",
+    r'"\b\f\n\r\t\v\\\"\'\/\a"',
+    r'"\0"',
+    r'"\x41B"',
+    '"foo\\\nbar"',
+    '"foo\\\r\nbar"',
+    '"foo\\\u2028bar"',
+    '"\t\x01"',
+    '[]',
+    '[ ]',
+    '[1]',
+    '[1,]',
+    '[1 , 2 , ]',
+    '[[[]]]',
+    '{}',
+    '{ }',
+    '{a: 1}',
+    '{a: 1,}',
+    '{"a": 1, \'b\': 2}',
+    '{$_a1: 1}',
+    '{\\u0061b: 1}',
+    '{a\\u0062: 1}',
+    '{\xc3\xe5\u02b0\u01bb\u01c8\u2160: 1}',
+    '{a\u0308\ua953\u0660\u203f\u200c\u200d: 1}',
+    '{\U00010400\U0001d7ce: 1}',
+    '{null: 1, true: 2, Infinity: 3}',
+    ' \t\v\f\xa0\ufeff\u2000\r\n\u2028\u2029 1 ',
+    '// comment\n1 // another',
+    '/* comment */ 1 /* another\n */',
+    '/**/1/***/',
+    '{a: /* c */ [1, // c\n 2]}',
+]
+
+INVALID = [
+    '',
+    ' ',
+    'nul',
+    'tru',
+    'nullx',
+    '01',
+    '0x',
+    '0xg',
+    '1a',
+    '1\\u0061',
+    '--',
+    'Infinit',
+    '"abc',
+    '\'abc"',
+    '"\n"',
+    '"\u2028"',
+    r'"\1"',
+    r'"\01"',
+    r'"\x0"',
+    r'"\u00g0"',
+    '"\\',
+    '[',
+    '[,]',
+    '[1,,]',
+    '[1 2]',
+    '{',
+    '{a}',
+    '{a 1}',
+    '{1: 1}',
+    '{a:1,,}',
+    '{a:1 b:2}',
+    '{a\\u00:1}',
+    '\\u0061',
+    '1 /x',
+    '/* abc',
+    '1 2',
+]
+
+
+def sample_files():
+    """Yields the path and contents of each of the sample documents in
+    the repo."""
+    root = os.path.join(os.path.dirname(__file__), '..')
+    for path in ('sample.json5', 'benchmarks/64KB-min.json'):
+        with open(os.path.join(root, path), encoding='utf-8') as fp:
+            yield path, fp.read()
+
+
+def _outcome(v, err):
+    if err:
+        return 'error', err
+    return 'ok', repr(v)
+
+
+class FastParserTest(unittest.TestCase):
+    maxDiff = None
+
+    def check(self, s, strict=True):
+        try:
+            ast, err, _ = Parser(s, '<string>').parse({'_strict': strict})
+            expected = _outcome(
+                err or _walk_ast(ast, dict, float, int, float), err
+            )
+        except ValueError as e:
+            expected = ('error', str(e))
+        try:
+            actual = _outcome(
+                *FastParser(s, '<string>', strict=strict).parse()[:2]
+            )
+        except ValueError as e:
+            actual = ('error', str(e))
+        self.assertEqual(expected, actual)
+
+    def check_no_fallback(self, s, strict=True):
+        with mock.patch('json5.fast_parser.reference_parser') as m:
+            m.return_value.failed = False
+            try:
+                _, err, _ = FastParser(s, '<string>', strict=strict).parse()
+            except ValueError:
+                # Raised by one of the number hooks, after which the
+                # reference parser is used to look for a syntax error.
+                return
+            self.assertIsNone(err)
+            m.assert_not_called()
+
+    def test_valid(self):
+        for s in VALID:
+            with self.subTest(s=s):
+                self.check(s)
+                self.check_no_fallback(s)
+
+    def test_invalid(self):
+        for s in INVALID:
+            with self.subTest(s=s):
+                self.check(s)
+                _, err, _ = FastParser(s, '<string>').parse()
+                self.assertIsNotNone(err)
+
+    def test_strict(self):
+        for s in ('"a\nb"', "'a\r\nb'"):
+            with self.subTest(s=s):
+                self.check(s, strict=True)
+                self.check(s, strict=False)
+                self.check_no_fallback(s, strict=False)
+
+    def test_hooks_are_applied_while_parsing(self):
+        calls = []
+
+        def hook(name):
+            def fn(s, **kwargs):
+                calls.append((name, s, kwargs))
+                return s
+
+            return fn
+
+        parser = FastParser(
+            '{a: [1, 1.5, -0x1F, -Infinity, NaN]}',
+            '<string>',
+            dictify=hook('dictify'),
+            parse_float=hook('float'),
+            parse_int=hook('int'),
+            parse_constant=hook('constant'),
+        )
+        parser.parse()
+        self.assertEqual(
+            calls,
+            [
+                ('int', '1', {}),
+                ('float', '1.5', {}),
+                ('int', '-0x1F', {'base': 16}),
+                ('constant', '-Infinity', {}),
+                ('constant', 'NaN', {}),
+                (
+                    'dictify',
+                    [('a', ['1', '1.5', '-0x1F', '-Infinity', 'NaN'])],
+                    {},
+                ),
+            ],
+        )
+
+    def test_deep_nesting(self):
+        # pylint infers that `parse()` may return None for the value.
+        # pylint: disable=unsubscriptable-object
+        n = 100000
+        v, err, _ = FastParser('[' * n + ']' * n, '<string>').parse()
+        self.assertIsNone(err)
+        for _ in range(n - 1):
+            v = v[0]
+        self.assertEqual(v, [])
+
+        v, err, _ = FastParser('{a:' * n + '1' + '}' * n, '<string>').parse()
+        self.assertIsNone(err)
+        for _ in range(n):
+            v = v['a']
+        self.assertEqual(v, 1)
+
+        # The reference parser can't handle input nested this deeply, so
+        # the error is reported at the position where this parser failed.
+        _, err, _ = FastParser('[' * n, '<string>').parse()
+        self.assertEqual(
+            err, f'<string>:1 Unexpected end of input at column {n + 1}'
+        )
+
+    def test_max_depth(self):
+        parser = FastParser('[[1], {a: 2}]', '<string>', max_depth=2)
+        self.assertEqual(parser.parse(), ([[1], {'a': 2}], None, 13))
+
+        parser = FastParser('[\n [{a: 1}]]', '<string>', max_depth=2)
+        self.assertEqual(
+            parser.parse(),
+            (
+                None,
+                '<string>:2 Maximum nesting depth of 2 exceeded at column 3',
+                4,
+            ),
+        )
+
+        parser = FastParser('1', '<string>', max_depth=0)
+        self.assertEqual(parser.parse(), (1, None, 1))
+
+    def test_sample_files(self):
+        for path, s in sample_files():
+            with self.subTest(path=path):
+                self.check(s)
+                self.check_no_fallback(s)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,103 @@
+# Copyright 2015 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import json5
+
+
+class TestFileIndex(unittest.TestCase):
+    doc = """{
+    // A comment.
+    items: [
+        {name: 'caf\xe9', tags: ['a', 'b']},
+        {name: "\u20ac", tags: []},
+    ],
+    meta: {count: 2},
+}
+"""
+
+    def setUp(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        self.path = os.path.join(tmpdir, 'doc.json5')
+        with open(self.path, 'w', encoding='utf-8') as fp:
+            fp.write(self.doc)
+
+    def test_get(self):
+        index = json5.FileIndex(self.path, depth=2)
+        self.assertEqual(
+            sorted(index.paths()),
+            ['', '/items', '/items/0', '/items/1', '/meta', '/meta/count'],
+        )
+        full = json5.loads(self.doc)
+        self.assertEqual(index.get(''), full)
+        self.assertEqual(index.get('/items/1'), {'name': '\u20ac', 'tags': []})
+        self.assertEqual(index.get('meta.count'), 2)
+        # Values below the index are looked up in the deepest value above
+        # them that is in the index.
+        self.assertEqual(index.get('/items/0/name'), 'caf\xe9')
+        self.assertEqual(index.get('items.0.tags.1'), 'b')
+        for path in ('/items/2', '/nope', '/items/0/nope', '/meta/count/x'):
+            with self.subTest(path=path):
+                with self.assertRaises(KeyError):
+                    index.get(path)
+
+    def test_index_is_saved(self):
+        index = json5.FileIndex(self.path, depth=1)
+        self.assertTrue(os.path.exists(self.path + '.json5idx'))
+        with mock.patch.object(
+            json5.FileIndex, 'rebuild', autospec=True
+        ) as rebuild:
+            index = json5.FileIndex(self.path, depth=1)
+            rebuild.assert_not_called()
+            self.assertEqual(index.get('/meta'), {'count': 2})
+
+            # An index built with different options isn't used.
+            json5.FileIndex(self.path, depth=2)
+            rebuild.assert_called_once()
+
+    def test_index_is_rebuilt_when_the_file_changes(self):
+        index = json5.FileIndex(self.path, depth=1)
+        with open(self.path, 'w', encoding='utf-8') as fp:
+            fp.write('{meta: {count: 3}}')
+        self.assertEqual(index.get('/meta/count'), 3)
+        self.assertEqual(sorted(index.paths()), ['', '/meta'])
+
+    def test_errors(self):
+        with open(self.path, 'w', encoding='utf-8') as fp:
+            fp.write('{a: 1 b: [}')
+        with self.assertRaisesRegex(
+            ValueError, '<string>:1 Unexpected "b" at column 7'
+        ):
+            json5.FileIndex(self.path)
+
+        # Values below the index aren't checked until they are looked up.
+        with open(self.path, 'w', encoding='utf-8') as fp:
+            fp.write('{a: {b: [1 2]}, c: 3}')
+        index = json5.FileIndex(self.path, depth=1)
+        self.assertEqual(index.get('c'), 3)
+        with self.assertRaisesRegex(
+            ValueError, '<string>:1 Unexpected "2" at column 8'
+        ):
+            index.get('a')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,209 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+from json5.fast_parser import FastParser
+from json5.incremental import EventParser, IncrementalParser
+
+from .fast_parser_test import INVALID, VALID, _outcome, sample_files
+
+
+def _feed(s, n, **kwargs):
+    parser = IncrementalParser('<string>', **kwargs)
+    for i in range(0, len(s), n):
+        err = parser.feed(s[i : i + n])
+        if err:
+            return None, err
+    return parser.close()
+
+
+class IncrementalParserTest(unittest.TestCase):
+    maxDiff = None
+
+    def check(self, s, strict=True):
+        try:
+            expected = _outcome(
+                *FastParser(s, '<string>', strict=strict).parse()[:2]
+            )
+        except ValueError as e:
+            expected = ('error', str(e))
+        for n in (1, 2, 3, len(s) or 1):
+            with self.subTest(n=n):
+                try:
+                    actual = _outcome(*_feed(s, n, strict=strict))
+                except ValueError as e:
+                    actual = ('error', str(e))
+                self.assertEqual(expected, actual)
+
+    def test_valid(self):
+        for s in VALID:
+            with self.subTest(s=s):
+                self.check(s)
+
+    def test_invalid(self):
+        # The empty document is reported by `FeedParser.close()`.
+        for s in INVALID[1:]:
+            with self.subTest(s=s):
+                self.check(s)
+
+    def test_strict(self):
+        for s in ('"a\nb"', "'a\r\nb'"):
+            with self.subTest(s=s):
+                self.check(s, strict=True)
+                self.check(s, strict=False)
+
+    def test_errors_depend_on_the_previous_token(self):
+        # The generated parser gets further into the text after some
+        # tokens than after others.
+        for s in ("5'a\"b'", '9{a: 1}', '{a:1,,}', '[1}]', '0:x'):
+            with self.subTest(s=s):
+                self.check(s)
+
+    def test_errors_wait_for_the_rest_of_the_token(self):
+        # The error is found at the quote, but it is reported where the
+        # generated parser fails, after it.
+        parser = IncrementalParser('<string>')
+        self.assertIsNone(parser.feed("5'"))
+        self.assertEqual(
+            parser.feed('abc'), '<string>:1 Unexpected "a" at column 3'
+        )
+        parser = IncrementalParser('<string>')
+        self.assertIsNone(parser.feed("5'"))
+        self.assertEqual(
+            parser.close(),
+            (None, '<string>:1 Unexpected end of input at column 3'),
+        )
+
+    def test_only_unparsed_input_is_kept(self):
+        parser = IncrementalParser('<string>')
+        parser.feed('[')
+        for _ in range(1000):
+            parser.feed('[1, "two", {three: 3.0}],\n')
+            self.assertLess(len(parser.msg), 30)
+        parser.feed('[1, "tw')
+        self.assertEqual(parser.msg[parser.pos :], '"tw')
+
+    def test_tokens_end_at_json5_whitespace(self):
+        parser = IncrementalParser('<string>')
+        self.assertIsNone(parser.feed('[1\ufeff'))
+        self.assertEqual(parser.msg[parser.pos :], '\ufeff')
+
+        # '\x1c' isn't whitespace, so the number may not be complete.
+        parser = IncrementalParser('<string>')
+        self.assertIsNone(parser.feed('[1\x1c'))
+        self.assertEqual(parser.msg[parser.pos :], '1\x1c')
+        self.assertEqual(
+            parser.close(),
+            (None, '<string>:1 Unexpected end of input at column 4'),
+        )
+
+    def test_feeding_in_pieces_is_not_quadratic(self):
+        # The pending token isn't looked at again until a piece that
+        # could end it arrives, which is only visible from the calls to
+        # `_complete()`.
+        # pylint: disable=protected-access
+        parser = IncrementalParser('<string>')
+        parser._complete = mock.Mock(wraps=parser._complete)
+        parser.feed('"')
+        for _ in range(100):
+            parser.feed('x' * 100)
+        parser.feed('"')
+        self.assertEqual(parser._complete.call_count, 2)
+        self.assertEqual(parser.close(), ('x' * 10000, None))
+
+    def test_max_depth(self):
+        self.assertEqual(
+            _feed('[\n [{a: 1}]]', 1, max_depth=2),
+            (
+                None,
+                '<string>:2 Maximum nesting depth of 2 exceeded at column 3',
+            ),
+        )
+
+    def test_deep_nesting(self):
+        n = 100000
+        v, err = _feed('[' * n + ']' * n, 4096)
+        self.assertIsNone(err)
+        for _ in range(n - 1):
+            v = v[0]
+        self.assertEqual(v, [])
+
+    def test_sample_files(self):
+        for path, s in sample_files():
+            with self.subTest(path=path):
+                v, err, _ = FastParser(s, '<string>').parse()
+                for n in (1, 100, 4096):
+                    self.assertEqual(_feed(s, n), (v, err))
+
+
+class EventParserTest(unittest.TestCase):
+    def events(self, s, n=1, **kwargs):
+        parser = EventParser('<string>', **kwargs)
+        for i in range(0, len(s), n):
+            self.assertIsNone(parser.feed(s[i : i + n]))
+        self.assertEqual(parser.close(), (None, None))
+        return parser.events
+
+    def test_events(self):
+        self.assertEqual(
+            self.events('{a: [1, {"b": null}, []], c: \'x\', d: true}'),
+            [
+                ((), 'start_object', None),
+                ((), 'key', 'a'),
+                (('a',), 'start_array', None),
+                (('a', 0), 'number', 1),
+                (('a', 1), 'start_object', None),
+                (('a', 1), 'key', 'b'),
+                (('a', 1, 'b'), 'null', None),
+                (('a', 1), 'end_object', None),
+                (('a', 2), 'start_array', None),
+                (('a', 2), 'end_array', None),
+                (('a',), 'end_array', None),
+                ((), 'key', 'c'),
+                (('c',), 'string', 'x'),
+                ((), 'key', 'd'),
+                (('d',), 'boolean', True),
+                ((), 'end_object', None),
+            ],
+        )
+        self.assertEqual(
+            self.events('-Infinity'), [((), 'number', float('-inf'))]
+        )
+
+    def test_containers_are_not_built(self):
+        # Only the parser's stack shows what it keeps for each container.
+        # pylint: disable=protected-access
+        parser = EventParser('<string>')
+        parser.feed('[')
+        for i in range(1000):
+            parser.feed('{a: [1, 2]},')
+            parser.events.clear()
+            self.assertEqual(parser._stack, [[i + 1, None]])
+        parser.feed(']')
+        self.assertEqual(parser.close(), (None, None))
+
+    def test_hook_errors_are_raised_immediately(self):
+        def parse_int(s):
+            raise ValueError('no ints')
+
+        parser = EventParser('<string>', parse_int=parse_int)
+        parser.feed('[1')
+        with self.assertRaisesRegex(ValueError, 'no ints'):
+            parser.feed(', }')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,129 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+from unittest import mock
+
+from json5.fast_parser import FastParser
+from json5.lazy import LazyArray, LazyObject, LazyParser
+
+from .paths_test import DOC
+
+
+# pylint infers that `load_document()` returns None, since that is the
+# only value it can work out from `FastParser._parse()`.
+# pylint: disable=unsubscriptable-object
+
+
+class LazyParserTest(unittest.TestCase):
+    def load(self, s=DOC, **kwargs):
+        return LazyParser(s, '<string>', **kwargs).load_document()
+
+    def test_proxies(self):
+        v = self.load()
+        self.assertIsInstance(v, LazyObject)
+        self.assertEqual(list(v), ['servers', 'a.b', 'version'])
+        self.assertEqual(len(v), 3)
+        self.assertIn('version', v)
+        self.assertNotIn('nope', v)
+        self.assertEqual(repr(v), '<LazyObject with 3 members>')
+
+        servers = v['servers']
+        self.assertIsInstance(servers, LazyArray)
+        self.assertEqual(len(servers), 2)
+        self.assertEqual(repr(servers), '<LazyArray with 2 elements>')
+        self.assertEqual(servers[-1]['host'], 'b.example.com')
+        self.assertEqual(servers[0]['ports'][1], 443)
+        self.assertEqual(servers[1:], [{'host': 'b.example.com', 'ports': []}])
+        self.assertRaises(IndexError, servers.__getitem__, 2)
+        self.assertRaises(KeyError, v.__getitem__, 'nope')
+
+    def test_same_as_full_parse(self):
+        self.assertEqual(self.load(), FastParser(DOC, '<string>').parse()[0])
+        self.assertEqual(self.load(' 1 '), 1)
+        self.assertEqual(self.load('[]'), [])
+        self.assertEqual(self.load('{}'), {})
+
+    def test_values_are_parsed_once_when_used(self):
+        # Scalars are counted as they are parsed.
+        # pylint: disable=protected-access
+        with mock.patch.object(
+            LazyParser,
+            '_scalar',
+            autospec=True,
+            side_effect=FastParser._scalar,
+        ) as m:
+            v = self.load()
+            self.assertEqual(list(v), ['servers', 'a.b', 'version'])
+            m.assert_not_called()
+            self.assertEqual(v['version'], 3)
+            self.assertEqual(v['version'], 3)
+            m.assert_called_once()
+            self.assertIs(v['a.b'], v['a.b'])
+
+    def test_threads(self):
+        v = self.load()
+        results = []
+
+        def worker():
+            results.append(v['servers'][0]['ports'][0])
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results, [80] * 4)
+
+    def test_unicode_whitespace(self):
+        v = self.load('{a: true\ufeff, b: [1\u3000, 2\ufeff]}')
+        self.assertEqual(v['b'][0], 1)
+        self.assertEqual(v, {'a': True, 'b': [1, 2]})
+
+    def test_errors(self):
+        with self.assertRaisesRegex(
+            ValueError, '<string>:1 Unexpected "x" at column 5'
+        ):
+            self.load('[1] x')
+
+        # Errors in a value are only found when the value is used.
+        v = self.load('{a: [1 2], b: 3}')
+        self.assertEqual(v['b'], 3)
+        self.assertRaisesRegex(
+            ValueError,
+            '<string>:1 Unexpected "2" at column 8',
+            v.__getitem__,
+            'a',
+        )
+
+    def test_duplicate_keys(self):
+        self.assertEqual(self.load('{a: 1, a: 2}'), {'a': 2})
+        v = self.load('{b: {a: 1, a: 2}}', reject_duplicates=True)
+        self.assertRaisesRegex(
+            ValueError, 'Duplicate key "a"', v.__getitem__, 'b'
+        )
+
+    def test_max_depth(self):
+        v = self.load('[[[1]]]', max_depth=2)[0]
+        self.assertRaisesRegex(
+            ValueError,
+            'Maximum nesting depth of 2 exceeded at column 3',
+            v.__getitem__,
+            0,
+        )
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
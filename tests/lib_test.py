@@ -12,24 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import decimal
 import io
 import math
 import os
 import unittest
-from collections import OrderedDict
+from collections import Counter, OrderedDict
+from unittest import mock
 
 import json5
 
 
 class TestLoads(unittest.TestCase):
     maxDiff = None
+    engine = 'fast'
 
-    def check(self, s, obj, strict=True):
-        self.assertEqual(json5.loads(s, strict=strict), obj)
+    def load(self, fp, **kwargs):
+        return json5.load(fp, engine=self.engine, **kwargs)
 
-    def check_fail(self, s, err=None):
+    def loads(self, s, **kwargs):
+        return json5.loads(s, engine=self.engine, **kwargs)
+
+    def check(self, s, obj, strict=True, **kwargs):
+        self.assertEqual(self.loads(s, strict=strict, **kwargs), obj)
+
+    def check_fail(self, s, err=None, **kwargs):
         try:
-            json5.loads(s)
+            self.loads(s, **kwargs)
             self.fail()  # pragma: no cover
         except ValueError as e:
             if err is not None:
@@ -42,7 +51,7 @@ class TestLoads(unittest.TestCase):
         self.check('[ 0 , 1 ]', [0, 1])
 
         try:
-            json5.loads('[ ,]')
+            self.loads('[ ,]')
             self.fail()  # pragma: no cover
         except ValueError as e:
             self.assertIn('Unexpected "," at column 3', str(e))
@@ -52,11 +61,11 @@ class TestLoads(unittest.TestCase):
         self.check('false', False)
 
     def test_cls_is_not_supported(self):
-        self.assertRaises(AssertionError, json5.loads, '1', cls=lambda x: x)
+        self.assertRaises(AssertionError, self.loads, '1', cls=lambda x: x)
 
     def test_duplicate_keys_should_be_allowed(self):
         self.assertEqual(
-            json5.loads('{foo: 1, foo: 2}', allow_duplicate_keys=True),
+            self.loads('{foo: 1, foo: 2}', allow_duplicate_keys=True),
             {'foo': 2},
         )
 
@@ -66,17 +75,50 @@ class TestLoads(unittest.TestCase):
     def test_duplicate_keys_should_not_be_allowed(self):
         self.assertRaises(
             ValueError,
-            json5.loads,
+            self.loads,
             '{foo: 1, foo: 2}',
             allow_duplicate_keys=False,
         )
 
         # Also check to make sure we don't reject things incorrectly.
         self.assertEqual(
-            json5.loads('{foo: 1, bar: 2}', allow_duplicate_keys=False),
+            self.loads('{foo: 1, bar: 2}', allow_duplicate_keys=False),
             {'foo': 1, 'bar': 2},
         )
 
+    def test_max_depth(self):
+        if self.engine == 'reference':
+            self.check_fail(
+                '[]',
+                'max_depth is not supported by the reference engine',
+                max_depth=1,
+            )
+            return
+        self.check('[[1], {a: []}]', [[1], {'a': []}], max_depth=3)
+        self.check_fail(
+            '[[1], {a: []}]',
+            '<string>:1 Maximum nesting depth of 2 exceeded at column 11',
+            max_depth=2,
+        )
+        self.check('1', 1, max_depth=0)
+        self.check_fail(
+            '{}',
+            '<string>:1 Maximum nesting depth of 0 exceeded at column 1',
+            max_depth=0,
+        )
+
+    def test_deep_nesting(self):
+        if self.engine == 'reference':
+            return
+        n = 10000
+        v = self.loads('[' * n + ']' * n)
+        for _ in range(n - 1):
+            v = v[0]
+        self.assertEqual(v, [])
+
+    def test_unknown_engine(self):
+        self.assertRaises(ValueError, json5.loads, '1', engine='foo')
+
     def test_empty_strings_are_errors(self):
         self.check_fail('', 'Empty strings are not legal JSON5')
 
@@ -84,7 +126,7 @@ class TestLoads(unittest.TestCase):
         self.check_fail("'", '<string>:1 Unexpected end of input at column 2')
 
     def test_encoding(self):
-        self.assertEqual(json5.loads(b'"\xf6"', encoding='iso-8859-1'), '\xf6')
+        self.assertEqual(self.loads(b'"\xf6"', encoding='iso-8859-1'), '\xf6')
 
     def test_numbers(self):
         # decimal literals
@@ -98,6 +140,8 @@ class TestLoads(unittest.TestCase):
         self.check('0xfff', 4095)
         self.check('0XABCD', 43981)
         self.check('0x123456', 1193046)
+        self.check('-0x10', -16)
+        self.check('+0x10', 16)
         self.check_fail('0x+', '<string>:1 Unexpected "+" at column 3')
 
         # floats
@@ -109,8 +153,8 @@ class TestLoads(unittest.TestCase):
         self.check('Infinity', float('inf'))
         self.check('+Infinity', float('inf'))
         self.check('-Infinity', float('-inf'))
-        self.assertTrue(math.isnan(json5.loads('NaN')))
-        self.assertTrue(math.isnan(json5.loads('-NaN')))
+        self.assertTrue(math.isnan(self.loads('NaN')))
+        self.assertTrue(math.isnan(self.loads('-NaN')))
 
         # syntax errors
         self.check_fail('14d', '<string>:1 Unexpected "d" at column 3')
@@ -170,7 +214,7 @@ class TestLoads(unittest.TestCase):
             return [d]
 
         self.assertEqual(
-            json5.loads('{foo: 1}', object_hook=hook), [{'foo': 1}]
+            self.loads('{foo: 1}', object_hook=hook), [{'foo': 1}]
         )
 
     def test_object_pairs_hook(self):
@@ -178,7 +222,7 @@ class TestLoads(unittest.TestCase):
             return pairs
 
         self.assertEqual(
-            json5.loads('{foo: 1, bar: 2}', object_pairs_hook=hook),
+            self.loads('{foo: 1, bar: 2}', object_pairs_hook=hook),
             [('foo', 1), ('bar', 2)],
         )
 
@@ -193,27 +237,95 @@ class TestLoads(unittest.TestCase):
             return x
 
         self.assertEqual(
-            json5.loads('-Infinity', parse_constant=hook), '-Infinity'
+            self.loads('-Infinity', parse_constant=hook), '-Infinity'
         )
-        self.assertEqual(json5.loads('NaN', parse_constant=hook), 'NaN')
+        self.assertEqual(self.loads('NaN', parse_constant=hook), 'NaN')
 
     def test_parse_float(self):
         def hook(x):
             return x
 
-        self.assertEqual(json5.loads('1.0', parse_float=hook), '1.0')
+        self.assertEqual(self.loads('1.0', parse_float=hook), '1.0')
+        # `float()` can't convert these, but the grammar allows them.
+        self.assertEqual(self.loads('1e+', parse_float=hook), '1e+')
+        self.assertEqual(self.loads('[1E-]', parse_float=hook), ['1e-'])
+        self.assertEqual(
+            self.loads('{a: 2e+}', parse_float=hook), {'a': '2e+'}
+        )
+
+    def test_hook_errors_are_reported_after_syntax_errors(self):
+        # float('.') raises a ValueError, but the syntax error later in
+        # the document is reported instead.
+        self.check_fail('[., 1 2]', '<string>:1 Unexpected "2" at column 7')
+        self.check_fail('[., 1]', "could not convert string to float: '.'")
+
+        # The same goes for hooks that raise other exceptions.
+        self.check_fail(
+            '[1e, 1 2]',
+            '<string>:1 Unexpected "2" at column 8',
+            parse_float=decimal.Decimal,
+        )
+        self.assertRaises(
+            decimal.InvalidOperation,
+            self.loads,
+            '[1e, 1]',
+            parse_float=decimal.Decimal,
+        )
+
+    def test_hooks_are_called_once_per_value(self):
+        def hook_calls(s):
+            calls = []
+
+            def object_pairs_hook(pairs):
+                calls.append(('object_pairs_hook', tuple(pairs)))
+                return dict(pairs)
+
+            def parse_float(v):
+                calls.append(('parse_float', v))
+                if v == '6.5':
+                    raise ValueError('bad float')
+                return float(v)
+
+            def parse_int(v, base=10):
+                calls.append(('parse_int', v))
+                return int(v, base)
+
+            try:
+                self.loads(
+                    s,
+                    object_pairs_hook=object_pairs_hook,
+                    parse_float=parse_float,
+                    parse_int=parse_int,
+                )
+            except ValueError:
+                pass
+            return calls
+
+        for s in (
+            '[{"a": 1.5}, {"b": 2.5}, 0x1]',
+            '[{"a": 1.5}, {"b": 2.5}, 3 4]',
+            '[{"a": 1.5}, {"b": 6.5}, 3]',
+            '[1, 2, 3,',
+        ):
+            with self.subTest(s=s):
+                calls = hook_calls(s)
+                self.assertEqual(len(calls), len(set(calls)))
+        self.assertEqual(
+            Counter(name for name, _ in hook_calls('[{"a": 1.5}, 0x1]')),
+            {'object_pairs_hook': 1, 'parse_float': 1, 'parse_int': 1},
+        )
 
     def test_parse_int(self):
         def hook(x, base=10):
             del base
             return x
 
-        self.assertEqual(json5.loads('1', parse_int=hook), '1')
+        self.assertEqual(self.loads('1', parse_int=hook), '1')
 
     def test_sample_file(self):
         path = os.path.join(os.path.dirname(__file__), '..', 'sample.json5')
         with open(path, encoding='utf-8') as fp:
-            obj = json5.load(fp)
+            obj = self.load(fp)
         self.assertEqual(
             {
                 'oh': [
@@ -304,6 +416,30 @@ class TestLoads(unittest.TestCase):
 
         self.check('1\n', 1)
 
+    def test_comments(self):
+        self.check('/* a\n * b */ 1 // c', 1)
+        self.check('[1, // a\n /**/ 2 /* b */]', [1, 2])
+        self.check('/***/1/* */', 1)
+        self.check('// only a comment\r\n1', 1)
+
+    def test_errors_after_whitespace_and_comments(self):
+        self.check_fail('1 /x', '<string>:1 Unexpected "x" at column 4')
+        self.check_fail(
+            '[1 /', '<string>:1 Unexpected end of input at column 5'
+        )
+        self.check_fail(
+            '{a: 1 /* x', '<string>:1 Unexpected end of input at column 11'
+        )
+        self.check_fail(
+            '{a /*c*/ 1}', '<string>:1 Unexpected "1" at column 10'
+        )
+        self.check_fail(
+            '[1 \u3000 x]', '<string>:1 Unexpected "x" at column 6'
+        )
+        self.check_fail(
+            '1\r\n/* a */ \t// b\n /x', '<string>:3 Unexpected "x" at column 3'
+        )
+
     def test_error_reporting(self):
         self.check_fail('[ ,]', err='<string>:1 Unexpected "," at column 3')
 
@@ -319,11 +455,209 @@ class TestLoads(unittest.TestCase):
             err='<string>:6 Unexpected "f" at column 17',
         )
 
+    def test_error_reporting_in_values(self):
+        self.check_fail('[nul]', '<string>:1 Unexpected "]" at column 5')
+        self.check_fail('[1, tx]', '<string>:1 Unexpected "x" at column 6')
+        self.check_fail(
+            '{a: Infinit}', '<string>:1 Unexpected "}" at column 12'
+        )
+        self.check_fail('[-N]', '<string>:1 Unexpected "]" at column 4')
+        self.check_fail('["a", f]', '<string>:1 Unexpected "]" at column 8')
+        self.check_fail('[@]', '<string>:1 Unexpected "@" at column 2')
+
     def test_no_extra_characters_in_value(self):
         self.check_fail('0 1', '<string>:1 Unexpected "1" at column 3')
         self.check_fail('0 a', '<string>:1 Unexpected "a" at column 3')
 
 
+class TestLoadsWithScanner(TestLoads):
+    engine = 'scanner'
+
+
+class TestLoadsWithReferenceParser(TestLoads):
+    engine = 'reference'
+
+
+class TestLoadsWithAutoEngine(TestLoads):
+    engine = 'auto'
+
+    def check_same_as_fast(self, s, **kwargs):
+        def outcome(engine):
+            try:
+                return 'ok', repr(json5.loads(s, engine=engine, **kwargs))
+            except ValueError as e:
+                return 'error', str(e)
+
+        self.assertEqual(outcome(self.engine), outcome('fast'))
+
+    def test_json_documents_skip_the_json5_parser(self):
+        with mock.patch('json5.decoder.FastParser') as m:
+            self.assertEqual(
+                self.loads('{"a": [1, 2.5, null, true, "x\\n"]}'),
+                {'a': [1, 2.5, None, True, 'x\n']},
+            )
+            self.assertEqual(self.loads('[NaN, -Infinity]')[1], float('-inf'))
+            m.assert_not_called()
+
+    def test_results_match_the_fast_engine(self):
+        def hook(name):
+            return lambda v: (name, v)
+
+        for s in (
+            '[1, -0, 1.5, 1E5, 1e-5, 1.5E+3, NaN, Infinity, -Infinity]',
+            '{"a": 1, "a": 2, "b": {"a": 3}}',
+            '"\\ud83d\\ude00 \\ud83d"',
+            '"a\u2028b"',
+            '"a\nb"',
+            '"a\x01b"',
+            '\ufeff{}',
+            '[1, 2,]',
+            '{"a": 1 "b": 2}',
+            "{a: [.5, 5., +1E3, +Infinity, -NaN], 'b': 'c\\x41'}",
+            '{a: 1, /* c */ }',
+        ):
+            for kwargs in (
+                {},
+                {'strict': False},
+                {
+                    'parse_float': hook('float'),
+                    'parse_int': hook('int'),
+                    'parse_constant': hook('constant'),
+                },
+                {'object_pairs_hook': list},
+                {'object_hook': hook('object')},
+                {'allow_duplicate_keys': False},
+            ):
+                with self.subTest(s=s, kwargs=kwargs):
+                    self.check_same_as_fast(s, **kwargs)
+
+
+class TestLoadsWithTranscoder(TestLoadsWithAutoEngine):
+    engine = 'transcode'
+
+    def test_json5_documents_skip_the_json5_parser(self):
+        with mock.patch('json5.decoder.FastParser') as m:
+            self.assertEqual(
+                self.loads("{a: [0x10, .5, 'b',], // c\n}"),
+                {'a': [16, 0.5, 'b']},
+            )
+            m.assert_not_called()
+
+
+class TestSelect(unittest.TestCase):
+    def test_select(self):
+        s = '{a: {b: [1, 2.5]}, "c.d": null, e: 0x10}'
+        self.assertEqual(
+            json5.loads(s, select=['a.b.1', '/c.d', '/e', 'a.x', '/a/b/2']),
+            {'a.b.1': 2.5, '/c.d': None, '/e': 16},
+        )
+        self.assertEqual(
+            json5.load(io.StringIO(s), select=['a']), {'a': {'b': [1, 2.5]}}
+        )
+        self.assertEqual(json5.loads('1', select=[]), {})
+
+    def test_hooks_apply_to_selected_values(self):
+        s = '{a: {b: 1}, c: [1.5]}'
+        self.assertEqual(
+            json5.loads(
+                s,
+                select=['a', 'c.0'],
+                object_pairs_hook=OrderedDict,
+                parse_float=str,
+            ),
+            {'a': OrderedDict([('b', 1)]), 'c.0': '1.5'},
+        )
+
+    def test_same_as_projecting_the_full_parse(self):
+        path = os.path.join(os.path.dirname(__file__), '..', 'sample.json5')
+        with open(path, encoding='utf-8') as fp:
+            s = fp.read()
+        full = json5.loads(s)
+        paths = ['/' + k for k in full] + ['oh.1', 'oh.3', 'nope']
+        expected = {'/' + k: v for k, v in full.items()}
+        expected['oh.1'] = full['oh'][1]
+        self.assertEqual(json5.loads(s, select=paths), expected)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(
+            ValueError, '<string>:1 Unexpected end of input at column 8'
+        ):
+            json5.loads('{a: [1}', select=['a'])
+        with self.assertRaisesRegex(
+            ValueError, 'Empty strings are not legal JSON5'
+        ):
+            json5.loads('', select=['a'])
+        with self.assertRaisesRegex(ValueError, 'Duplicate key "a"'):
+            json5.loads(
+                '{a: 1, a: 2}', select=['a'], allow_duplicate_keys=False
+            )
+        self.assertRaises(TypeError, json5.loads, '{}', select='a')
+
+
+class TestLazy(unittest.TestCase):
+    def test_lazy(self):
+        s = '{a: {b: [1, 2.5]}, "c.d": null, e: 0x10}'
+        v = json5.loads(s, lazy=True)
+        self.assertIsInstance(v, json5.lazy.LazyObject)
+        self.assertEqual(v['a']['b'][1], 2.5)
+        self.assertEqual(v, json5.loads(s))
+        self.assertEqual(json5.load(io.StringIO(s), lazy=True), v)
+        self.assertEqual(json5.loads(b'[1]', lazy=True), [1])
+        self.assertEqual(
+            json5.loads('[1.5]', lazy=True, parse_float=str), ['1.5']
+        )
+
+    def test_errors(self):
+        with self.assertRaisesRegex(
+            ValueError, 'Empty strings are not legal JSON5'
+        ):
+            json5.loads('', lazy=True)
+        with self.assertRaisesRegex(
+            ValueError, '<string>:1 Unexpected end of input at column 8'
+        ):
+            json5.loads('{a: [1}', lazy=True)
+        with self.assertRaisesRegex(ValueError, 'Duplicate key "a"'):
+            json5.loads('{a: 1, a: 2}', lazy=True, allow_duplicate_keys=False)
+        with self.assertRaises(ValueError):
+            json5.loads('{}', lazy=True, object_pairs_hook=OrderedDict)
+        with self.assertRaises(ValueError):
+            json5.loads('{}', lazy=True, select=['a'])
+
+
+class TestGetPath(unittest.TestCase):
+    def test_get_path(self):
+        s = '{servers: [{host: "a"}, {host: "b", port: 0x50}]} trailing'
+        self.assertEqual(json5.get_path(s, '/servers/1/host'), 'b')
+        self.assertEqual(json5.get_path(s.encode(), 'servers.1.port'), 80)
+        self.assertEqual(
+            json5.get_path(s, 'servers.0', object_pairs_hook=OrderedDict),
+            OrderedDict([('host', 'a')]),
+        )
+        with self.assertRaises(KeyError):
+            json5.get_path(s, '/servers/2/host')
+
+    def test_errors(self):
+        with self.assertRaisesRegex(
+            ValueError, '<string>:1 Unexpected "1" at column 4'
+        ):
+            json5.get_path('{a 1}', 'a')
+        with self.assertRaisesRegex(
+            ValueError, 'Empty strings are not legal JSON5'
+        ):
+            json5.get_path('', 'a')
+        with self.assertRaisesRegex(ValueError, 'Invalid JSON Pointer'):
+            json5.get_path('{}', '/~2')
+
+
+class TestToJson(unittest.TestCase):
+    def test_basic(self):
+        self.assertEqual(json5.to_json("{a: 'b'}"), '{ "a":  "b"}')
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, 'Unexpected "," at column 2'):
+            json5.to_json('[,]')
+
+
 class TestDump(unittest.TestCase):
     def test_basic(self):
         sio = io.StringIO()
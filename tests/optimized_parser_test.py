@@ -0,0 +1,97 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import unittest
+
+from json5.optimized_parser import OptimizedParser
+from json5.parser import Parser
+
+from .fast_parser_test import INVALID, VALID
+
+# The SHA-256 digest of the `json5.g` that the rules in
+# `optimized_parser.py` and `specialized_parser.py` were written against.
+_GRAMMAR_SHA256 = (
+    '39a5e9588e5409907f83e0bdb003db54335af56bb45f81881e43524b4749265f'
+)
+
+# The rules that `OptimizedParser` adds rather than overrides: the
+# generated parser passes these to `_not()`, `_opt()` and `_star()` as
+# lambdas.
+_HELPER_RULES = {
+    '_comment__c1__s1_p_',
+    '_comment__c1__s1_p__s0_n_',
+    '_element_list__s3_o_',
+    '_member_list__s3_o_',
+    '_ws__c8__s0_n_',
+}
+
+
+class OptimizedParserTest(unittest.TestCase):
+    maxDiff = None
+
+    def check(self, s, strict):
+        global_vars = {'_strict': strict}
+        self.assertEqual(
+            OptimizedParser(s, '<string>').parse(global_vars),
+            Parser(s, '<string>').parse(global_vars),
+        )
+
+    def test_same_as_generated_parser(self):
+        for s in VALID + INVALID:
+            for strict in (True, False):
+                with self.subTest(s=s, strict=strict):
+                    self.check(s, strict)
+
+    def test_overrides_name_generated_rules(self):
+        # The overrides are matched to the generated rules by name, so
+        # this fails if regenerating the parser renames or removes any
+        # of them.
+        names = {
+            name
+            for name, value in vars(OptimizedParser).items()
+            if callable(value) and not name.startswith('__')
+        }
+        self.assertEqual(
+            sorted(name for name in names if not hasattr(Parser, name)),
+            sorted(_HELPER_RULES),
+        )
+
+    def test_grammar_is_unchanged(self):
+        # The straight-line sequences and choices follow the structure
+        # of the generated rules they replace, which a change to the
+        # grammar can alter without renaming anything.
+        path = os.path.join(
+            os.path.dirname(__file__), '..', 'json5', 'json5.g'
+        )
+        # Read it as text, so a checkout with CRLF line endings matches.
+        with open(path, encoding='utf-8') as fp:
+            digest = hashlib.sha256(fp.read().encode('utf-8')).hexdigest()
+        self.assertEqual(
+            digest,
+            _GRAMMAR_SHA256,
+            'json5.g has changed: check that the rules in '
+            'optimized_parser.py and specialized_parser.py still match '
+            'the regenerated parser.py, then update _GRAMMAR_SHA256',
+        )
+
+    def test_sample(self):
+        path = os.path.join(os.path.dirname(__file__), '..', 'sample.json5')
+        with open(path, encoding='utf-8') as fp:
+            self.check(fp.read(), True)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,196 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+from json5.fast_parser import FastParser
+from json5.paths import (
+    MISSING,
+    Selector,
+    child,
+    make_pointer,
+    parse_path,
+)
+
+
+DOC = """{
+    servers: [
+        {host: 'a.example.com', ports: [80, 443]},
+        {host: 'b.example.com', ports: []},
+    ],
+    'a.b': {'c/d': 1, 'e~f': 2},
+    version: 3,
+}"""
+
+
+class PathsTest(unittest.TestCase):
+    def test_parse_path(self):
+        self.assertEqual(parse_path(''), ())
+        self.assertEqual(parse_path('/'), ('',))
+        self.assertEqual(
+            parse_path('/servers/0/host'), ('servers', '0', 'host')
+        )
+        self.assertEqual(
+            parse_path('servers.0.host'), ('servers', '0', 'host')
+        )
+        self.assertEqual(parse_path('/a.b/c~1d/e~0f'), ('a.b', 'c/d', 'e~f'))
+        self.assertRaises(ValueError, parse_path, '/a~2')
+        self.assertRaises(TypeError, parse_path, ['a'])
+
+    def test_make_pointer(self):
+        self.assertEqual(make_pointer(()), '')
+        self.assertEqual(make_pointer(('a/b', '~', '0')), '/a~1b/~0/0')
+        for path in ('', '/', '/a~1b/~0/0', '/a//b'):
+            with self.subTest(path=path):
+                self.assertEqual(make_pointer(parse_path(path)), path)
+
+    def test_child(self):
+        self.assertEqual(child({'a': 1}, 'a'), 1)
+        self.assertEqual(child([1, 2], '1'), 2)
+        for obj, token in (({}, 'a'), ([1, 2], '01'), ([1], '1'), (1, '0')):
+            with self.subTest(obj=obj, token=token):
+                self.assertRaises(LookupError, child, obj, token)
+
+    def select(self, paths, s=DOC, **kwargs):
+        v, err, _ = Selector(s, '<string>', **kwargs).select(paths)
+        self.assertIsNone(err)
+        return v
+
+    def test_select(self):
+        self.assertEqual(
+            self.select(
+                [
+                    '/servers/1/host',
+                    'servers.0.ports',
+                    'servers.0.ports.1',
+                    '/a.b/c~1d',
+                    '/a.b/e~0f',
+                    'version',
+                ]
+            ),
+            {
+                '/servers/1/host': 'b.example.com',
+                'servers.0.ports': [80, 443],
+                'servers.0.ports.1': 443,
+                '/a.b/c~1d': 1,
+                '/a.b/e~0f': 2,
+                'version': 3,
+            },
+        )
+        self.assertEqual(
+            self.select(['', '/servers/2', 'servers.00', 'version.x']),
+            {'': FastParser(DOC, '<string>').parse()[0]},
+        )
+
+    def test_unicode_whitespace(self):
+        s = '{a: true\ufeff, b: [1\u3000, 2\ufeff]}'
+        self.assertEqual(self.select(['b'], s), {'b': [1, 2]})
+        self.assertEqual(self.select(['b.1'], s), {'b.1': 2})
+
+    def test_only_selected_values_are_parsed(self):
+        # Scalars are counted as they are parsed.
+        # pylint: disable=protected-access
+        with mock.patch.object(
+            Selector, '_scalar', autospec=True, side_effect=FastParser._scalar
+        ) as m:
+            self.assertEqual(self.select(['version']), {'version': 3})
+            m.assert_called_once()
+
+    def test_last_duplicate_key_wins(self):
+        s = '{a: {b: 1}, a: {c: 2}}'
+        self.assertEqual(self.select(['a.b', 'a.c'], s), {'a.c': 2})
+        parser = Selector(s, '<string>', reject_duplicates=True)
+        with self.assertRaisesRegex(ValueError, 'Duplicate key "a"'):
+            parser.select(['a.c'])
+
+    def test_errors(self):
+        _, err, _ = Selector('{a: [1 2]}', '<string>').select(['a.0'])
+        self.assertEqual(err, '<string>:1 Unexpected "2" at column 8')
+
+        # Skipped values are not checked.
+        self.assertEqual(self.select(['b'], '{a: [1 2], b: 3}'), {'b': 3})
+
+    def get(self, path, s=DOC, **kwargs):
+        v, err, _ = Selector(s, '<string>', **kwargs).get(path)
+        self.assertIsNone(err)
+        return v
+
+    def test_get(self):
+        self.assertEqual(self.get('/servers/1/host'), 'b.example.com')
+        self.assertEqual(self.get('servers.0.ports'), [80, 443])
+        self.assertEqual(self.get('/a.b/c~1d'), 1)
+        self.assertEqual(self.get(''), FastParser(DOC, '<string>').parse()[0])
+        for path in ('/servers/2', 'servers.00', 'version.x', 'x', '/a.b/'):
+            with self.subTest(path=path):
+                self.assertIs(self.get(path), MISSING)
+
+    def test_get_stops_at_the_value(self):
+        # Nothing after the value is looked at, and the first of several
+        # members with the same key is used.
+        self.assertEqual(self.get('a.b', '{a: {b: 1, b: 2} x'), 1)
+        self.assertEqual(self.get('1', '[[1 2], 3, ]]]'), 3)
+
+        parser = Selector(DOC, '<string>')
+        parser.get('servers.0.host')
+        self.assertEqual(DOC[parser.pos :].lstrip()[:6], ', port')
+
+    def test_get_errors(self):
+        for s, err in (
+            ('{a 1}', '<string>:1 Unexpected "1" at column 4'),
+            ('[1 2]', '<string>:1 Unexpected "2" at column 4'),
+            ('[1, "2]', '<string>:1 Unexpected end of input at column 8'),
+        ):
+            with self.subTest(s=s):
+                _, actual, _ = Selector(s, '<string>').get('/1')
+                self.assertEqual(actual, err)
+
+    def test_index(self):
+        s = '{a: [1, {b: 2}], "x/y": 3, a: [4]}'
+        entries, err, _ = Selector(s, '<string>').index(2)
+        self.assertIsNone(err)
+        self.assertEqual(
+            {p: s[start:end] for p, (start, end) in entries.items()},
+            # The last of the two members with the key 'a' wins.
+            {'': s, '/a': '[4]', '/a/0': '4', '/x~1y': '3'},
+        )
+        entries, _, _ = Selector(s, '<string>').index(0)
+        self.assertEqual(entries, {'': (0, len(s))})
+
+        # Only the values above the given depth are checked.
+        entries, err, _ = Selector('[[1 2], 3]', '<string>').index(1)
+        self.assertIsNone(err)
+        _, err, _ = Selector('[[1 2], 3]', '<string>').index(2)
+        self.assertEqual(err, '<string>:1 Unexpected "2" at column 5')
+
+    def test_max_depth(self):
+        s = '{a: {b: [1]}}'
+        self.assertEqual(self.select(['a.b.0'], s, max_depth=3), {'a.b.0': 1})
+        _, err, _ = Selector(s, '<string>', max_depth=2).select(['a.b'])
+        self.assertEqual(
+            err, '<string>:1 Maximum nesting depth of 2 exceeded at column 9'
+        )
+        _, err, _ = Selector(s, '<string>', max_depth=1).select(['a.b.0'])
+        self.assertEqual(
+            err, '<string>:1 Maximum nesting depth of 1 exceeded at column 5'
+        )
+        self.assertEqual(self.get('a.b.0', s, max_depth=3), 1)
+        _, err, _ = Selector(s, '<string>', max_depth=2).get('a.b')
+        self.assertEqual(
+            err, '<string>:1 Maximum nesting depth of 2 exceeded at column 9'
+        )
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,115 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+import json5
+from json5.scanner import (
+    ScanError,
+    make_scanner,
+    scanstring,
+    skip_value,
+    skip_whitespace,
+)
+
+from tests.fast_parser_test import INVALID, VALID
+
+
+def _outcome(s, **kwargs):
+    try:
+        return 'ok', repr(json5.loads(s, **kwargs))
+    except ValueError as e:
+        return 'error', str(e)
+
+
+class ScannerTest(unittest.TestCase):
+    maxDiff = None
+
+    def check(self, s, strict=True):
+        self.assertEqual(
+            _outcome(s, engine='reference', strict=strict),
+            _outcome(s, engine='scanner', strict=strict),
+        )
+
+    def test_valid(self):
+        for s in VALID:
+            with self.subTest(s=s):
+                self.check(s)
+                # Documents that one of the default hooks rejects, such
+                # as '.', are checked for syntax errors first.
+                if _outcome(s, engine='scanner')[0] == 'ok':
+                    with mock.patch('json5.decoder.reference_parser') as m:
+                        _outcome(s, engine='scanner')
+                        m.assert_not_called()
+
+    def test_invalid(self):
+        for s in INVALID:
+            with self.subTest(s=s):
+                self.check(s)
+
+    def test_strict(self):
+        for s in ('"a\nb"', "'a\r\nb'", '"a\u2028b"'):
+            with self.subTest(s=s):
+                self.check(s, strict=True)
+                self.check(s, strict=False)
+
+    def test_scan_once(self):
+        scan_once = make_scanner(
+            dictify=dict,
+            parse_float=float,
+            parse_int=int,
+            parse_constant=float,
+            strict=True,
+        )
+        s = 'foo [1, {a: "b"}] bar'
+        self.assertEqual(scan_once(s, 4), ([1, {'a': 'b'}], 17))
+        self.assertRaises(ScanError, scan_once, s, 0)
+
+    def test_scanstring(self):
+        self.assertEqual(scanstring('"abc" x', 1, '"'), ('abc', 5))
+        self.assertEqual(scanstring("'a\\tb\\'c' x", 1, "'"), ("a\tb'c", 9))
+        self.assertEqual(
+            scanstring('"a\nb"', 1, '"', strict=False), ('a\nb', 5)
+        )
+        self.assertRaises(ScanError, scanstring, '"a\nb"', 1, '"')
+        self.assertRaises(ScanError, scanstring, '"abc', 1, '"')
+
+    def test_skip_whitespace(self):
+        s = ' \t// comment\n/* comment */\u3000x'
+        self.assertEqual(skip_whitespace(s, 0), len(s) - 1)
+        self.assertEqual(skip_whitespace('/* x', 0), 0)
+        self.assertEqual(skip_whitespace('/* x */ /* y', 0), 8)
+        self.assertEqual(skip_whitespace(' / x', 0), 1)
+        self.assertEqual(skip_whitespace('x ', 0), 0)
+        self.assertEqual(skip_whitespace('1 ', 1), 2)
+
+    def test_skip_value(self):
+        for s in VALID:
+            with self.subTest(s=s):
+                start = skip_whitespace(s, 0)
+                end = skip_value(s, start)
+                self.assertEqual(skip_whitespace(s, end), len(s))
+
+        s = '{a: [1, "]\\"}", /* ] */ \'}\'], // }\n b: {}} tail'
+        self.assertEqual(s[skip_value(s, 0) :], ' tail')
+        self.assertEqual(skip_value('123, 4', 0), 3)
+        self.assertEqual(skip_value('"a\\"b" x', 0), 6)
+        for s in ('', ',', '"abc', '[1, "]', '[1 /* ]', '{a: /x}', '[[]'):
+            with self.subTest(s=s):
+                self.assertRaises(ScanError, skip_value, s, 0)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
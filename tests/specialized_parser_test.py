@@ -0,0 +1,166 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import inspect
+import unittest
+from unittest import mock
+
+from json5.parser import Parser
+from json5.specialized_parser import (
+    LeanNonStrictParser,
+    LeanStrictParser,
+    NonStrictParser,
+    StrictParser,
+    reference_parser,
+)
+
+from .fast_parser_test import INVALID, VALID
+
+
+class SpecializedParserTest(unittest.TestCase):
+    maxDiff = None
+
+    def check(self, s, strict):
+        parser = Parser(s, '<string>')
+        expected = parser.parse({'_strict': strict})
+        for lean in (False, True):
+            for memoize in (False, True):
+                specialized = reference_parser(
+                    s, '<string>', strict, lean, memoize
+                )
+                self.assertEqual(specialized.parse(), expected)
+                if expected[1] is not None:
+                    self.assertEqual(specialized.errpos, parser.errpos)
+
+    def test_matches_the_generic_parser(self):
+        for s in (
+            VALID
+            + INVALID
+            + [
+                '"a\nb"',
+                "'a\r\nb'",
+                '"a\x01\nb',
+                '[\'a\n\', "b\r"]',
+                '[1.5e3, 12.e, 1e+]',
+                '{a: 0.e5x}',
+                '123.456e-7q',
+                '[.e1]',
+            ]
+        ):
+            for strict in (True, False):
+                with self.subTest(s=s, strict=strict):
+                    self.check(s, strict)
+
+    def test_classes(self):
+        self.assertIsInstance(reference_parser('1', '', True), StrictParser)
+        self.assertIsInstance(
+            reference_parser('1', '', False), NonStrictParser
+        )
+        self.assertIsInstance(
+            reference_parser('1', '', True, lean=True), LeanStrictParser
+        )
+        self.assertIsInstance(
+            reference_parser('1', '', False, lean=True), LeanNonStrictParser
+        )
+
+    def test_lean_parsers_only_reparse_invalid_documents(self):
+        with mock.patch.object(LeanStrictParser, '_diagnostic_cls') as m:
+            m.return_value.error_message.return_value = 'error'
+            m.return_value.errpos = 3
+            parser = reference_parser('[1, 2]', '<string>', True, lean=True)
+            self.assertEqual(
+                parser.parse(),
+                (['array', [['number', '1'], ['number', '2']]], None, 6),
+            )
+            m.assert_not_called()
+
+            parser = reference_parser('[1, 2', '<string>', True, lean=True)
+            self.assertEqual(parser.parse(), (None, 'error', 3))
+            m.assert_called_once_with('[1, 2', '<string>')
+
+    def test_strict_alternatives_are_the_generated_ones(self):
+        # `StrictParser` and `NonStrictParser` replace the last
+        # alternative of `sqchar` and `dqchar` by name, so this fails if
+        # regenerating the parser moves `~?(_strict) '\x00'..'\x1f'`.
+        for rule in ('sqchar', 'dqchar'):
+            with self.subTest(rule=rule):
+                alt = getattr(Parser, f'_{rule}__c3_')
+                self.assertFalse(hasattr(Parser, f'_{rule}__c4_'))
+                self.assertIn(
+                    f'self._not(self._{rule}__c3__s0_n_)',
+                    inspect.getsource(alt),
+                )
+                self.assertIn(
+                    "self._range('\\x00', '\\x1f')", inspect.getsource(alt)
+                )
+                self.assertIn(
+                    "self._get('_strict')",
+                    inspect.getsource(getattr(Parser, f'_{rule}__c3__s0_n_')),
+                )
+
+    def test_memoizing_parsers_scan_numbers_once(self):
+        # Digits are counted as the grammar rule matches them.
+        # pylint: disable=protected-access
+        def count_digits(memoize):
+            with mock.patch.object(
+                Parser, '_digit_', autospec=True, side_effect=Parser._digit_
+            ) as m:
+                parser = reference_parser(
+                    '123456789', '<string>', True, memoize=memoize
+                )
+                self.assertEqual(
+                    parser.parse(), (['number', '123456789'], None, 9)
+                )
+                return m.call_count
+
+        # `dec_int_lit` is matched by four of the `dec_literal`
+        # alternatives, and scans eight digits and fails on a ninth.
+        self.assertEqual(count_digits(False), 36)
+        self.assertEqual(count_digits(True), 9)
+
+    def test_memo_cache_is_bounded(self):
+        # The cache isn't visible otherwise.
+        # pylint: disable=protected-access
+        s = '[' + ', '.join(f'{i}.5e{i}' for i in range(1000)) + ']'
+        parser = reference_parser(s, '<string>', True, memoize=True)
+        self.assertIsNone(parser.parse()[1])
+        self.assertEqual(len(parser._cache), 3)
+        for cache in parser._cache.values():
+            self.assertLessEqual(len(cache), 1)
+
+    def test_parse_value(self):
+        for lean in (False, True):
+            with self.subTest(lean=lean):
+                parser = reference_parser('x [1] y', '<string>', True, lean)
+                self.assertEqual(
+                    parser.parse_value(2),
+                    (['array', [['number', '1']]], None, 5),
+                )
+                parser = reference_parser('x [1 y', '<string>', True, lean)
+                self.assertEqual(
+                    parser.parse_value(2),
+                    (None, '<string>:1 Unexpected "y" at column 6', 5),
+                )
+
+    def test_global_vars_are_ignored(self):
+        parser = StrictParser('"a\nb"', '<string>')
+        self.assertIsNotNone(parser.parse({'_strict': False})[1])
+        parser = NonStrictParser('"a\nb"', '<string>')
+        self.assertEqual(
+            parser.parse({'_strict': True}), (['string', 'a\nb'], None, 5)
+        )
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,288 @@
+# Copyright 2015 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import io
+import itertools
+import unittest
+from unittest import mock
+
+import json5
+
+
+class TestIterLoad(unittest.TestCase):
+    stream = (
+        '{a: 1}\n'
+        '// a comment\n'
+        '[1,\n 2,] /* another\n comment */ "x"{}[]\n'
+        '1.5e-3 0x10 true\n'
+    )
+    values = [{'a': 1}, [1, 2], 'x', {}, [], 0.0015, 16, True]
+
+    def test_iter_loads(self):
+        self.assertEqual(list(json5.iter_loads(self.stream)), self.values)
+        self.assertEqual(
+            list(
+                json5.iter_loads(
+                    self.stream.encode('utf-16'), encoding='utf-16'
+                )
+            ),
+            self.values,
+        )
+        self.assertEqual(list(json5.iter_loads('')), [])
+        self.assertEqual(list(json5.iter_loads(' // nothing\n')), [])
+
+    def test_iter_load_reads_in_chunks(self):
+        for chunk_size in (1, 2, 7, 1000):
+            for engine in ('auto', 'fast', 'scanner', 'reference'):
+                with self.subTest(chunk_size=chunk_size, engine=engine):
+                    self.assertEqual(
+                        list(
+                            json5.iter_load(
+                                io.StringIO(self.stream),
+                                chunk_size=chunk_size,
+                                engine=engine,
+                            )
+                        ),
+                        self.values,
+                    )
+                    # Chunks of bytes may end in the middle of a character.
+                    self.assertEqual(
+                        list(
+                            json5.iter_load(
+                                io.BytesIO('"\xe9\u20ac" 1'.encode()),
+                                chunk_size=chunk_size,
+                                engine=engine,
+                            )
+                        ),
+                        ['\xe9\u20ac', 1],
+                    )
+
+    def test_iter_load_only_reads_what_it_needs(self):
+        fp = io.StringIO('[1] ' * 1000)
+        fp.read = mock.Mock(wraps=fp.read)
+        it = json5.iter_load(fp, chunk_size=10)
+        self.assertEqual(next(it), [1])
+        fp.read.assert_called_once_with(10)
+        self.assertEqual(len(list(it)), 999)
+        self.assertEqual({c.args for c in fp.read.call_args_list}, {(10,)})
+
+    def test_errors_report_lines_in_the_stream(self):
+        s = '1\n2\n{a: 1,\n b: }\n'
+        for chunk_size in (1, 3, 100):
+            with self.subTest(chunk_size=chunk_size):
+                it = json5.iter_load(io.StringIO(s), chunk_size=chunk_size)
+                self.assertEqual(next(it), 1)
+                self.assertEqual(next(it), 2)
+                with self.assertRaisesRegex(
+                    ValueError, '<string>:4 Unexpected "}" at column 5'
+                ):
+                    next(it)
+
+        with self.assertRaisesRegex(
+            ValueError, '<string>:2 Unexpected end of input at column 7'
+        ):
+            list(json5.iter_loads('1\n2 /* x'))
+        with self.assertRaisesRegex(
+            ValueError, '<string>:1 Unexpected "a" at column 2'
+        ):
+            list(json5.iter_loads('1a'))
+        for chunk_size in (1, 4, 100):
+            with self.subTest(chunk_size=chunk_size):
+                it = json5.iter_load(
+                    io.StringIO('1 2\n3 [4, }'), chunk_size=chunk_size
+                )
+                self.assertEqual(list(itertools.islice(it, 3)), [1, 2, 3])
+                with self.assertRaisesRegex(
+                    ValueError, '<string>:2 Unexpected "}" at column 7'
+                ):
+                    next(it)
+
+    def test_long_lines_are_not_kept_in_memory(self):
+        s = '{a: [1, "x"]} ' * 10000
+        with mock.patch(
+            'json5.streaming.skip_value', wraps=json5.streaming.skip_value
+        ) as m:
+            values = list(json5.iter_load(io.StringIO(s), chunk_size=100))
+        self.assertEqual(values, [{'a': [1, 'x']}] * 10000)
+        self.assertLessEqual(
+            max(len(c.args[0]) for c in m.call_args_list), 200
+        )
+
+    def test_hook_errors(self):
+        def parse_int(s):
+            if s == '13':
+                raise ValueError('unlucky')
+            return int(s)
+
+        it = json5.iter_load(
+            io.StringIO('12 13 14'), chunk_size=1, parse_int=parse_int
+        )
+        self.assertEqual(next(it), 12)
+        with self.assertRaisesRegex(ValueError, 'unlucky'):
+            next(it)
+
+
+class TestFeedParser(unittest.TestCase):
+    def feed(self, s, n, **kwargs):
+        parser = json5.FeedParser(**kwargs)
+        for i in range(0, len(s), n):
+            parser.feed(s[i : i + n])
+        return parser.close()
+
+    def test_feed(self):
+        s = '{a: [1, 2.5, "three"], /* comment */ b: {c: null},}'
+        for n in (1, 2, 7, 1000):
+            with self.subTest(n=n):
+                self.assertEqual(self.feed(s, n), json5.loads(s))
+                # Pieces of bytes may end in the middle of a character.
+                self.assertEqual(
+                    self.feed('"\xe9\u20ac"'.encode(), n), '\xe9\u20ac'
+                )
+        self.assertEqual(
+            self.feed('[1]'.encode('utf-16'), 1, encoding='utf-16'), [1]
+        )
+
+    def test_hooks_and_options(self):
+        s = '{a: 1, a: 2, b: Infinity}'
+        self.assertEqual(
+            self.feed(s, 1, object_pairs_hook=list),
+            [('a', 1), ('a', 2), ('b', float('inf'))],
+        )
+        self.assertEqual(
+            self.feed(s, 1, parse_int=str, parse_constant=str),
+            {'a': '2', 'b': 'Infinity'},
+        )
+        with self.assertRaisesRegex(ValueError, 'Duplicate key "a"'):
+            self.feed(s, 1, allow_duplicate_keys=False)
+        with self.assertRaises(ValueError):
+            self.feed('"a\nb"', 1)
+        self.assertEqual(self.feed('"a\nb"', 1, strict=False), 'a\nb')
+        with self.assertRaisesRegex(ValueError, 'Maximum nesting depth'):
+            self.feed('[[1]]', 1, max_depth=1)
+
+    def test_errors(self):
+        parser = json5.FeedParser()
+        parser.feed('[1,\n 2,\n')
+        with self.assertRaisesRegex(
+            ValueError, '<string>:3 Unexpected "}" at column 2'
+        ):
+            parser.feed(' }')
+
+        with self.assertRaisesRegex(
+            ValueError, 'Empty strings are not legal JSON5'
+        ):
+            json5.FeedParser().close()
+        with self.assertRaisesRegex(
+            ValueError, '<string>:1 Unexpected end of input at column 5'
+        ):
+            self.feed('[1, ', 1)
+
+    def test_hook_errors(self):
+        def parse_int(s):
+            if s == '13':
+                raise ValueError('unlucky')
+            return int(s)
+
+        parser = json5.FeedParser(parse_int=parse_int)
+        # As with `loads()`, syntax errors are reported in preference to
+        # errors from the hooks, so these are only raised by `close()`.
+        parser.feed('[12, 13, 14')
+        parser.feed(']')
+        with self.assertRaisesRegex(ValueError, 'unlucky'):
+            parser.close()
+
+        parser = json5.FeedParser(parse_int=parse_int)
+        parser.feed('[12, 13, 14')
+        parser.feed('}')
+        with self.assertRaisesRegex(
+            ValueError, '<string>:1 Unexpected end of input at column 13'
+        ):
+            parser.close()
+
+
+class TestIterParse(unittest.TestCase):
+    def test_iterparse(self):
+        s = '{a: [1.5, "\xe9\u20ac"], b: {}}'
+        expected = [
+            ((), 'start_object', None),
+            ((), 'key', 'a'),
+            (('a',), 'start_array', None),
+            (('a', 0), 'number', 1.5),
+            (('a', 1), 'string', '\xe9\u20ac'),
+            (('a',), 'end_array', None),
+            ((), 'key', 'b'),
+            (('b',), 'start_object', None),
+            (('b',), 'end_object', None),
+            ((), 'end_object', None),
+        ]
+        for chunk_size in (1, 2, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    list(
+                        json5.iterparse(io.StringIO(s), chunk_size=chunk_size)
+                    ),
+                    expected,
+                )
+                # Chunks of bytes may end in the middle of a character.
+                self.assertEqual(
+                    list(
+                        json5.iterparse(
+                            io.BytesIO(s.encode()), chunk_size=chunk_size
+                        )
+                    ),
+                    expected,
+                )
+
+    def test_hooks(self):
+        self.assertEqual(
+            list(
+                json5.iterparse(
+                    io.StringIO('[1, 1.5, NaN]'),
+                    parse_int=str,
+                    parse_float=str,
+                    parse_constant=str,
+                )
+            )[1:-1],
+            [
+                ((0,), 'number', '1'),
+                ((1,), 'number', '1.5'),
+                ((2,), 'number', 'NaN'),
+            ],
+        )
+
+    def test_errors(self):
+        it = json5.iterparse(io.StringIO('[1,\n 2,\n }'), chunk_size=1)
+        self.assertEqual(next(it), ((), 'start_array', None))
+        self.assertEqual(next(it), ((0,), 'number', 1))
+        self.assertEqual(next(it), ((1,), 'number', 2))
+        with self.assertRaisesRegex(
+            ValueError, '<string>:3 Unexpected "}" at column 2'
+        ):
+            next(it)
+
+        with self.assertRaisesRegex(
+            ValueError, 'Empty strings are not legal JSON5'
+        ):
+            list(json5.iterparse(io.StringIO('')))
+        with self.assertRaisesRegex(
+            ValueError, '<string>:1 Unexpected end of input at column 3'
+        ):
+            list(json5.iterparse(io.StringIO('[1')))
+        with self.assertRaisesRegex(ValueError, 'Maximum nesting depth'):
+            list(json5.iterparse(io.StringIO('[[1]]'), max_depth=1))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
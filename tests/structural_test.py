@@ -0,0 +1,86 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from json5 import structural
+from json5.paths import Selector
+from json5.scanner import ScanError, skip_value
+from json5.structural import StructuralIndex, find_structural
+
+
+class StructuralTest(unittest.TestCase):
+    use_numpy = False
+
+    def find(self, s):
+        positions, limit = find_structural(s, use_numpy=self.use_numpy)
+        return ''.join(s[p] for p in positions.tolist()), limit
+
+    def test_find_structural(self):
+        self.assertEqual(self.find('{a: [1, 2]}'), ('{:[,]}', 11))
+        self.assertEqual(self.find('{"a:": "[\\"]"}'), ('{:}', 14))
+        self.assertEqual(self.find('["\'[", \'"]\']'), ('[,]', 12))
+        self.assertEqual(self.find('[1 // ],\n, 2 /* ] */]'), ('[,]', 21))
+        self.assertEqual(self.find('{"\\\\": 1}'), ('{:}', 9))
+        self.assertEqual(self.find('"é[", [é]'), (',[]', 9))
+        self.assertEqual(self.find(''), ('', 0))
+
+    def test_limit(self):
+        self.assertEqual(self.find('[1, "a]'), ('[,', 4))
+        self.assertEqual(self.find("[1, 'a]"), ('[,', 4))
+        self.assertEqual(self.find('[1, /* ]'), ('[,', 4))
+        self.assertEqual(self.find('[1/2]'), ('[', 2))
+
+    def test_skip_value(self):
+        s = '{a: [1, {b: "]"}], c: \'}\' /* } */, d: 1e5, e: {}} x'
+        index = StructuralIndex(s, use_numpy=self.use_numpy)
+        for start, ch in enumerate(s):
+            if ch in '[{"\'1' and s[start - 1] in ' [':
+                with self.subTest(start=start):
+                    end = skip_value(s, start)
+                    self.assertEqual(index.skip_value(start), end)
+        self.assertEqual(s[index.skip_value(0) :], ' x')
+
+    def test_skip_value_unicode_whitespace(self):
+        s = '[true\ufeff, 1\u3000, 2\u2028]'
+        index = StructuralIndex(s, use_numpy=self.use_numpy)
+        self.assertEqual(index.skip_value(1), 5)
+        self.assertEqual(index.skip_value(8), 9)
+        self.assertEqual(index.skip_value(12), 13)
+
+    def test_skip_value_errors(self):
+        index = StructuralIndex('[[1, "a] x', use_numpy=self.use_numpy)
+        self.assertRaises(ScanError, index.skip_value, 0)
+        self.assertRaises(ScanError, index.skip_value, 1)
+        self.assertRaises(ScanError, index.skip_value, 5)
+        self.assertRaises(ScanError, index.skip_value, 8)
+
+    def test_selector(self):
+        s = '{a: {b: [1, 2.5]}, "c.d": null, e: [0x10, {}]}'
+        index = StructuralIndex(s, use_numpy=self.use_numpy)
+        for paths in (['a.b.1', '/c.d'], ['e.1', 'a']):
+            with self.subTest(paths=paths):
+                self.assertEqual(
+                    Selector(s, '<string>', structure=index).select(paths),
+                    Selector(s, '<string>').select(paths),
+                )
+
+
+@unittest.skipIf(structural.numpy is None, 'NumPy is not installed')
+class NumPyStructuralTest(StructuralTest):
+    use_numpy = True
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
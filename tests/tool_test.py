@@ -129,6 +129,14 @@ class ToolTest(UnitTestMixin, CheckMixin, unittest.TestCase):
         }
         self.check_cmd(['foo.json5'], files=files, returncode=0, out='"foo"\n')
 
+    def test_no_strict(self):
+        self.check_cmd(
+            ['--no-strict', '-c', '"a\nb"'], returncode=0, out='"a\\nb"\n'
+        )
+        self.assertRaises(
+            ValueError, self.check_cmd, ['--strict', '-c', '"a\nb"']
+        )
+
     def test_trailing_commas(self):
         self.check_cmd(
             ['--trailing-commas', '-c', '{foo: 1}'],
@@ -0,0 +1,116 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import unittest
+
+import json5
+from json5.scanner import ScanError
+from json5.transcoder import transcode
+
+from .fast_parser_test import INVALID, VALID
+
+
+def _outcome(fn, *args, **kwargs):
+    try:
+        return 'ok', repr(fn(*args, **kwargs))
+    except ValueError as e:
+        return 'error', str(e)
+
+
+def _round_trip(s):
+    return json.loads(json5.to_json(s))
+
+
+class TranscoderTest(unittest.TestCase):
+    maxDiff = None
+
+    def check(self, s, expected):
+        self.assertEqual(transcode(s), expected)
+
+    def test_json_is_copied(self):
+        s = '{"a": [1, -2.5e+3, true, false, null, "\\u00e9\\n"]}\n'
+        self.check(s, s)
+        self.check('[NaN, Infinity, -Infinity]', '[NaN, Infinity, -Infinity]')
+
+    def test_json5_tokens_are_rewritten(self):
+        self.check('{a: 1}', '{ "a": 1}')
+        self.check('{\\u0061b: 1, null: 2}', '{ "ab": 1,  "null": 2}')
+        self.check("'a\"b'", ' "a\\"b"')
+        self.check(r'"\x41\v\0"', ' "A\\u000b\\u0000"')
+        self.check('"a\\\nb"', ' "ab"')
+        self.check(
+            '[0x1F, -0x10, .5, 5., +1, +Infinity]',
+            '[ 31,  -16,  0.5,  5.0,  1,  Infinity]',
+        )
+        self.check('[1, // c\n 2 /* c */]', '[1,  2  ]')
+        self.check('[1,]', '[1 ]')
+        self.check('{a: 1, /* c */ }', '{ "a": 1   }')
+
+    def test_tokens_are_not_merged(self):
+        # None of these are valid JSON5, and none of them should become
+        # valid JSON.
+        for s in ('1/**/2', '1+1', '[1.5.5]', '[,]', '{a:,}', '[a]'):
+            with self.subTest(s=s):
+                try:
+                    json.loads(transcode(s))
+                    self.fail()  # pragma: no cover
+                except ValueError:
+                    pass
+
+    def test_surrogate_escapes_are_not_combined(self):
+        s = '"\\ud83d\\ude00"'
+        self.assertEqual(json.loads(transcode(s)), '\ud83d\ude00')
+
+    def test_untranscodable_numbers(self):
+        for s in ('1e', '.', '--1', '-NaN'):
+            with self.subTest(s=s):
+                self.assertRaises(ScanError, transcode, s)
+        for s in ('0x10', '.5', '5.'):
+            with self.subTest(s=s):
+                self.assertRaises(
+                    ScanError, transcode, s, rewrite_numbers=False
+                )
+        self.assertEqual(transcode('+1.5E3', rewrite_numbers=False), ' 1.5e3')
+
+    def test_to_json(self):
+        for s in VALID + INVALID:
+            with self.subTest(s=s):
+                self.assertEqual(
+                    _outcome(_round_trip, s),
+                    _outcome(json5.loads, s, engine='fast'),
+                )
+
+    def test_to_json_strict(self):
+        self.assertRaises(ValueError, json5.to_json, '"a\nb"')
+        self.assertEqual(json5.to_json('"a\nb"', strict=False), ' "a\\nb"')
+
+    def test_to_json_falls_back_to_the_parser(self):
+        self.assertEqual(json5.to_json('[1, -NaN]'), '[1, NaN]')
+        self.assertEqual(json5.to_json('{a: -NaN}'), '{"a": NaN}')
+
+    def test_sample_files(self):
+        root = os.path.join(os.path.dirname(__file__), '..')
+        for path in ('sample.json5', 'benchmarks/64KB-min.json'):
+            with open(os.path.join(root, path), encoding='utf-8') as fp:
+                s = fp.read()
+            with self.subTest(path=path):
+                self.assertEqual(
+                    json.loads(transcode(s)), json5.loads(s, engine='fast')
+                )
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,54 @@
+# Copyright 2026 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unicodedata
+import unittest
+
+from json5 import unicat
+
+
+class UnicatTest(unittest.TestCase):
+    def test_every_code_point_matches_unicodedata(self):
+        mismatches = [
+            (hex(o), unicat.category(chr(o)), unicodedata.category(chr(o)))
+            for o in range(0x110000)
+            if unicat.category(chr(o)) != unicodedata.category(chr(o))
+        ]
+        self.assertEqual(mismatches, [])
+
+    def test_predicates(self):
+        for ch, cat in (
+            ('a', 'Ll'),
+            ('\u02b0', 'Lm'),
+            ('\u2160', 'Nl'),
+            ('\U00010400', 'Lu'),
+            ('\u0660', 'Nd'),
+            ('_', 'Pc'),
+            ('\u3000', 'Zs'),
+            ('\U0001f600', 'So'),
+        ):
+            with self.subTest(ch=ch):
+                self.assertEqual(unicat.category(ch), cat)
+                self.assertEqual(
+                    unicat.is_id_start(ch), cat in unicat.ID_START_CATS
+                )
+                self.assertEqual(
+                    unicat.is_id_continue(ch),
+                    cat in unicat.ID_CONTINUE_CATS,
+                )
+                self.assertEqual(unicat.is_space(ch), cat == 'Zs')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()